@@ -6,6 +6,7 @@ import json
 from pybose.BoseAuth import BoseAuth
 from pybose.BoseResponse import Accessories, NetworkStateEnum
 from pybose.BoseSpeaker import BoseSpeaker
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import (
@@ -18,16 +19,36 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationErr
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from . import config_flow
-from .const import _LOGGER, DOMAIN, TOKEN_REFRESH_DELAY, TOKEN_RETRY_DELAY
+from .auth import async_get_account_auth, async_remove_account_tokens
+from .const import (
+    _LOGGER,
+    CONF_RECEIVER_WATCHDOG,
+    CONF_RECEIVER_WATCHDOG_THRESHOLD,
+    CONF_RECORD_JOURNAL,
+    DEFAULT_RECEIVER_WATCHDOG_THRESHOLD,
+    DOMAIN,
+)
 from .coordinator import BoseCoordinator
+from .handoff import async_pop_handoff
+from .profiler import HotPathProfiler
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device_id"): vol.Any(cv.string, [cv.string]),
+        vol.Optional("duration", default=30): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=600)
+        ),
+        vol.Optional("slowest", default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up Bose integration from a config entry."""
-    auth = BoseAuth()
-
     hass.data.setdefault(DOMAIN, {})
 
     # Store device data in a separate dict (instead of modifying config_entry.data)
@@ -35,22 +56,21 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         "config": config_entry.data  # Store configuration data
     }
 
-    if (
-        config_entry.data.get("access_token") is not None
-        and config_entry.data.get("refresh_token") is not None
-        and config_entry.data.get("bose_person_id") is not None
-        and config_entry.data.get("azure_refresh_token") is not None
-    ):
-        # Using existing access token
-        _LOGGER.debug("Using existing access token for %s", config_entry.data["mail"])
-        auth.set_access_token(
-            config_entry.data["access_token"],
-            config_entry.data["refresh_token"],
-            config_entry.data["bose_person_id"],
+    if config_entry.data.get("bose_person_id") is None:
+        # Missing account - trigger reauthentication
+        _LOGGER.warning(
+            "Missing Bose account for %s, triggering reauthentication",
+            config_entry.data.get("mail"),
         )
-        # Set Azure refresh token which is required for token refresh
-        auth.set_azure_refresh_token(config_entry.data["azure_refresh_token"])
-    else:
+        raise ConfigEntryAuthFailed(
+            f"Authentication required for {config_entry.data.get('mail')}"
+        )
+
+    # All entries of one Bose account share a single auth and token store
+    account = await async_get_account_auth(hass, config_entry.data["bose_person_id"])
+    account.async_migrate_entry_tokens(config_entry)
+
+    if not account.has_tokens:
         # Missing tokens - trigger reauthentication
         _LOGGER.warning(
             "Missing authentication tokens for %s, triggering reauthentication",
@@ -60,11 +80,22 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             f"Authentication required for {config_entry.data.get('mail')}"
         )
 
-    hass.async_create_background_task(
-        refresh_token_thread(hass, config_entry, auth), "Refresh token"
+    auth = account.async_add_entry(config_entry)
+    config_entry.async_on_unload(
+        lambda: account.async_remove_entry(config_entry.entry_id)
     )
 
-    speaker = await connect_to_bose(hass, config_entry, auth)
+    # Reuse the connection validated by the config flow, if it is still open
+    handoff = async_pop_handoff(hass, config_entry.data["guid"])
+    if handoff is not None:
+        _LOGGER.debug(
+            "Reusing config flow connection for %s", config_entry.data["guid"]
+        )
+        speaker = handoff.speaker
+        # The flow connected with the auth of its login
+        speaker._bose_auth = auth  # noqa: SLF001
+    else:
+        speaker = await connect_to_bose(hass, config_entry, auth)
 
     if not speaker:
         discovered = await config_flow.Discover_Bose_Devices(hass)
@@ -100,10 +131,12 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         _LOGGER.error("Speaker object is None, cannot retrieve system info")
         return False
 
-    system_info = await speaker.get_system_info()
-    capabilities = await speaker.get_capabilities()
-
-    await speaker.subscribe()
+    if handoff is not None:
+        system_info = handoff.system_info
+        capabilities = handoff.capabilities
+    else:
+        system_info = await speaker.get_system_info()
+        capabilities = await speaker.get_capabilities()
 
     # Register device in Home Assistant
     device_registry = dr.async_get(hass)
@@ -149,11 +182,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         config_entry.data["guid"],
     )
     hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
+    await async_apply_debug_options(coordinator, config_entry)
+    config_entry.async_on_unload(coordinator.probe.async_start())
+    config_entry.async_on_unload(coordinator.subscriptions.async_shutdown)
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(async_options_updated)
+    )
     await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_prefetch()
 
     try:
         # Not all Devices have accessories like "Bose Portable Smart Speaker"
-        accessories = await speaker.get_accessories()
+        accessories = Accessories(await coordinator.async_get("/accessories"))
         await registerAccessories(hass, config_entry, accessories)
     except Exception:  # noqa: BLE001
         accessories = []
@@ -178,95 +218,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         ],
     )
 
-    return True
-
-
-async def refresh_token_thread(
-    hass: HomeAssistant, config_entry: ConfigEntry, auth: BoseAuth
-):
-    """Refresh the token periodically."""
-    while True:
-        if (
-            auth.get_token_validity_time() > 2 * TOKEN_REFRESH_DELAY
-        ):  # when token is valid for more than 2 * refresh-delay ...
-            _LOGGER.debug(
-                "Sleeping for %s seconds before refreshing", TOKEN_REFRESH_DELAY
-            )  # wait for 1 x refresh-delay before checking again
-            await asyncio.sleep(TOKEN_REFRESH_DELAY)
-        _LOGGER.info("Refreshing token for %s", config_entry.data["mail"])
-        try:
-            if not await refresh_token(hass, config_entry, auth):
-                _LOGGER.error(
-                    "Failed to refresh token for %s. Trying again in %s seconds",
-                    config_entry.data["mail"],
-                    TOKEN_RETRY_DELAY,
-                )
-            else:
-                _LOGGER.info(
-                    "Token refreshed successfully for %s. New token valid for %s seconds",
-                    config_entry.data["mail"],
-                    auth.get_token_validity_time(),
-                )
-        except ConfigEntryAuthFailed:
-            # Token refresh failed due to authentication issue - trigger reauth flow
-            _LOGGER.warning(
-                "Authentication failed for %s, starting reauthentication flow",
-                config_entry.data["mail"],
-            )
-            hass.async_create_task(
-                hass.config_entries.flow.async_init(
-                    DOMAIN,
-                    context={"source": "reauth", "entry_id": config_entry.entry_id},
-                    data=config_entry.data,
-                )
-            )
-            # Stop the refresh loop after triggering reauth
-            break
-        await asyncio.sleep(TOKEN_RETRY_DELAY)
-
+    # All entities are added, subscribe to the resources they consume only
+    await coordinator.subscriptions.async_start()
 
-async def refresh_token(hass: HomeAssistant, config_entry: ConfigEntry, auth: BoseAuth):
-    """Refresh the token."""
-    try:
-        new_token = await hass.async_add_executor_job(auth.do_token_refresh)
-        if new_token:
-            # Get the updated Azure refresh token from auth object
-            azure_refresh_token = auth.get_azure_refresh_token()
-
-            update_data = {
-                **config_entry.data,
-                "access_token": new_token["access_token"],
-                "refresh_token": new_token["refresh_token"],
-            }
-
-            # Update Azure refresh token if available
-            if azure_refresh_token:
-                update_data["azure_refresh_token"] = azure_refresh_token
-
-            hass.config_entries.async_update_entry(
-                config_entry,
-                data=update_data,
-            )
-            _LOGGER.info(
-                "Token is valid for %s seconds", auth.get_token_validity_time()
-            )
-            return True
-    except Exception as e:
-        error_msg = str(e)
-        _LOGGER.error(
-            "Failed to refresh token for %s: %s", config_entry.data["mail"], error_msg
-        )
-
-        # Check if this is an authentication error that requires reauthentication
-        if "refresh token" in error_msg.lower() or "azure" in error_msg.lower():
-            _LOGGER.warning(
-                "Refresh token invalid for %s, triggering reauthentication flow",
-                config_entry.data["mail"],
-            )
-            raise ConfigEntryAuthFailed(
-                f"Refresh token invalid for {config_entry.data['mail']}"
-            ) from e
-    return False
+    return True
 
 
 async def reconnection_monitor(
@@ -277,7 +232,14 @@ async def reconnection_monitor(
     RECONNECT_DELAY = 10
 
     while True:
-        await asyncio.sleep(CHECK_INTERVAL)
+        coordinator: BoseCoordinator | None = (
+            hass.data[DOMAIN].get(config_entry.entry_id, {}).get("coordinator")
+        )
+        if coordinator:
+            # Failed probes wake the monitor up early, see health.py
+            await coordinator.probe.async_wait_for_failure(CHECK_INTERVAL)
+        else:
+            await asyncio.sleep(CHECK_INTERVAL)
 
         if not hass.config_entries.async_get_entry(config_entry.entry_id):
             _LOGGER.debug("Config entry removed, stopping reconnection monitor")
@@ -288,9 +250,15 @@ async def reconnection_monitor(
             _LOGGER.debug("Speaker object not found, stopping reconnection monitor")
             break
 
-        if not speaker.is_connected():
+        # A half-open socket still counts as connected, but fails the probes
+        if not speaker.is_connected() or (
+            coordinator and not coordinator.probe.healthy
+        ):
+            if coordinator:
+                coordinator.metrics.mark_disconnected()
+
             _LOGGER.warning(
-                "Speaker %s is disconnected, attempting reconnection via mDNS discovery",
+                "Speaker %s is disconnected or not responding, attempting reconnection via mDNS discovery",
                 config_entry.data.get("guid"),
             )
 
@@ -343,12 +311,11 @@ async def reconnection_monitor(
                                 "coordinator"
                             )
                             if coordinator:
-                                coordinator.speaker = new_speaker
-                                new_speaker.attach_receiver(
-                                    coordinator._cache_message  # noqa: SLF001
-                                )
-
-                            await new_speaker.subscribe()
+                                coordinator.use_speaker(new_speaker)
+                                coordinator.metrics.mark_connected()
+                                await coordinator.subscriptions.async_resubscribe()
+                            else:
+                                await new_speaker.subscribe()
 
                             _LOGGER.info(
                                 "Successfully reconnected to device %s at %s",
@@ -371,6 +338,35 @@ async def reconnection_monitor(
                 )
 
 
+async def async_options_updated(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Apply changed options that do not need a reload."""
+    coordinator: BoseCoordinator | None = (
+        hass.data[DOMAIN].get(config_entry.entry_id, {}).get("coordinator")
+    )
+    if coordinator is not None:
+        await async_apply_debug_options(coordinator, config_entry)
+
+
+async def async_apply_debug_options(
+    coordinator: BoseCoordinator, config_entry: ConfigEntry
+) -> None:
+    """Start or stop the journal and the receiver watchdog."""
+    options = config_entry.options
+    await coordinator.async_set_journal(options.get(CONF_RECORD_JOURNAL, False))
+
+    threshold = None
+    if options.get(CONF_RECEIVER_WATCHDOG, False):
+        threshold = (
+            options.get(
+                CONF_RECEIVER_WATCHDOG_THRESHOLD, DEFAULT_RECEIVER_WATCHDOG_THRESHOLD
+            )
+            / 1000
+        )
+    coordinator.set_receiver_watchdog(threshold)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Disconnect from the speaker
@@ -378,6 +374,13 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     if speaker:
         await speaker.disconnect()
 
+    # Write out what the journal still buffers
+    coordinator: BoseCoordinator | None = hass.data[DOMAIN][
+        config_entry.entry_id
+    ].get("coordinator")
+    if coordinator is not None:
+        await coordinator.async_set_journal(False)
+
     # Remove our stored data
     hass.data[DOMAIN].pop(config_entry.entry_id, None)
 
@@ -401,6 +404,20 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the account tokens once the last entry of the account is removed."""
+    bose_person_id = config_entry.data.get("bose_person_id")
+    if bose_person_id is None:
+        return
+
+    if not any(
+        entry.data.get("bose_person_id") == bose_person_id
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != config_entry.entry_id
+    ):
+        await async_remove_account_tokens(hass, bose_person_id)
+
+
 def setup(hass: HomeAssistant, config: ConfigEntry) -> bool:
     """Set up the Bose component."""
 
@@ -474,6 +491,61 @@ def setup(hass: HomeAssistant, config: ConfigEntry) -> bool:
 
         await speaker.remove_bluetooth_sink_device(mac_address)
 
+    profiling: list[HotPathProfiler] = []
+
+    async def handle_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the hot paths of the integration for a while."""
+        if profiling:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="profile_running",
+            )
+
+        loaded = {
+            entry_id: data
+            for entry_id, data in hass.data.get(DOMAIN, {}).items()
+            if isinstance(data, dict) and data.get("speaker") is not None
+        }
+        device_ids = call.data.get("device_id")
+        if device_ids:
+            if isinstance(device_ids, str):
+                device_ids = [device_ids]
+            device_registry = dr.async_get(hass)
+            entries = {}
+            for ha_device_id in device_ids:
+                device_entry = device_registry.async_get(ha_device_id)
+                if (
+                    device_entry is None
+                    or device_entry.primary_config_entry not in loaded
+                ):
+                    raise ServiceValidationError(
+                        translation_domain=DOMAIN,
+                        translation_key="speaker_not_found",
+                        translation_placeholders={"device_id": ha_device_id},
+                    )
+                entries[device_entry.primary_config_entry] = loaded[
+                    device_entry.primary_config_entry
+                ]
+        else:
+            entries = loaded
+
+        profiler = HotPathProfiler(hass, call.data["slowest"])
+        profiling.append(profiler)
+        try:
+            profiler.start(entries)
+            await asyncio.sleep(call.data["duration"])
+        finally:
+            profiler.stop()
+            profiling.clear()
+
+        return {
+            "speakers": sorted(
+                data.get("config", {}).get("name", entry_id)
+                for entry_id, data in entries.items()
+            ),
+            **profiler.report(),
+        }
+
     hass.services.register(
         DOMAIN,
         "remove_bluetooth_device",
@@ -485,6 +557,13 @@ def setup(hass: HomeAssistant, config: ConfigEntry) -> bool:
         handle_custom_request,
         supports_response=SupportsResponse.ONLY,
     )
+    hass.services.register(
+        DOMAIN,
+        "profile",
+        handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 
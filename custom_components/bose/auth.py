@@ -0,0 +1,298 @@
+"""Account-level authentication for the Bose integration.
+
+All config entries that belong to the same Bose account share one
+``BoseAuth`` instance and one token refresh timer. The timer fires a
+little before the token expires. Tokens live in a per-account ``Store``
+so that refreshing them never rewrites the config entries, which only
+hold stable identity data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+import random
+from typing import Any
+
+from pybose.BoseAuth import BoseAuth
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    _LOGGER,
+    DOMAIN,
+    TOKEN_REFRESH_JITTER,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_RETRY_DELAY,
+    TOKEN_RETRY_MAX_DELAY,
+)
+
+STORAGE_VERSION = 1
+# Delay before refreshed tokens are written to disk
+TOKEN_SAVE_DELAY = 10  # seconds
+
+# Keys of the volatile tokens kept in the token store
+TOKEN_KEYS = ("access_token", "refresh_token", "azure_refresh_token")
+
+
+def _token_store(hass: HomeAssistant, bose_person_id: str) -> Store[dict[str, Any]]:
+    """Return the token store of a Bose account."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.tokens.{bose_person_id}")
+
+
+async def async_get_account_auth(
+    hass: HomeAssistant, bose_person_id: str
+) -> BoseAccountAuth:
+    """Return the shared auth manager of a Bose account, loading its tokens."""
+    accounts: dict[str, BoseAccountAuth] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault("accounts", {})
+    account = accounts.get(bose_person_id)
+    if account is None:
+        account = BoseAccountAuth(hass, bose_person_id)
+        accounts[bose_person_id] = account
+    await account.async_load()
+    return account
+
+
+async def async_remove_account_tokens(
+    hass: HomeAssistant, bose_person_id: str
+) -> None:
+    """Delete the stored tokens of a Bose account."""
+    account = hass.data.get(DOMAIN, {}).get("accounts", {}).pop(bose_person_id, None)
+    if account is not None:
+        account.async_shutdown()
+    await _token_store(hass, bose_person_id).async_remove()
+
+
+class BoseAccountAuth:
+    """Shared BoseAuth and token refresh for all entries of one Bose account."""
+
+    def __init__(self, hass: HomeAssistant, bose_person_id: str) -> None:
+        """Initialize the account auth manager."""
+        self.hass = hass
+        self.bose_person_id = bose_person_id
+        self.auth = BoseAuth()
+        self.entry_ids: set[str] = set()
+        self._store = _token_store(hass, bose_person_id)
+        self._tokens: dict[str, Any] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._unsub_refresh: Callable[[], None] | None = None
+        self._failures = 0
+        self._reauth_pending = False
+        self._mail: str | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored tokens once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            if (data := await self._store.async_load()) is not None:
+                self._apply_tokens(data)
+            self._loaded = True
+
+    @property
+    def has_tokens(self) -> bool:
+        """Return True if all tokens required for refreshing are known."""
+        return all(self._tokens.get(key) for key in TOKEN_KEYS)
+
+    def _apply_tokens(self, tokens: dict[str, Any]) -> None:
+        """Load tokens into the shared BoseAuth."""
+        self._tokens = {key: tokens.get(key) for key in TOKEN_KEYS}
+        if not self.has_tokens:
+            return
+        self.auth.set_access_token(
+            tokens["access_token"],
+            tokens["refresh_token"],
+            self.bose_person_id,
+        )
+        # Set Azure refresh token which is required for token refresh
+        self.auth.set_azure_refresh_token(tokens["azure_refresh_token"])
+
+    @callback
+    def async_set_tokens(self, tokens: dict[str, Any]) -> None:
+        """Replace the tokens of the account, e.g. after a (re)login."""
+        self._apply_tokens(tokens)
+        self._store.async_delay_save(self._data_to_save, TOKEN_SAVE_DELAY)
+        self._failures = 0
+        self._reauth_pending = False
+        if self.entry_ids:
+            self._async_schedule_refresh(self._next_refresh_delay())
+
+    @callback
+    def async_migrate_entry_tokens(self, config_entry: ConfigEntry) -> None:
+        """Move tokens still kept in the config entry into the token store."""
+        data = config_entry.data
+        if not any(key in data for key in TOKEN_KEYS):
+            return
+
+        # Keep whichever tokens outlive the other, e.g. after a reauth
+        if all(data.get(key) for key in TOKEN_KEYS) and (
+            not self.has_tokens
+            or self.auth.get_token_validity_time(data["access_token"])
+            > self.auth.get_token_validity_time()
+        ):
+            self.async_set_tokens(data)
+
+        _LOGGER.debug("Moving tokens of %s into the token store", data.get("mail"))
+        self.hass.config_entries.async_update_entry(
+            config_entry,
+            data={k: v for k, v in data.items() if k not in TOKEN_KEYS},
+        )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the tokens to write to the store."""
+        return dict(self._tokens)
+
+    @callback
+    def async_add_entry(self, config_entry: ConfigEntry) -> BoseAuth:
+        """Register a config entry with this account and return the shared auth."""
+        self._mail = config_entry.data.get("mail")
+        self.entry_ids.add(config_entry.entry_id)
+
+        if self._unsub_refresh is None and not self._reauth_pending:
+            self._async_schedule_refresh(self._next_refresh_delay())
+        return self.auth
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Unregister a config entry and stop refreshing once none are left."""
+        self.entry_ids.discard(entry_id)
+        if not self.entry_ids:
+            self.async_shutdown()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending token refresh."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    def _entries(self) -> list[ConfigEntry]:
+        """Return the config entries currently registered with this account."""
+        return [
+            entry
+            for entry_id in self.entry_ids
+            if (entry := self.hass.config_entries.async_get_entry(entry_id))
+            is not None
+        ]
+
+    def _next_refresh_delay(self) -> float:
+        """Return the delay until the token should be refreshed."""
+        # The random part of the margin spreads refreshes across accounts
+        margin = TOKEN_REFRESH_MARGIN + random.uniform(0, TOKEN_REFRESH_JITTER)
+        return max(self.auth.get_token_validity_time() - margin, 0)
+
+    def _next_retry_delay(self) -> float:
+        """Return the exponential backoff delay after a failed refresh."""
+        delay = min(
+            TOKEN_RETRY_DELAY * 2 ** (self._failures - 1), TOKEN_RETRY_MAX_DELAY
+        )
+        return random.uniform(delay / 2, delay)
+
+    @callback
+    def _async_schedule_refresh(self, delay: float) -> None:
+        """Schedule the next token refresh, replacing any pending one."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+        _LOGGER.debug("Next token refresh for %s in %.0f seconds", self._mail, delay)
+        self._unsub_refresh = async_call_later(
+            self.hass, delay, self._async_refresh_due
+        )
+
+    @callback
+    def _async_refresh_due(self, _now: datetime) -> None:
+        """Start the token refresh when the timer fires."""
+        self._unsub_refresh = None
+        self.hass.async_create_background_task(
+            self._async_scheduled_refresh(), f"Refresh token for {self._mail}"
+        )
+
+    async def _async_scheduled_refresh(self) -> None:
+        """Refresh the token and schedule the next refresh."""
+        _LOGGER.info("Refreshing token for %s", self._mail)
+        try:
+            refreshed = await self.async_refresh()
+        except ConfigEntryAuthFailed:
+            # Token refresh failed due to authentication issue - trigger reauth flow
+            _LOGGER.warning(
+                "Authentication failed for %s, starting reauthentication flow",
+                self._mail,
+            )
+            self._reauth_pending = True
+            for entry in self._entries():
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": "reauth", "entry_id": entry.entry_id},
+                        data=entry.data,
+                    )
+                )
+            # No further refreshes until an entry brings fresh tokens
+            return
+
+        if not self.entry_ids:
+            return
+
+        if refreshed:
+            self._failures = 0
+            _LOGGER.info(
+                "Token refreshed successfully for %s. New token valid for %s seconds",
+                self._mail,
+                self.auth.get_token_validity_time(),
+            )
+            self._async_schedule_refresh(self._next_refresh_delay())
+            return
+
+        self._failures += 1
+        delay = self._next_retry_delay()
+        _LOGGER.error(
+            "Failed to refresh token for %s. Trying again in %.0f seconds",
+            self._mail,
+            delay,
+        )
+        self._async_schedule_refresh(delay)
+
+    async def async_refresh(self) -> bool:
+        """Refresh the token once for all entries of the account."""
+        try:
+            new_token = await self.hass.async_add_executor_job(
+                self.auth.do_token_refresh
+            )
+            if new_token:
+                # Get the updated Azure refresh token from auth object
+                azure_refresh_token = self.auth.get_azure_refresh_token()
+
+                self._tokens["access_token"] = new_token["access_token"]
+                self._tokens["refresh_token"] = new_token["refresh_token"]
+
+                # Update Azure refresh token if available
+                if azure_refresh_token:
+                    self._tokens["azure_refresh_token"] = azure_refresh_token
+
+                self._store.async_delay_save(self._data_to_save, TOKEN_SAVE_DELAY)
+                _LOGGER.info(
+                    "Token is valid for %s seconds",
+                    self.auth.get_token_validity_time(),
+                )
+                return True
+        except Exception as e:
+            error_msg = str(e)
+            _LOGGER.error("Failed to refresh token for %s: %s", self._mail, error_msg)
+
+            # Check if this is an authentication error that requires reauthentication
+            if "refresh token" in error_msg.lower() or "azure" in error_msg.lower():
+                _LOGGER.warning(
+                    "Refresh token invalid for %s, triggering reauthentication flow",
+                    self._mail,
+                )
+                raise ConfigEntryAuthFailed(
+                    f"Refresh token invalid for {self._mail}"
+                ) from e
+        return False
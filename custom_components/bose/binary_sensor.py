@@ -14,6 +14,7 @@ from pybose import BoseSpeaker
 from .bose.battery import BoseBatteryBase
 from .const import DOMAIN
 from .entity import BoseBaseEntity
+from .resources import RESOURCES
 
 
 async def async_setup_entry(
@@ -24,7 +25,7 @@ async def async_setup_entry(
     """Set up Bose battery sensor if supported."""
     speaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
 
-    if speaker.has_capability("/system/battery"):
+    if RESOURCES["/system/battery"].supported(speaker):
         async_add_entities(
             [
                 BoseBatteryChargingSensor(speaker, None, config_entry, hass),
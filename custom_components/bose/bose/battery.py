@@ -5,6 +5,8 @@ entities. It intentionally does not inherit from Home Assistant
 Entity classes to avoid multiple-inheritance conflicts.
 """
 
+from collections import deque
+import time
 from typing import Any, cast
 
 from pybose.BoseResponse import Battery
@@ -16,6 +18,15 @@ from homeassistant.core import HomeAssistant
 from ..const import _LOGGER, DOMAIN
 from ..coordinator import BoseCoordinator
 
+# Percent drops kept for the drain model of the time-to-empty prediction
+BATTERY_HISTORY = 32
+# Weight of the newest discharge rate in the smoothed rate
+DRAIN_ALPHA = 0.3
+# A new prediction is published when it moved by at least this many minutes
+# and this fraction of the published prediction
+PREDICTION_MIN_CHANGE = 5  # minutes
+PREDICTION_REL_CHANGE = 0.1
+
 
 def dummy_battery_status() -> Battery:
     """Return dummy battery status. Used for testing."""
@@ -48,16 +59,60 @@ class BoseBatteryBase:
         self._attr_device_info = {
             "identifiers": {(DOMAIN, config_entry.data["guid"])},
         }
-
-        self.speaker.attach_receiver(self._parse_message)
+        # Set on the instance, BoseBaseEntity precedes the mixin in the MRO
+        self._consumed_resources = ("/system/battery",)
         self.hass = hass
 
-        hass.async_create_task(self.async_update())
+        # Time and percent of every drop of the charge level while discharging
+        self._percent_drops: deque[tuple[float, int]] = deque(maxlen=BATTERY_HISTORY)
+        self._drain_rate: float | None = None  # percent per minute
+
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the status once the entity is added."""
+        await super().async_added_to_hass()  # type: ignore[misc]
+        self._attach_receiver(self._parse_message)  # type: ignore[attr-defined]
+        self.async_schedule_update_ha_state(force_refresh=True)  # type: ignore[attr-defined]
 
     def _parse_message(self, data):
         """Parse real-time messages from the speaker."""
         if data.get("header", {}).get("resource") == "/system/battery":
             self.update_from_battery_status(Battery(data.get("body")))
+            self.async_write_ha_state()  # type: ignore[attr-defined]
+
+    def _update_drain_rate(self, battery_status: Battery) -> float | None:
+        """Update the smoothed discharge rate with a status, in percent/minute.
+
+        Rates are taken between drops of the charge level, so the speaker's
+        own estimate jumping with the volume doesn't move them. The rate is
+        exponentially weighted and starts over whenever the speaker charges.
+        """
+        percent = battery_status.get("percent")
+        if percent is None or battery_status.get("chargerConnected") == "CONNECTED":
+            self._percent_drops.clear()
+            self._drain_rate = None
+            return None
+
+        drops = self._percent_drops
+        if drops and percent > drops[-1][1]:
+            # Charged without charger report, or recalibrated
+            drops.clear()
+            self._drain_rate = None
+        if drops and percent == drops[-1][1]:
+            return self._drain_rate
+
+        now = time.monotonic()
+        # The first sample is taken anywhere within a percent, so the first
+        # interval is not a full drop and gives no rate
+        if len(drops) >= 2:
+            then, previous = drops[-1]
+            rate = (previous - percent) / max((now - then) / 60, 1 / 60)
+            self._drain_rate = (
+                rate
+                if self._drain_rate is None
+                else DRAIN_ALPHA * rate + (1 - DRAIN_ALPHA) * self._drain_rate
+            )
+        drops.append((now, percent))
+        return self._drain_rate
 
     def update_from_battery_status(self, battery_status: Battery):
         """Implmented in sensor."""
@@ -70,7 +125,7 @@ class BoseBatteryBase:
         if not getattr(self, "hass", None):
             return
         try:
-            battery_data = await self.coordinator.get_battery_status()
+            battery_data = await self.coordinator.async_get("/system/battery")
             battery_status = Battery(battery_data)
             self.update_from_battery_status(battery_status)
             self.async_write_ha_state()
@@ -31,10 +31,16 @@ class BoseNetworkBase:
         self._attr_device_info = {
             "identifiers": {(DOMAIN, config_entry.data["guid"])},
         }
-
-        self.speaker.attach_receiver(self._parse_message)
+        # Set on the instance, BoseBaseEntity precedes the mixin in the MRO
+        self._consumed_resources = ("/network/status",)
         self.hass = hass
 
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the status once the entity is added."""
+        await super().async_added_to_hass()  # type: ignore[misc]
+        self._attach_receiver(self._parse_message)  # type: ignore[attr-defined]
+        self.async_schedule_update_ha_state(force_refresh=True)  # type: ignore[attr-defined]
+
     def _parse_message(self, data):
         """Parse real-time messages from the speaker."""
         if data.get("header", {}).get("resource") == "/network/status":
@@ -51,7 +57,7 @@ class BoseNetworkBase:
     async def async_update(self) -> None:
         """Fetch the latest network status."""
         try:
-            network_data = await self.coordinator.get_network_status()
+            network_data = await self.coordinator.async_get("/network/status")
             network_status = NetworkStatus(network_data)
             self.update_from_network_status(network_status)
         except Exception:  # noqa: BLE001
@@ -5,15 +5,28 @@ entities. It intentionally does not inherit from Home Assistant
 Entity classes to avoid multiple-inheritance conflicts.
 """
 
+from collections import deque
+import statistics
+import time
+from typing import Any
+
 from pybose.BoseResponse import WifiStatus
 from pybose.BoseSpeaker import BoseSpeaker
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from ..const import _LOGGER, DOMAIN
+from ..const import (
+    _LOGGER,
+    CONF_WIFI_SIGNAL_INTERVAL,
+    DEFAULT_WIFI_SIGNAL_INTERVAL,
+    DOMAIN,
+)
 from ..coordinator import BoseCoordinator
 
+# Recent signal samples the statistics are computed from
+WIFI_SIGNAL_SAMPLES = 120
+
 
 class BoseWifiBase:
     """Helper mixin for Bose WiFi sensors."""
@@ -32,10 +45,21 @@ class BoseWifiBase:
         self._attr_device_info = {
             "identifiers": {(DOMAIN, config_entry.data["guid"])},
         }
-
-        self.speaker.attach_receiver(self._parse_message)
+        # Set on the instance, BoseBaseEntity precedes the mixin in the MRO
+        self._consumed_resources = ("/network/wifi/status",)
         self.hass = hass
 
+        self._signal_samples: deque[tuple[float, int]] = deque(
+            maxlen=WIFI_SIGNAL_SAMPLES
+        )
+        self._signal_published: float | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the status once the entity is added."""
+        await super().async_added_to_hass()  # type: ignore[misc]
+        self._attach_receiver(self._parse_message)  # type: ignore[attr-defined]
+        self.async_schedule_update_ha_state(force_refresh=True)  # type: ignore[attr-defined]
+
     def _parse_message(self, data):
         """Parse real-time messages from the speaker."""
         if data.get("header", {}).get("resource") == "/network/wifi/status":
@@ -43,6 +67,37 @@ class BoseWifiBase:
             if self.hass and hasattr(self, "async_write_ha_state"):
                 self.async_write_ha_state()
 
+    def _record_signal(self, signal: int) -> tuple[int, dict[str, Any]] | None:
+        """Add a signal sample; return value and statistics when they are due.
+
+        The value is the average of the samples since the last publication,
+        the statistics cover all samples kept. Between publications value and
+        attributes do not change, so state writes add no recorder rows.
+        """
+        now = time.monotonic()
+        self._signal_samples.append((now, signal))
+        interval = self.config_entry.options.get(
+            CONF_WIFI_SIGNAL_INTERVAL, DEFAULT_WIFI_SIGNAL_INTERVAL
+        )
+        previous = self._signal_published
+        if previous is not None and now - previous < interval:
+            return None
+        self._signal_published = now
+
+        recent = [
+            sample
+            for sampled, sample in self._signal_samples
+            if previous is None or sampled > previous
+        ]
+        samples = [sample for _, sample in self._signal_samples]
+        return round(statistics.fmean(recent)), {
+            "min": min(samples),
+            "max": max(samples),
+            "mean": round(statistics.fmean(samples), 1),
+            "stddev": round(statistics.pstdev(samples), 1),
+            "samples": len(samples),
+        }
+
     def update_from_wifi_status(self, wifi_status: WifiStatus):
         """Implemented in sensor."""
         raise NotImplementedError("update_from_wifi_status not implemented in sensor")
@@ -50,7 +105,7 @@ class BoseWifiBase:
     async def async_update(self) -> None:
         """Fetch the latest WiFi status."""
         try:
-            wifi_data = await self.coordinator.get_wifi_status()
+            wifi_data = await self.coordinator.async_get("/network/wifi/status")
             wifi_status = WifiStatus(wifi_data)
             self.update_from_wifi_status(wifi_status)
         except Exception:  # noqa: BLE001
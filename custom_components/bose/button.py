@@ -22,9 +22,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Bose buttons."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     presets = (
-        (await speaker.get_product_settings()).get("presets", None).get("presets", [])
+        (await coordinator.async_get("/system/productSettings"))
+        .get("presets", None)
+        .get("presets", [])
     )
 
     entities: list[BoseBaseEntity] = [
@@ -64,7 +67,11 @@ async def async_setup_entry(
                         update_before_add=False,
                     )
 
-    speaker.attach_receiver(parse_message)
+    # The receiver adds preset buttons, so it consumes the resource itself
+    config_entry.async_on_unload(coordinator.async_attach_receiver(parse_message))
+    config_entry.async_on_unload(
+        coordinator.subscriptions.async_add_consumer(["/system/productSettings"])
+    )
 
 
 class BosePresetbutton(BoseBaseEntity, ButtonEntity):
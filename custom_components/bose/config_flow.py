@@ -1,6 +1,7 @@
 """Config flow for Bose integration."""
 
-from typing import Any
+import asyncio
+from typing import Any, cast
 
 from pybose.BoseAuth import BoseAuth
 from pybose.BoseDiscovery import BoseDiscovery
@@ -11,10 +12,26 @@ from homeassistant import config_entries
 import homeassistant.components.zeroconf
 from homeassistant.config_entries import ConfigFlowResult, OptionsFlow
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.helpers import selector, translation as translation_helper
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import _LOGGER, CONF_CHROMECAST_AUTO_ENABLE, DOMAIN
+from .auth import TOKEN_KEYS, async_get_account_auth
+from .const import (
+    _LOGGER,
+    CONF_CHROMECAST_AUTO_ENABLE,
+    CONF_RECEIVER_WATCHDOG,
+    CONF_RECEIVER_WATCHDOG_THRESHOLD,
+    CONF_RECORD_JOURNAL,
+    CONF_WIFI_SIGNAL_INTERVAL,
+    DEFAULT_RECEIVER_WATCHDOG_THRESHOLD,
+    DEFAULT_WIFI_SIGNAL_INTERVAL,
+    DOMAIN,
+)
+from .handoff import async_discard_speaker, async_store_handoff
+
+# Maximum number of devices probed at the same time when adding all devices
+BULK_PROBE_CONCURRENCY = 4
 
 
 async def Discover_Bose_Devices(hass: HomeAssistant):
@@ -44,9 +61,12 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the Bose config flow."""
         self.discovered_ips = []  # List to store discovered IPs
+        self._discovered_guids: dict[str, str] = {}  # Discovered IP -> GUID
         self.mail = None
         self.password = None
         self._auth = None
+        # Tokens of the login, stored when the first entry is set up
+        self._tokens: dict[str, Any] = {}
         self._discovered_device = None
         self._reauth_entry = None
 
@@ -74,6 +94,9 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if user_input.get("device") == "manual" or not user_input.get("device"):
                     return await self.async_step_manual_ip()
 
+                if user_input["device"] == "all":
+                    return await self._async_add_all_devices()
+
                 # User selected a discovered IP
                 ip = user_input["device"]
                 try:
@@ -101,9 +124,16 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 f"component.{DOMAIN}.config.step.user.data.manual_ip",
                 "Enter IP Manually",
             )
+            all_label = translations.get(
+                f"component.{DOMAIN}.config.step.user.data.all_devices",
+                "Add all discovered devices",
+            )
         except (ValueError, RuntimeError):
             manual_label = "Enter IP Manually"
+            all_label = "Add all discovered devices"
 
+        if len(self.discovered_ips) > 1:
+            ip_options["all"] = all_label
         ip_options["manual"] = manual_label
 
         # Show the form for input
@@ -160,8 +190,104 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _discover_devices(self):
         """Discover devices using BoseDiscovery in an executor."""
         devices = await Discover_Bose_Devices(self.hass)
+        self._discovered_guids = {device["ip"]: device["guid"] for device in devices}
         return [device["ip"] for device in devices]
 
+    async def _probe_device(self, ip: str, auth: BoseAuth) -> dict[str, Any] | None:
+        """Connect to a device and return its entry data, or None on failure.
+
+        The connection is handed off to the setup of the new entry.
+        """
+        speaker = BoseSpeaker(bose_auth=auth, host=ip)
+        try:
+            await speaker.connect()
+            system_info = await speaker.get_system_info()
+            capabilities = (
+                speaker._capabilities  # noqa: SLF001
+                or await speaker.get_capabilities()
+            )
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.warning("Failed to get system info from %s: %s", ip, e)
+            async_discard_speaker(self.hass, speaker)
+            return None
+
+        guid = speaker.get_device_id()
+        if not system_info or not guid or guid in self._async_current_ids():
+            async_discard_speaker(self.hass, speaker)
+            return None
+
+        async_store_handoff(self.hass, speaker, system_info, capabilities)
+        return {
+            "ip": ip,
+            "guid": guid,
+            "serial": system_info["serialNumber"],
+            "name": system_info["name"],
+        }
+
+    async def _async_add_all_devices(self) -> ConfigFlowResult:
+        """Add every discovered device of the account in one step."""
+        bose_person_id = self._validate_login_tokens()
+        if bose_person_id is None:
+            return self.async_abort(reason="auth_failed")
+        auth = cast(BoseAuth, self._auth)
+
+        configured = self._async_current_ids()
+        ips = [
+            ip
+            for ip in self.discovered_ips
+            if self._discovered_guids.get(ip) not in configured
+        ]
+
+        semaphore = asyncio.Semaphore(BULK_PROBE_CONCURRENCY)
+
+        async def _bounded_probe(ip: str) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self._probe_device(ip, auth)
+
+        results = await asyncio.gather(*(_bounded_probe(ip) for ip in ips))
+        devices = [device for device in results if device is not None]
+        _LOGGER.info(
+            "Adding %s of %s discovered devices", len(devices), len(self.discovered_ips)
+        )
+
+        if not devices:
+            return self.async_abort(reason="no_new_devices")
+
+        first, *others = devices
+        for device in others:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_IMPORT},
+                    data={
+                        "mail": self.mail,
+                        "bose_person_id": bose_person_id,
+                        **self._tokens,
+                        **device,
+                    },
+                )
+            )
+
+        return await self.async_step_import(
+            {
+                "mail": self.mail,
+                "bose_person_id": bose_person_id,
+                **self._tokens,
+                **first,
+            }
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create the entry of a device added together with all others."""
+        await self.async_set_unique_id(import_data["guid"])
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(
+            title=import_data["name"],
+            data=import_data,
+            options={CONF_CHROMECAST_AUTO_ENABLE: True},
+        )
+
     def _login(self, email, password):
         """Authenticate and retrieve the control token."""
         try:
@@ -180,23 +306,64 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _get_device_info(self, mail, password, ip):
         """Get the device info."""
+        bose_person_id = self._validate_login_tokens()
+        if bose_person_id is None:
+            return self.async_abort(reason="auth_failed")
+
+        # Setup reuses the connection and moves it to the shared account auth
+        speaker = BoseSpeaker(bose_auth=self._auth, host=ip)
         try:
-            speaker = BoseSpeaker(bose_auth=self._auth, host=ip)  # pyright: ignore[reportArgumentType]
             await speaker.connect()
             system_info = await speaker.get_system_info()
             if not system_info:
+                async_discard_speaker(self.hass, speaker)
                 return self.async_abort(reason="info_failed")
+            capabilities = (
+                speaker._capabilities  # noqa: SLF001
+                or await speaker.get_capabilities()
+            )
         except Exception as e:  # noqa: BLE001
             _LOGGER.exception("Failed to get system info", exc_info=e)
+            async_discard_speaker(self.hass, speaker)
             return self.async_abort(reason="connect_failed")
 
         guid = speaker.get_device_id()
 
         await self.async_set_unique_id(guid)
-        self._abort_if_unique_id_configured()
+        try:
+            self._abort_if_unique_id_configured()
+        except AbortFlow:
+            async_discard_speaker(self.hass, speaker)
+            raise
+
+        async_store_handoff(self.hass, speaker, system_info, capabilities)
+
+        return self.async_create_entry(
+            title=f"{system_info['name']}",
+            data={
+                "mail": self.mail,
+                "ip": ip,
+                "bose_person_id": bose_person_id,
+                **self._tokens,
+                "guid": guid,
+                "serial": system_info["serialNumber"],
+                "name": system_info["name"],
+            },
+            options={CONF_CHROMECAST_AUTO_ENABLE: True},
+        )
 
+    def _validate_login_tokens(self) -> str | None:
+        """Keep the tokens of the login for the entries the flow creates.
+
+        They are not stored here: a flow failing or abandoned before it
+        creates an entry must not leave a token store behind. The first
+        setup of the entry moves them from its data into the account token
+        store, see BoseAccountAuth.async_migrate_entry_tokens.
+
+        Returns the Bose person ID of the account, or None if tokens are missing.
+        """
         if self._auth is None:
-            return self.async_abort(reason="auth_failed")
+            return None
 
         tokens = self._auth.getCachedToken()
         azure_refresh_token = self._auth.get_azure_refresh_token()
@@ -227,23 +394,14 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 tokens.get("refresh_token") is not None if tokens else False,
                 azure_refresh_token is not None,
             )
-            return self.async_abort(reason="auth_failed")
+            return None
 
-        return self.async_create_entry(
-            title=f"{system_info['name']}",
-            data={
-                "mail": self.mail,
-                "ip": ip,
-                "bose_person_id": bose_person_id,
-                "access_token": tokens.get("access_token"),
-                "refresh_token": tokens.get("refresh_token"),
-                "azure_refresh_token": azure_refresh_token,
-                "guid": guid,
-                "serial": system_info["serialNumber"],
-                "name": system_info["name"],
-            },
-            options={CONF_CHROMECAST_AUTO_ENABLE: True},
-        )
+        self._tokens = {
+            "access_token": tokens.get("access_token"),
+            "refresh_token": tokens.get("refresh_token"),
+            "azure_refresh_token": azure_refresh_token,
+        }
+        return bose_person_id
 
     async def async_step_zeroconf(
         self, discovery_info: ZeroconfServiceInfo
@@ -405,14 +563,23 @@ class BoseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         return self.async_abort(reason="wrong_account")
 
                     _LOGGER.info("Reauthentication successful, updating config entry")
+                    account = await async_get_account_auth(self.hass, bose_person_id)
+                    account.async_set_tokens(
+                        {
+                            "access_token": tokens.get("access_token"),
+                            "refresh_token": tokens.get("refresh_token"),
+                            "azure_refresh_token": azure_refresh_token,
+                        }
+                    )
                     return self.async_update_reload_and_abort(
                         self._reauth_entry,
                         data={
-                            **self._reauth_entry.data,
+                            **{
+                                key: value
+                                for key, value in self._reauth_entry.data.items()
+                                if key not in TOKEN_KEYS
+                            },
                             "mail": mail,
-                            "access_token": tokens.get("access_token"),
-                            "refresh_token": tokens.get("refresh_token"),
-                            "azure_refresh_token": azure_refresh_token,
                             "bose_person_id": bose_person_id,
                         },
                     )
@@ -456,7 +623,11 @@ class BoseOptionsFlowHandler(OptionsFlow):
         """Show main configuration menu."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["source_settings", "connectivity_settings"],
+            menu_options=[
+                "source_settings",
+                "connectivity_settings",
+                "debug_settings",
+            ],
         )
 
     async def async_step_source_settings(
@@ -596,6 +767,9 @@ class BoseOptionsFlowHandler(OptionsFlow):
             current_options[CONF_CHROMECAST_AUTO_ENABLE] = user_input.get(
                 CONF_CHROMECAST_AUTO_ENABLE, True
             )
+            current_options[CONF_WIFI_SIGNAL_INTERVAL] = user_input.get(
+                CONF_WIFI_SIGNAL_INTERVAL, DEFAULT_WIFI_SIGNAL_INTERVAL
+            )
             self.hass.config_entries.async_update_entry(
                 self.config_entry, options=current_options
             )
@@ -612,6 +786,20 @@ class BoseOptionsFlowHandler(OptionsFlow):
                     CONF_CHROMECAST_AUTO_ENABLE,
                     default=current_chromecast_setting,
                 ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_WIFI_SIGNAL_INTERVAL,
+                    default=current_options.get(
+                        CONF_WIFI_SIGNAL_INTERVAL, DEFAULT_WIFI_SIGNAL_INTERVAL
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=30,
+                        max=3600,
+                        step=30,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
             }
         )
 
@@ -621,6 +809,61 @@ class BoseOptionsFlowHandler(OptionsFlow):
             last_step=False,
         )
 
+    async def async_step_debug_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Configure debugging features."""
+        if user_input is not None:
+            current_options = dict(self.config_entry.options)
+            current_options[CONF_RECORD_JOURNAL] = user_input.get(
+                CONF_RECORD_JOURNAL, False
+            )
+            current_options[CONF_RECEIVER_WATCHDOG] = user_input.get(
+                CONF_RECEIVER_WATCHDOG, False
+            )
+            current_options[CONF_RECEIVER_WATCHDOG_THRESHOLD] = user_input.get(
+                CONF_RECEIVER_WATCHDOG_THRESHOLD, DEFAULT_RECEIVER_WATCHDOG_THRESHOLD
+            )
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, options=current_options
+            )
+            return await self.async_step_init()
+
+        current_options = self.config_entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_RECORD_JOURNAL,
+                    default=current_options.get(CONF_RECORD_JOURNAL, False),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_RECEIVER_WATCHDOG,
+                    default=current_options.get(CONF_RECEIVER_WATCHDOG, False),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_RECEIVER_WATCHDOG_THRESHOLD,
+                    default=current_options.get(
+                        CONF_RECEIVER_WATCHDOG_THRESHOLD,
+                        DEFAULT_RECEIVER_WATCHDOG_THRESHOLD,
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=1000,
+                        step=1,
+                        unit_of_measurement="ms",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="debug_settings",
+            data_schema=data_schema,
+            last_step=False,
+        )
+
     async def async_step_complete_setup(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -4,13 +4,30 @@ import logging
 
 DOMAIN = "bose"
 
-# Token Refresh Delay is how long between each check if the token is valid
-# Token Retry Delay is how long before each retry if refresh fails
-TOKEN_REFRESH_DELAY = 3600  # seconds
+# Token Refresh Margin is how long before the token expires it is refreshed
+# Token Refresh Jitter is a random extra margin to spread refreshes of accounts
+# Token Retry Delay is the first backoff delay if refresh fails, doubling up to
+# Token Retry Max Delay
+TOKEN_REFRESH_MARGIN = 600  # seconds
+TOKEN_REFRESH_JITTER = 300  # seconds
 TOKEN_RETRY_DELAY = 120  # seconds
+TOKEN_RETRY_MAX_DELAY = 3600  # seconds
 
 # Options key for Chromecast auto-enable setting
 CONF_CHROMECAST_AUTO_ENABLE = "chromecast_auto_enable"
 
+# Options key for how often the WiFi signal sensor publishes its average
+CONF_WIFI_SIGNAL_INTERVAL = "wifi_signal_interval"
+DEFAULT_WIFI_SIGNAL_INTERVAL = 300  # seconds
+
+# Options key for recording all speaker messages to a journal
+CONF_RECORD_JOURNAL = "record_journal"
+
+# Options keys for timing all message receivers and the threshold above which
+# a receiver call is reported as slow
+CONF_RECEIVER_WATCHDOG = "receiver_watchdog"
+CONF_RECEIVER_WATCHDOG_THRESHOLD = "receiver_watchdog_threshold"
+DEFAULT_RECEIVER_WATCHDOG_THRESHOLD = 10  # milliseconds
+
 
 _LOGGER = logging.getLogger("bose")
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
+import functools
+import time
+from typing import Any, cast
 
 from pybose.BoseSpeaker import BoseSpeaker
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import _LOGGER, DOMAIN
+from .health import ConnectionProbe
+from .journal import MessageJournal
+from .metrics import SpeakerMetrics
+from .resources import DEFAULT_TTL, RESOURCES, BoseResource
+from .scheduler import RefreshScheduler
+from .subscription import SubscriptionManager
+from .watchdog import ReceiverWatchdog
 
-# Cache expiry time in seconds
-CACHE_EXPIRY_SECONDS = 60
+# Cache expiry time in seconds of resources that are not registered
+CACHE_EXPIRY_SECONDS = DEFAULT_TTL
+
+# Requests in flight at once while prefetching at setup or refreshing
+PREFETCH_CONCURRENCY = 4
+
+# Coordinator interval while no resource is scheduled, see scheduler.py
+REFRESH_INTERVAL = timedelta(seconds=CACHE_EXPIRY_SECONDS)
+# Shortest coordinator interval, refreshes that are due together run together
+MIN_REFRESH_DELAY = 1  # seconds
 
 
 @dataclass
@@ -48,16 +68,87 @@ class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{device_id}",
-            update_interval=timedelta(minutes=5),
+            update_interval=REFRESH_INTERVAL,
         )
-        self.speaker = speaker
         self.device_id = device_id
 
         # Initialize with empty data
         self.data = BoseCoordinatorData()
 
+        # Opt-in recording of every message, see journal.py
+        self.journal: MessageJournal | None = None
+
+        # Request, push and cache metrics, see metrics.py
+        self.metrics = SpeakerMetrics()
+
+        # Opt-in timing of all receivers, see watchdog.py
+        self.watchdog: ReceiverWatchdog | None = None
+
+        # Resources of entities that are refreshed on the coordinator's
+        # schedule instead of by notifications, see async_add_polled_consumer
+        self.polled_resources: Counter[str] = Counter()
+        # Resources refreshed by the last run of _async_update_data
+        self._refreshed: frozenset[str] = frozenset()
+        self.scheduler = RefreshScheduler()
+
+        # Requests of resources in flight, shared by all callers of async_get
+        self._in_flight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+        # Round-trip probe of the connection, see health.py
+        self.probe = ConnectionProbe(hass, self)
+
+        # Resources the speaker is subscribed to, see subscription.py
+        self.subscriptions = SubscriptionManager(hass, self)
+
+        # Receivers of entities with their ID on the current connection, and
+        # entities to tell about a new connection, see async_attach_receiver
+        self._receivers: dict[object, tuple[Callable[[Any], None], int]] = {}
+        self._reconnect_listeners: list[CALLBACK_TYPE] = []
+
+        self.use_speaker(speaker)
+
+    def use_speaker(self, speaker: BoseSpeaker) -> None:
+        """Use a (new) connection to the speaker, e.g. after a reconnect."""
+        previous: BoseSpeaker | None = getattr(self, "speaker", None)
+        self.speaker = speaker
+
         # Attach receiver to cache messages
-        self.speaker.attach_receiver(self._cache_message)  # type: ignore[arg-type]
+        speaker.attach_receiver(self._cache_message)  # type: ignore[arg-type]
+        self.metrics.instrument(speaker)
+        if self.watchdog is not None:
+            self.watchdog.attach(speaker)
+
+        # Move the receivers of the entities to the new connection
+        for key, (receiver, receiver_id) in list(self._receivers.items()):
+            if previous is not None:
+                previous.detach_receiver(receiver_id)
+            self._receivers[key] = (receiver, speaker.attach_receiver(receiver))
+
+        if previous is not None and previous is not speaker:
+            self.probe.reset()
+            # Changes while disconnected were not notified
+            self.data.cached_messages.clear()
+            for listener in list(self._reconnect_listeners):
+                listener()
+
+    @callback
+    def async_attach_receiver(self, receiver: Callable[[Any], None]) -> CALLBACK_TYPE:
+        """Attach a receiver to the speaker across reconnects until removed."""
+        key = object()
+        self._receivers[key] = (receiver, self.speaker.attach_receiver(receiver))
+
+        @callback
+        def _detach() -> None:
+            if (entry := self._receivers.pop(key, None)) is not None:
+                self.speaker.detach_receiver(entry[1])
+
+        return _detach
+
+    @callback
+    def async_add_reconnect_listener(self, listener: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call listener after each switch to a new connection to the speaker."""
+        self._reconnect_listeners.append(listener)
+        return lambda: self._reconnect_listeners.remove(listener)
 
     def _cache_message(self, data: dict[str, Any] | Any) -> None:
         """Cache incoming messages from the speaker."""
@@ -69,11 +160,23 @@ class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
                 data = data.__dict__
             else:
                 _LOGGER.debug("Received non-dict message that couldn't be converted")
+                self.metrics.record_parse_failure(None)
                 return
 
-        resource = data.get("header", {}).get("resource")
+        if self.journal is not None:
+            self.journal.record(data)
+
+        header = data.get("header", {})
+        resource = header.get("resource")
         body = data.get("body", {})
 
+        # Results of the getters below are cached without a message type
+        if "msgtype" in header:
+            if not resource or not isinstance(body, dict):
+                self.metrics.record_parse_failure(resource)
+            else:
+                self.metrics.record_push(resource)
+
         if resource:
             cached = CachedMessage(
                 resource=resource,
@@ -83,6 +186,27 @@ class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
             self.data.cached_messages[resource] = cached
             _LOGGER.debug("Cached message for resource: %s", resource)
 
+    async def async_set_journal(self, enabled: bool) -> None:
+        """Start or stop recording the messages of the speaker."""
+        if enabled and self.journal is None:
+            self.journal = MessageJournal(self.hass, self.device_id)
+            self.journal.async_start()
+        elif not enabled and self.journal is not None:
+            journal, self.journal = self.journal, None
+            await journal.async_stop()
+
+    def set_receiver_watchdog(self, threshold: float | None) -> None:
+        """Time all receivers against a threshold in seconds, or stop with None."""
+        if threshold is None:
+            if self.watchdog is not None:
+                self.watchdog.detach()
+                self.watchdog = None
+        elif self.watchdog is None:
+            self.watchdog = ReceiverWatchdog(threshold)
+            self.watchdog.attach(self.speaker)
+        else:
+            self.watchdog.threshold = threshold
+
     def _convert_to_dict(self, obj: Any) -> dict[str, Any]:
         """Convert pybose response objects to dict."""
         if isinstance(obj, dict):
@@ -101,156 +225,191 @@ class BoseCoordinator(DataUpdateCoordinator[BoseCoordinatorData]):
 
         cached = self.data.cached_messages[resource]
         age = (datetime.now() - cached.timestamp).total_seconds()
-        return age < CACHE_EXPIRY_SECONDS
+        registered = RESOURCES.get(resource)
+        return age < (registered.ttl if registered else CACHE_EXPIRY_SECONDS)
 
     def get_cached_data(self, resource: str) -> dict[str, Any] | None:
         """Get cached data if available and valid."""
         if self._is_cache_valid(resource):
             _LOGGER.debug("Returning cached data for resource: %s", resource)
+            self.metrics.record_cache(resource, hit=True)
             return self.data.cached_messages[resource].body
+        self.metrics.record_cache(resource, hit=False)
         return None
 
-    async def get_audio_volume(self) -> dict[str, Any]:
-        """Get audio volume with caching."""
-        resource = "/audio/volume"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh audio volume data")
-        result = await self.speaker.get_audio_volume()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
-
-    async def get_now_playing(self) -> dict[str, Any]:
-        """Get now playing with caching."""
-        resource = "/content/nowPlaying"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh now playing data")
-        result = await self.speaker.get_now_playing()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
-
-    async def get_battery_status(self) -> dict[str, Any]:
-        """Get battery status with caching."""
-        resource = "/system/battery"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh battery status data")
-        result = await self.speaker.get_battery_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+    async def async_get(self, path: str) -> dict[str, Any]:
+        """Return the body of a resource, cached, see resources.py.
 
-    async def get_bluetooth_sink_status(self) -> dict[str, Any]:
-        """Get Bluetooth sink status with caching."""
-        resource = "/bluetooth/sink/status"
-        cached = self.get_cached_data(resource)
+        Callers missing the cache while a request for the resource is in
+        flight wait for that request instead of sending their own.
+        """
+        cached = self.get_cached_data(path)
         if cached is not None:
             return cached
+        return await self._async_request(path)
+
+    async def _async_request(self, path: str) -> dict[str, Any]:
+        """Request a resource, or wait for the request already in flight."""
+        if (task := self._in_flight.get(path)) is None:
+            task = self._in_flight[path] = self.hass.async_create_task(
+                self._request_resource(RESOURCES[path]),
+                f"Bose fetch {path} of {self.device_id}",
+            )
+            task.add_done_callback(lambda _: self._in_flight.pop(path, None))
+        # One caller being cancelled must not cancel the others
+        return await asyncio.shield(task)
+
+    async def _request_resource(self, resource: BoseResource) -> dict[str, Any]:
+        """Request a resource from the speaker and cache it."""
+        _LOGGER.debug("Fetching fresh data for resource: %s", resource.path)
+        result = await getattr(self.speaker, cast(str, resource.getter))(
+            *resource.args
+        )
+        body = (
+            resource.parser(result)
+            if resource.parser is not None
+            else self._convert_to_dict(result)
+        )
+        self._cache_message({"header": {"resource": resource.path}, "body": body})
+        return body
+
+    def _getters(self) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """Return the cached getter of every resource the speaker supports."""
+        return {
+            path: functools.partial(self.async_get, path)
+            for path, resource in RESOURCES.items()
+            if resource.getter is not None and resource.supported(self.speaker)
+        }
+
+    async def async_prefetch(self) -> None:
+        """Warm the cache before the entities are set up.
+
+        Entities read their first state through the getters above, so one pass
+        here with a few requests in flight replaces the burst of requests of
+        all entities starting at once.
+        """
+        start = time.monotonic()
+        getters = self._getters()
+        fetched = await self._async_fetch_all(getters)
+        _LOGGER.debug(
+            "Prefetched %d of %d resources of %s in %.2f s",
+            len(fetched),
+            len(getters),
+            self.device_id,
+            time.monotonic() - start,
+        )
 
-        _LOGGER.debug("Fetching fresh Bluetooth sink status data")
-        result = await self.speaker.get_bluetooth_sink_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
-
-    async def get_bluetooth_sink_list(self) -> dict[str, Any]:
-        """Get Bluetooth sink list with caching."""
-        resource = "/bluetooth/sink/list"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh Bluetooth sink list data")
-        result = await self.speaker.get_bluetooth_sink_list()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
-
-    async def get_bluetooth_source_status(self) -> dict[str, Any]:
-        """Get Bluetooth source status with caching."""
-        resource = "/bluetooth/source/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh Bluetooth source status data")
-        result = await self.speaker.get_bluetooth_source_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
-
-    async def get_wifi_status(self) -> dict[str, Any]:
-        """Get WiFi status with caching."""
-        resource = "/network/wifi/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
+    async def _async_fetch_all(
+        self, plan: dict[str, Callable[[], Awaitable[Any]]]
+    ) -> set[str]:
+        """Run getters with a few requests in flight; returns the fetched ones."""
+        semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+        async def _fetch(resource: str, getter: Callable[[], Awaitable[Any]]) -> bool:
+            async with semaphore:
+                try:
+                    await getter()
+                except Exception:  # noqa: BLE001
+                    _LOGGER.debug("Failed to fetch %s", resource, exc_info=True)
+                    return False
+                return True
+
+        results = await asyncio.gather(
+            *(_fetch(resource, getter) for resource, getter in plan.items())
+        )
+        return {
+            resource for resource, fetched in zip(plan, results, strict=True) if fetched
+        }
+
+    @callback
+    def async_add_polled_consumer(
+        self, update_callback: CALLBACK_TYPE, resources: tuple[str, ...]
+    ) -> CALLBACK_TYPE:
+        """Refresh resources on schedule, call update_callback when one was.
+
+        The consumer reads the refreshed bodies with cached_body, not through
+        the getters, so it doesn't request them again outside the schedule.
+        """
+        self.polled_resources.update(resources)
+
+        @callback
+        def _handle_refresh() -> None:
+            if not self._refreshed.isdisjoint(resources):
+                update_callback()
+
+        remove_listener = self.async_add_listener(_handle_refresh)
+
+        @callback
+        def _remove() -> None:
+            self.polled_resources.subtract(resources)
+            self.scheduler.forget(
+                resource
+                for resource in resources
+                if not self.polled_resources[resource]
+            )
+            remove_listener()
 
-        _LOGGER.debug("Fetching fresh WiFi status data")
-        result = await self.speaker.get_wifi_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+        return _remove
 
-    async def get_network_status(self) -> dict[str, Any]:
-        """Get network status with caching."""
-        resource = "/network/status"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
+    def cached_body(self, resource: str) -> dict[str, Any] | None:
+        """Return the cached body of a resource, however old, without metrics."""
+        cached = self.data.cached_messages.get(resource)
+        return cached.body if cached is not None else None
 
-        _LOGGER.debug("Fetching fresh network status data")
-        result = await self.speaker.get_network_status()
-        result_dict = self._convert_to_dict(result)
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
+    @property
+    def on_battery(self) -> bool:
+        """Return True if the speaker last reported running on battery."""
+        battery = self.cached_body("/system/battery")
+        return battery is not None and battery.get("chargerConnected") != "CONNECTED"
 
-    async def get_active_groups(self) -> list[dict[str, Any]]:
-        """Get active groups with caching."""
-        resource = "/grouping/activeGroups"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached.get("activeGroups", [])
+    @property
+    def standby(self) -> bool:
+        """Return True if the speaker last reported being off."""
+        power = self.cached_body("/system/power/control")
+        return power is not None and power.get("power") != "ON"
 
-        _LOGGER.debug("Fetching fresh active groups data")
-        result = await self.speaker.get_active_groups()
-        result_list = [self._convert_to_dict(item) for item in result]
-        self._cache_message(
+    async def _async_update_data(self) -> BoseCoordinatorData:
+        """Refresh the resources of entities that notifications don't keep current.
+
+        The coordinator only schedules refreshes while such entities are
+        added, and each resource is requested once however many entities
+        read it. Which resources are due and the time until the next run come
+        from the adaptive schedule, see scheduler.py.
+        """
+        getters = self._getters()
+        resources = [
+            resource
+            for resource, count in self.polled_resources.items()
+            if count and resource in getters
+        ]
+        self._refreshed = frozenset()
+        due = self.scheduler.due(resources, time.monotonic())
+        # Bypass the cache, but keep the cached bodies if a request fails
+        refreshed = await self._async_fetch_all(
             {
-                "header": {"resource": resource},
-                "body": {"activeGroups": result_list},
+                resource: functools.partial(self._async_request, resource)
+                for resource in due
             }
         )
-        return result_list
-
-    async def get_sources(self) -> dict[str, Any]:
-        """Get sources (not cached, as it's needed less frequently)."""
-        result = await self.speaker.get_sources()
-        return self._convert_to_dict(result)
 
-    async def get_audio_setting(self, option: str) -> dict[str, Any]:
-        """Get audio setting with caching."""
-        resource = f"/audio/{option}"
-        cached = self.get_cached_data(resource)
-        if cached is not None:
-            return cached
-
-        _LOGGER.debug("Fetching fresh audio setting data for %s", option)
-        result = await self.speaker.get_audio_setting(option)
-        result_dict = dict(result) if hasattr(result, "__iter__") else {"value": result}
-        self._cache_message({"header": {"resource": resource}, "body": result_dict})
-        return result_dict
-
-    async def _async_update_data(self) -> BoseCoordinatorData:
-        """Fetch data from speaker."""
+        now = time.monotonic()
+        on_battery, standby = self.on_battery, self.standby
+        for resource in due:
+            # A failed request is retried after the current interval
+            self.scheduler.record(
+                resource,
+                self.cached_body(resource) if resource in refreshed else None,
+                now,
+                on_battery=on_battery,
+                standby=standby,
+            )
+        delay = self.scheduler.next_due(resources, now)
+        self.update_interval = (
+            timedelta(seconds=max(MIN_REFRESH_DELAY, delay))
+            if delay is not None
+            else REFRESH_INTERVAL
+        )
         self.data.last_update = datetime.now()
+        # Only the consumers of these are told about the run
+        self._refreshed = frozenset(refreshed)
         return self.data
@@ -0,0 +1,52 @@
+"""Diagnostics support for Bose."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .auth import TOKEN_KEYS
+from .const import DOMAIN
+from .coordinator import BoseCoordinator
+
+# Entries keep their tokens in the data until the first setup moves them
+TO_REDACT = {"mail", "bose_person_id", "serial", "serialNumber", "ip", *TOKEN_KEYS}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+    coordinator: BoseCoordinator | None = data.get("coordinator")
+    speaker = data.get("speaker")
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "system_info": async_redact_data(
+            dict(data.get("system_info") or {}), TO_REDACT
+        ),
+        "connected": speaker.is_connected() if speaker is not None else None,
+        "cached_resources": (
+            sorted(coordinator.data.cached_messages) if coordinator is not None else []
+        ),
+        "metrics": coordinator.metrics.as_dict() if coordinator is not None else None,
+        "probe": coordinator.probe.as_dict() if coordinator is not None else None,
+        "refresh_schedule": (
+            coordinator.scheduler.as_dict() if coordinator is not None else None
+        ),
+        "subscriptions": (
+            coordinator.subscriptions.as_dict() if coordinator is not None else None
+        ),
+        "receiver_watchdog": (
+            coordinator.watchdog.as_dict()
+            if coordinator is not None and coordinator.watchdog is not None
+            else None
+        ),
+    }
@@ -1,27 +1,109 @@
 """Base entity for Bose integration."""
 
-from typing import cast
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
 
 from propcache.api import cached_property
 from pybose.BoseSpeaker import BoseSpeaker
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 
 from .const import DOMAIN
+from .resources import RESOURCES
+
+if TYPE_CHECKING:
+    from .coordinator import BoseCoordinator
 
 
 class BoseBaseEntity(Entity):
     """Base entity for Bose integration."""
 
     _cf_unique_id: str | None = None
+    # Resources whose notifications the entity handles, see subscription.py
+    _consumed_resources: tuple[str, ...] = ()
+    # Whether the coordinator also refreshes the resources on its schedule,
+    # for values that change without a notification. Resources the speaker
+    # doesn't notify at all (push=False in resources.py) are refreshed
+    # anyway. No entity polls on its own.
+    _also_polled = False
+    _attr_should_poll = False
 
     def __init__(self, speaker: BoseSpeaker) -> None:
         """Initialize the entity."""
         self.speaker = speaker
+        self._receivers: list[Callable[[dict[str, Any]], None]] = []
 
         self._attr_has_entity_name = True
 
+    def _entry_coordinator(self) -> BoseCoordinator | None:
+        """Return the coordinator of the entity's config entry."""
+        config_entry: ConfigEntry | None = self.platform.config_entry
+        if config_entry is None:
+            return None
+        data = self.hass.data[DOMAIN].get(config_entry.entry_id, {})
+        return data.get("coordinator")
+
+    async def async_added_to_hass(self) -> None:
+        """Register the consumed resources while the entity is added."""
+        await super().async_added_to_hass()
+        if not self._consumed_resources:
+            return
+        if (coordinator := self._entry_coordinator()) is None:
+            return
+        self.async_on_remove(
+            coordinator.subscriptions.async_add_consumer(self._consumed_resources)
+        )
+        if self._also_polled or any(
+            resource in RESOURCES and not RESOURCES[resource].push
+            for resource in self._consumed_resources
+        ):
+            self.async_on_remove(
+                coordinator.async_add_polled_consumer(
+                    self._handle_coordinator_refresh, self._consumed_resources
+                )
+            )
+
+    @callback
+    def _handle_coordinator_refresh(self) -> None:
+        """Hand the refreshed resources in the coordinator cache to the receivers."""
+        if (coordinator := self._entry_coordinator()) is None:
+            return
+        for resource in self._consumed_resources:
+            if (body := coordinator.cached_body(resource)) is None:
+                continue
+            message = {"header": {"resource": resource}, "body": body}
+            for receiver in self._receivers:
+                receiver(message)
+
+    def _attach_receiver(self, receiver: Callable[[dict[str, Any]], None]) -> None:
+        """Attach a message receiver to the speaker until the entity is removed.
+
+        The coordinator moves the receiver to the new connection after a
+        reconnect, and the entity then fetches its state again.
+        """
+        self._receivers.append(receiver)
+        if (coordinator := self._entry_coordinator()) is None:
+            speaker = self.speaker
+            receiver_id = speaker.attach_receiver(receiver)
+            self.async_on_remove(lambda: speaker.detach_receiver(receiver_id))
+            return
+        self.async_on_remove(coordinator.async_attach_receiver(receiver))
+        self.async_on_remove(
+            coordinator.async_add_reconnect_listener(self._handle_reconnect)
+        )
+
+    @callback
+    def _handle_reconnect(self) -> None:
+        """Use the new connection and fetch the state missed while disconnected."""
+        if (coordinator := self._entry_coordinator()) is not None:
+            self.speaker = coordinator.speaker
+        self.async_schedule_update_ha_state(force_refresh=True)
+
     @cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device info of the entity."""
@@ -0,0 +1,100 @@
+"""Handoff of validated speaker connections from the config flow to setup.
+
+The config flow connects to a speaker and fetches its system info before
+creating the entry. Instead of dropping that connection, it is kept for a
+short time so the first setup of the entry can reuse it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from pybose.BoseResponse import Capabilities, SystemInfo
+from pybose.BoseSpeaker import BoseSpeaker
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import _LOGGER, DOMAIN
+
+# How long a connection from the config flow is kept for the entry setup
+HANDOFF_TIMEOUT = 60  # seconds
+
+
+@dataclass
+class SpeakerHandoff:
+    """A connected speaker handed from the config flow to the entry setup."""
+
+    speaker: BoseSpeaker
+    system_info: SystemInfo
+    capabilities: Capabilities
+    cancel_expiry: Callable[[], None]
+
+
+async def _async_disconnect(speaker: BoseSpeaker) -> None:
+    """Disconnect a speaker that is no longer needed."""
+    try:
+        await speaker.disconnect()
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Failed to disconnect unused speaker connection")
+
+
+@callback
+def async_discard_speaker(hass: HomeAssistant, speaker: BoseSpeaker) -> None:
+    """Disconnect a speaker connection in the background."""
+    hass.async_create_background_task(
+        _async_disconnect(speaker), "Bose disconnect unused speaker"
+    )
+
+
+@callback
+def async_store_handoff(
+    hass: HomeAssistant,
+    speaker: BoseSpeaker,
+    system_info: SystemInfo,
+    capabilities: Capabilities,
+) -> None:
+    """Keep a connected speaker for the setup of its config entry."""
+    handoffs: dict[str, SpeakerHandoff] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "handoff", {}
+    )
+    guid = speaker.get_device_id()
+    if guid is None:
+        async_discard_speaker(hass, speaker)
+        return
+
+    if (previous := handoffs.pop(guid, None)) is not None:
+        previous.cancel_expiry()
+        async_discard_speaker(hass, previous.speaker)
+
+    @callback
+    def _expire(_now: datetime) -> None:
+        """Drop the connection if no setup picked it up."""
+        if (handoff := handoffs.pop(guid, None)) is not None:
+            _LOGGER.debug("Dropping unused speaker connection for %s", guid)
+            async_discard_speaker(hass, handoff.speaker)
+
+    handoffs[guid] = SpeakerHandoff(
+        speaker=speaker,
+        system_info=system_info,
+        capabilities=capabilities,
+        cancel_expiry=async_call_later(hass, HANDOFF_TIMEOUT, _expire),
+    )
+
+
+@callback
+def async_pop_handoff(hass: HomeAssistant, guid: str) -> SpeakerHandoff | None:
+    """Return the connected speaker left by the config flow, if still usable."""
+    handoff: SpeakerHandoff | None = (
+        hass.data.get(DOMAIN, {}).get("handoff", {}).pop(guid, None)
+    )
+    if handoff is None:
+        return None
+
+    handoff.cancel_expiry()
+    if not handoff.speaker.is_connected():
+        async_discard_speaker(hass, handoff.speaker)
+        return None
+    return handoff
@@ -0,0 +1,179 @@
+"""Periodic round-trip probe of the speaker connection.
+
+``speaker.is_connected()`` stays true on a half-open socket: the speaker is
+gone, but nothing was sent that could fail. The probe sends a WebSocket
+ping every few seconds and records the round-trip time and its jitter
+(smoothed like RFC 3550). After a few failed probes in a row the connection
+is considered unhealthy and the reconnection monitor is woken up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import _LOGGER
+from .metrics import RollingHistogram
+
+if TYPE_CHECKING:
+    from .coordinator import BoseCoordinator
+
+PROBE_INTERVAL = timedelta(seconds=10)
+# A probe without pong within this time has failed
+PROBE_TIMEOUT = 5  # seconds
+# Failed probes in a row after which the connection is unhealthy
+PROBE_FAILURES_UNHEALTHY = 2
+
+
+class ConnectionProbe:
+    """Ping a speaker periodically and keep its round-trip statistics."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: BoseCoordinator) -> None:
+        """Initialize the probe."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.rtt = RollingHistogram()
+        self.last_rtt: float | None = None
+        self.jitter = 0.0
+        self.probes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self._unhealthy = asyncio.Event()
+        self._probing = False
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def healthy(self) -> bool:
+        """Return False after PROBE_FAILURES_UNHEALTHY failed probes in a row."""
+        return self.consecutive_failures < PROBE_FAILURES_UNHEALTHY
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start probing; returns a callback that stops it."""
+        return async_track_time_interval(
+            self.hass,
+            self._async_probe_due,
+            PROBE_INTERVAL,
+            name=f"Bose connection probe {self.coordinator.device_id}",
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call update_callback after every probe."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    async def async_wait_for_failure(self, timeout: float) -> None:
+        """Wait until the connection turns unhealthy, at most timeout seconds."""
+        try:
+            async with asyncio.timeout(timeout):
+                await self._unhealthy.wait()
+        except TimeoutError:
+            return
+        self._unhealthy.clear()
+
+    @callback
+    def reset(self) -> None:
+        """Forget the failures of the previous connection after a reconnect."""
+        self.consecutive_failures = 0
+        self.last_rtt = None
+        self._unhealthy.clear()
+
+    @callback
+    def _async_probe_due(self, _now: datetime) -> None:
+        """Start a probe unless the previous one is still running."""
+        if not self._probing:
+            self.hass.async_create_background_task(
+                self.async_probe(),
+                f"Bose connection probe {self.coordinator.device_id}",
+            )
+
+    async def async_probe(self) -> float | None:
+        """Ping the speaker once and return the round-trip time in seconds."""
+        self._probing = True
+        speaker = self.coordinator.speaker
+        websocket = speaker._websocket  # noqa: SLF001
+        start = time.perf_counter()
+        rtt: float | None = None
+        error: Exception | None = None
+        try:
+            if websocket is None:
+                raise ConnectionError("Not connected")
+            async with asyncio.timeout(PROBE_TIMEOUT):
+                pong_waiter = await websocket.ping()
+                await pong_waiter
+        except Exception as err:  # noqa: BLE001
+            error = err
+        else:
+            rtt = time.perf_counter() - start
+        finally:
+            self._probing = False
+
+        if speaker is not self.coordinator.speaker:
+            # Started before a reconnect, it says nothing about the new socket
+            return None
+        if error is not None:
+            self._record_failure(error)
+        elif rtt is not None:
+            self._record_rtt(rtt)
+        for update_callback in list(self._listeners):
+            update_callback()
+        return rtt
+
+    def _record_rtt(self, rtt: float) -> None:
+        """Record a successful probe."""
+        self.probes += 1
+        if self.last_rtt is not None:
+            self.jitter += (abs(rtt - self.last_rtt) - self.jitter) / 16
+        self.last_rtt = rtt
+        self.rtt.add(rtt)
+        if not self.healthy:
+            _LOGGER.info(
+                "Speaker %s is responding again after %d failed probes",
+                self.coordinator.device_id,
+                self.consecutive_failures,
+            )
+        self.consecutive_failures = 0
+
+    def _record_failure(self, err: Exception) -> None:
+        """Record a failed probe and report an unhealthy connection."""
+        self.probes += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_rtt = None
+        _LOGGER.debug(
+            "Probe of speaker %s failed: %s", self.coordinator.device_id, repr(err)
+        )
+        if not self.healthy:
+            if self.consecutive_failures == PROBE_FAILURES_UNHEALTHY:
+                _LOGGER.warning(
+                    "Speaker %s did not answer %d probes in a row",
+                    self.coordinator.device_id,
+                    self.consecutive_failures,
+                )
+            self._unhealthy.set()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the probe statistics for diagnostics."""
+        return {
+            "healthy": self.healthy,
+            "probes": self.probes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_rtt_ms": (
+                round(self.last_rtt * 1000, 1) if self.last_rtt is not None else None
+            ),
+            "jitter_ms": round(self.jitter * 1000, 1),
+            "rtt": self.rtt.summary(),
+        }
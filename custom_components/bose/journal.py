@@ -0,0 +1,131 @@
+"""Opt-in journal of the messages received from a speaker.
+
+Every notification of the speaker is appended as one JSON line to
+``<config>/bose_journal/<guid>.ndjson.gz``. Each line holds the time of
+receipt (``t``, seconds since the epoch) and the raw message. The time is
+the wall-clock time the recording started plus the monotonic time since:
+within a recording, clock adjustments (NTP, DST) neither reorder nor stretch
+the lines, and consecutive recordings appended to one file stay in order
+unless the clock went back between them. Lines are buffered and written
+from the executor every few seconds; files are rotated by size.
+``tools/bose_fake`` can replay a journal against a fake speaker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import gzip
+import json
+from pathlib import Path
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import _LOGGER
+
+JOURNAL_DIR = "bose_journal"
+# Buffered lines are written to disk this often
+JOURNAL_FLUSH_INTERVAL = timedelta(seconds=5)
+# Size after which the journal is rotated and number of rotated files kept
+JOURNAL_MAX_BYTES = 5 * 1024 * 1024
+JOURNAL_BACKUP_COUNT = 3
+
+
+def journal_path(directory: Path, guid: str, index: int = 0) -> Path:
+    """Return the path of a journal file; rotated files have an index."""
+    if index:
+        return directory / f"{guid}.{index}.ndjson.gz"
+    return directory / f"{guid}.ndjson.gz"
+
+
+class MessageJournal:
+    """Buffered, rotating journal of the messages of one speaker."""
+
+    def __init__(self, hass: HomeAssistant, guid: str) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.guid = guid
+        self.directory = Path(hass.config.path(JOURNAL_DIR))
+        # Monotonic clock to wall-clock time at the start of the recording
+        self._epoch_offset = time.time() - time.monotonic()
+        self._pending: list[str] = []
+        self._lock = asyncio.Lock()
+        self._unsub_flush: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start writing buffered messages periodically."""
+        _LOGGER.info(
+            "Recording messages of %s to %s",
+            self.guid,
+            journal_path(self.directory, self.guid),
+        )
+        self._unsub_flush = async_track_time_interval(
+            self.hass, self._async_flush_due, JOURNAL_FLUSH_INTERVAL
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the periodic writes and write what is still buffered."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self.async_flush()
+
+    @callback
+    def record(self, message: dict[str, Any]) -> None:
+        """Buffer a notification with the time it was received."""
+        # Results of the getters are cached without a message type
+        if "msgtype" not in message.get("header", {}):
+            return
+        self._pending.append(
+            json.dumps(
+                {
+                    "t": round(time.monotonic() + self._epoch_offset, 6),
+                    "message": message,
+                },
+                separators=(",", ":"),
+                default=str,
+            )
+        )
+
+    @callback
+    def _async_flush_due(self, _now: datetime) -> None:
+        """Write the buffer when the flush interval elapsed."""
+        if self._pending:
+            self.hass.async_create_background_task(
+                self.async_flush(), f"Write Bose journal of {self.guid}"
+            )
+
+    async def async_flush(self) -> None:
+        """Write the buffered messages to disk."""
+        async with self._lock:
+            lines, self._pending = self._pending, []
+            if lines:
+                await self.hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the journal, rotating it when it got too large."""
+        path = journal_path(self.directory, self.guid)
+        try:
+            self.directory.mkdir(exist_ok=True)
+            if path.exists() and path.stat().st_size >= JOURNAL_MAX_BYTES:
+                self._rotate()
+            # Every append adds a gzip member; readers see one stream
+            with gzip.open(path, "at", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        except OSError as err:
+            _LOGGER.error("Failed to write journal of %s: %s", self.guid, err)
+
+    def _rotate(self) -> None:
+        """Shift the rotated journal files by one, dropping the oldest."""
+        journal_path(self.directory, self.guid, JOURNAL_BACKUP_COUNT).unlink(
+            missing_ok=True
+        )
+        for index in range(JOURNAL_BACKUP_COUNT - 1, -1, -1):
+            source = journal_path(self.directory, self.guid, index)
+            if source.exists():
+                source.rename(journal_path(self.directory, self.guid, index + 1))
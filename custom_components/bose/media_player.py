@@ -1,6 +1,7 @@
 """Support for Bose media player."""
 
 import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from pybose.BoseResponse import (
@@ -8,7 +9,6 @@ from pybose.BoseResponse import (
     BluetoothSinkList,
     BluetoothSinkStatus,
     BluetoothSourceStatus,
-    ContentNowPlaying,
     SystemInfo,
 )
 from pybose.BoseSpeaker import BoseSpeaker
@@ -26,15 +26,16 @@ from homeassistant.components.media_player import (
     async_process_play_media_url,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-import homeassistant.helpers.entity_registry as er
 from homeassistant.util import dt as dt_util
 
 from .const import _LOGGER, CONF_CHROMECAST_AUTO_ENABLE, DOMAIN
 from .coordinator import BoseCoordinator
 from .entity import BoseBaseEntity
+from .now_playing import NowPlaying
+from .topology import async_get_topology
 
 
 async def async_setup_entry(
@@ -82,7 +83,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         self._attr_media_duration = None
         self._attr_media_position = None
         self._attr_media_position_updated_at = None
-        self._now_playing_result = ContentNowPlaying({})
+        self._now_playing: NowPlaying | None = None
         self._attr_group_members = []
         self._attr_source_list: list[str] = []
         self._active_group_id = None
@@ -102,9 +103,30 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         self._source_renames: dict[str, str] = {}
         self._config_entry = config_entry
 
-        speaker.attach_receiver(self.parse_message)
+        # Parsers of the notification bodies the media player handles
+        self._message_parsers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "/audio/volume": lambda body: self._parse_audio_volume(
+                AudioVolume(body)
+            ),
+            "/bluetooth/sink/list": lambda body: self._parse_bluetooth_sink_list(
+                BluetoothSinkList(body)
+            ),
+            "/bluetooth/sink/status": lambda body: self._parse_bluetooth_sink_status(
+                BluetoothSinkStatus(body)
+            ),
+            "/bluetooth/source/status": (
+                lambda body: self._parse_bluetooth_source_status(
+                    BluetoothSourceStatus(body)
+                )
+            ),
+            # Looked up per message, the profiler replaces the _parse_ methods
+            "/content/nowPlaying": lambda body: self._parse_now_playing(body),
+            "/grouping/activeGroups": lambda body: self._parse_grouping(body),
+            "/system/power/control": lambda body: self._parse_power(body),
+        }
+        self._consumed_resources = tuple(self._message_parsers)
 
-        hass.async_create_task(self.async_update())
+        self._topology = async_get_topology(hass)
 
         if "media_entities" not in hass.data[DOMAIN]:
             hass.data[DOMAIN]["media_entities"] = {}
@@ -120,6 +142,20 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
         self._setup_linked_player_listeners()
 
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the state once the entity is added."""
+        await super().async_added_to_hass()
+        self._attach_receiver(self.parse_message)
+        self.async_on_remove(
+            self._topology.async_add_player(
+                self._device_id,
+                self.entity_id,
+                self.coordinator,
+                self._async_group_changed,
+            )
+        )
+        self.async_schedule_update_ha_state(force_refresh=True)
+
     def _load_linked_media_players(self) -> None:
         """Load linked media players and source renames from config entry options."""
         options = self._config_entry.options
@@ -249,98 +285,70 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
     def parse_message(self, data):
         """Parse the message from the speaker."""
-
-        resource = data.get("header", {}).get("resource")
-        body = data.get("body", {})
-        if resource == "/audio/volume":
-            self._parse_audio_volume(AudioVolume(body))
-        elif resource == "/system/power/control":
-            self._is_on = body.get("power") == "ON"
-            if not self._is_on:
-                self._attr_state = MediaPlayerState.OFF
-        elif resource == "/content/nowPlaying":
-            self._parse_now_playing(ContentNowPlaying(body))
-        elif resource == "/grouping/activeGroups":
-            self._parse_grouping(body)
-        elif resource == "/bluetooth/sink/list":
-            self._parse_bluetooth_sink_list(BluetoothSinkList(body))
-        elif resource == "/bluetooth/sink/status":
-            self._parse_bluetooth_sink_status(BluetoothSinkStatus(body))
-        elif resource == "/bluetooth/source/status":
-            self._parse_bluetooth_source_status(BluetoothSourceStatus(body))
-
-        self.async_write_ha_state()
-
-    def _parse_grouping(self, data: dict):
-        active_groups = data.get("activeGroups", {})
-
-        if len(active_groups) == 0:
-            self._attr_group_members = []
-            self._active_group_id = None
-            return
-
-        active_group = active_groups[0]
-
-        guids = [
-            product.get("productId", None) for product in active_group.get("products")
-        ]
-
-        if len(guids) == 0:
-            self._attr_group_members = []
-            self._active_group_id = None
+        parser = self._message_parsers.get(data.get("header", {}).get("resource"))
+        if parser is None:
             return
+        parser(data.get("body", {}))
+        self.async_write_ha_state()
 
-        guids.sort(
-            key=lambda guid: guid == active_group.get("groupMasterId"), reverse=True
-        )
-
-        entity_ids = [
-            self.hass.data[DOMAIN]["media_entities"][guid].entity_id for guid in guids
-        ]
+    def _parse_power(self, data: dict):
+        self._is_on = data.get("power") == "ON"
+        if not self._is_on:
+            self._attr_state = MediaPlayerState.OFF
 
-        self._attr_group_members = entity_ids
-        self._active_group_id = active_group.get("activeGroupId")
+    def _parse_grouping(self, data: dict):
+        self._topology.async_update(self._device_id, data.get("activeGroups") or [])
+        self._read_group()
+
+    def _read_group(self) -> None:
+        """Read the group of the speaker from the shared index."""
+        group = self._topology.group(self._device_id)
+        self._attr_group_members = self._topology.member_entity_ids(self._device_id)
+        self._active_group_id = group.group_id if group else None
+
+    @callback
+    def _async_group_changed(self) -> None:
+        """Show a change of the group another member reported."""
+        self._read_group()
+        self.async_write_ha_state()
 
     def _parse_audio_volume(self, data: AudioVolume):
         self._attr_volume_level = data.get("value", 0) / 100
         self._attr_is_volume_muted = data.get("muted")
 
-    def _parse_now_playing(self, data: ContentNowPlaying):
-        try:
-            status = data.get("state", {}).get("status")
-            match status:
-                case "PLAY":
-                    self._attr_state = MediaPlayerState.PLAYING
-                case "PAUSED":
-                    self._attr_state = MediaPlayerState.PAUSED
-                case "BUFFERING":
-                    self._attr_state = MediaPlayerState.BUFFERING
-                case "STOPPED" | None:
-                    if self._is_on:
-                        self._attr_state = MediaPlayerState.IDLE
-                    else:
-                        self._attr_state = MediaPlayerState.OFF
-                case _:
-                    _LOGGER.warning("State not implemented: %s", status)
-                    self._attr_state = MediaPlayerState.ON
-        except AttributeError:
-            self._attr_state = MediaPlayerState.ON
-
-        self._now_playing_result: ContentNowPlaying = data
-        self._attr_source = data.get("source", {}).get("sourceDisplayName", None)
+    def _parse_now_playing(self, data: dict[str, Any]):
+        now_playing = NowPlaying.from_body(data)
+        match now_playing.status:
+            case "PLAY":
+                self._attr_state = MediaPlayerState.PLAYING
+            case "PAUSED":
+                self._attr_state = MediaPlayerState.PAUSED
+            case "BUFFERING":
+                self._attr_state = MediaPlayerState.BUFFERING
+            case "STOPPED" | None:
+                if self._is_on:
+                    self._attr_state = MediaPlayerState.IDLE
+                else:
+                    self._attr_state = MediaPlayerState.OFF
+            case _:
+                _LOGGER.warning("State not implemented: %s", now_playing.status)
+                self._attr_state = MediaPlayerState.ON
+
+        # An empty body carries no playback state
+        self._now_playing = now_playing if data else None
+        self._attr_source = now_playing.source_name
 
         if self._attr_source == "Chromecast Built-in":
             return
 
         # Handle special case for TV source (needs to be determined before linked player check)
         if (
-            data.get("container", {}).get("contentItem", {}).get("source") == "PRODUCT"
-            and data.get("container", {}).get("contentItem", {}).get("sourceAccount")
-            == "TV"
+            now_playing.content_source == "PRODUCT"
+            and now_playing.content_account == "TV"
         ):
             self._attr_source = "TV"
 
-        if data.get("source", {}).get("sourceID") == "BLUETOOTH":
+        if now_playing.source_id == "BLUETOOTH":
             # Fetch active Bluetooth device asynchronously to avoid using await in sync parser
             if getattr(self, "hass", None) is not None:
                 self.hass.async_create_task(
@@ -348,17 +356,15 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                 )
         else:
             for name, source_data in self._available_sources.items():
-                if data.get("container", {}).get("contentItem", {}).get(
-                    "source"
-                ) == source_data.get("source"):
+                if now_playing.content_source == source_data.get("source"):
                     if source_data.get("source") in ("SPOTIFY", "AMAZON", "DEEZER"):
-                        if data.get("container", {}).get("contentItem", {}).get(
-                            "sourceAccount"
-                        ) != source_data.get("accountId"):
+                        if now_playing.content_account != source_data.get(
+                            "accountId"
+                        ):
                             continue
-                    elif source_data.get("sourceAccount") != data.get(
-                        "container", {}
-                    ).get("contentItem", {}).get("sourceAccount"):
+                    elif (
+                        source_data.get("sourceAccount") != now_playing.content_account
+                    ):
                         continue
 
                     self._attr_source = name
@@ -369,15 +375,13 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             self._update_from_linked_media_player(linked_entity_id)
             return
 
-        self._attr_media_title = data.get("metadata", {}).get("trackName")
-        self._attr_media_artist = data.get("metadata", {}).get("artist")
-        self._attr_media_album_name = data.get("metadata", {}).get("album")
-        self._attr_media_duration = int(data.get("metadata", {}).get("duration", 999))
-        self._attr_media_position = int(data.get("state", {}).get("timeIntoTrack", 0))
+        self._attr_media_title = now_playing.track_name
+        self._attr_media_artist = now_playing.artist
+        self._attr_media_album_name = now_playing.album
+        self._attr_media_duration = now_playing.duration
+        self._attr_media_position = now_playing.position
         self._attr_media_position_updated_at = dt_util.utcnow()
-        self._attr_media_image_url = (
-            data.get("track", {}).get("contentItem", {}).get("containerArt")
-        )
+        self._attr_media_image_url = now_playing.image_url
 
         if self._attr_source == "TV":
             self._attr_media_title = "TV"
@@ -462,7 +466,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
     async def _async_update_active_bluetooth_source(self) -> None:
         """Async helper to fetch active Bluetooth device and update source."""
         try:
-            status_dict = await self.coordinator.get_bluetooth_sink_status()
+            status_dict = await self.coordinator.async_get("/bluetooth/sink/status")
         except (ConnectionError, TimeoutError) as err:
             _LOGGER.debug("Failed to fetch active Bluetooth device: %s", err)
             return
@@ -490,28 +494,30 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
     async def async_update(self) -> None:
         """Fetch new state data from the speaker."""
-        data_dict = await self.coordinator.get_now_playing()
-        data = ContentNowPlaying(data_dict)
-        self._parse_now_playing(data)
+        self._parse_now_playing(
+            await self.coordinator.async_get("/content/nowPlaying")
+        )
 
-        volume_dict = await self.coordinator.get_audio_volume()
+        volume_dict = await self.coordinator.async_get("/audio/volume")
         volume_data = AudioVolume(volume_dict)
         self._parse_audio_volume(volume_data)
 
         # Refresh Bluetooth information
         try:
-            bluetooth_sink_status_dict = (
-                await self.coordinator.get_bluetooth_sink_status()
+            bluetooth_sink_status_dict = await self.coordinator.async_get(
+                "/bluetooth/sink/status"
             )
             bluetooth_sink_status = BluetoothSinkStatus(bluetooth_sink_status_dict)
             self._parse_bluetooth_sink_status(bluetooth_sink_status)
 
-            bluetooth_sink_list_dict = await self.coordinator.get_bluetooth_sink_list()
+            bluetooth_sink_list_dict = await self.coordinator.async_get(
+                "/bluetooth/sink/list"
+            )
             bluetooth_sink_list = BluetoothSinkList(bluetooth_sink_list_dict)
             self._parse_bluetooth_sink_list(bluetooth_sink_list)
 
-            bluetooth_source_status_dict = (
-                await self.coordinator.get_bluetooth_source_status()
+            bluetooth_source_status_dict = await self.coordinator.async_get(
+                "/bluetooth/source/status"
             )
             bluetooth_source_status = BluetoothSourceStatus(
                 bluetooth_source_status_dict
@@ -521,7 +527,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             _LOGGER.debug("Failed to get Bluetooth information: %s", err)
 
         # Refresh available sources (build human readable list)
-        sources = await self.coordinator.get_sources()
+        sources = await self.coordinator.async_get("/system/sources")
         for source in sources.get("sources", []):
             is_available = source.get("status") in ("AVAILABLE", "NOT_CONFIGURED")
             is_tv_source = (
@@ -564,8 +570,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
                 if "AUX" not in self._attr_source_list:
                     self._attr_source_list.append("AUX")
 
-        active_groups = await self.coordinator.get_active_groups()
-        self._parse_grouping({"activeGroups": active_groups})
+        self._parse_grouping(await self.coordinator.async_get("/grouping/activeGroups"))
 
         if self._has_linked_media_player():
             linked_entity_id = self._linked_media_players.get(self._attr_source)
@@ -636,7 +641,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
         result = await self.speaker.set_source(
             source_data.get("source", ""), source_data.get("sourceAccount", "")
         )
-        self._parse_now_playing(ContentNowPlaying(result))
+        self._parse_now_playing(dict(result))
 
     async def async_turn_on(self) -> None:
         """Turn on the speaker."""
@@ -937,30 +942,24 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
 
     async def async_join_players(self, group_members: list[str]) -> None:
         """Join `group_members` as a player group with the current player."""
-        registry = er.async_get(self.hass)
-        entities = [registry.async_get(entity_id) for entity_id in group_members]
-
-        guids = [
-            self.hass.data[DOMAIN][entity.config_entry_id]
-            .get("system_info", {})
-            .get("guid", None)
-            for entity in entities
-        ]
-
-        if self._active_group_id is not None:
-            master_id = (
-                self._attr_group_members[0] if self._attr_group_members else None
-            )
-
-            if master_id is not None and master_id != self.entity_id:
+        topology = self._topology
+        guids = []
+        for entity_id in group_members:
+            if (guid := topology.guid(entity_id)) is None:
+                _LOGGER.warning("%s is not a Bose speaker, not joining it", entity_id)
+            else:
+                guids.append(guid)
+
+        group = topology.group(self._device_id)
+        if self._active_group_id is not None and group is not None:
+            master = topology.speaker(group.master)
+
+            if master is not None and group.master != self._device_id:
                 _LOGGER.warning(
                     "Speakers can only join the master of the group, which is %s",
-                    master_id,
+                    topology.entity_id(group.master),
                 )
                 _LOGGER.warning("Running action on master speaker")
-                master: BoseSpeaker = self.hass.data[DOMAIN][
-                    registry.async_get(master_id).config_entry_id
-                ]["speaker"]
                 await master.add_to_active_group(self._active_group_id, guids)
                 return
 
@@ -972,28 +971,27 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
     async def async_unjoin_player(self) -> None:
         """Unjoin the player from a group."""
 
-        if not self._attr_group_members:
+        group = self._topology.group(self._device_id)
+        if group is None:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="not_in_group",
                 translation_placeholders={"entity_id": self.entity_id},
             )
 
-        master_entity_id = self._attr_group_members[0]
-
-        if self.entity_id == master_entity_id:
+        if group.master == self._device_id:
             await self.speaker.stop_active_groups()
         else:
-            master_entity = er.async_get(self.hass).async_get(master_entity_id)
-            if master_entity is None:
+            master_speaker = self._topology.speaker(group.master)
+            if master_speaker is None:
                 raise ServiceValidationError(
                     translation_domain=DOMAIN,
                     translation_key="master_not_found",
-                    translation_placeholders={"entity_id": master_entity_id},
+                    translation_placeholders={
+                        "entity_id": self._topology.entity_id(group.master)
+                        or group.master
+                    },
                 )
-            master_speaker = self.hass.data[DOMAIN][master_entity.config_entry_id][
-                "speaker"
-            ]
             await master_speaker.remove_from_active_group(
                 self._active_group_id, [self._device_id]
             )
@@ -1033,29 +1031,7 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the features supported by this media player."""
-        now = self._now_playing_result or {}
-
-        def _can(key: str) -> bool:
-            if isinstance(now, dict):
-                state = now.get("state") or {}
-                return bool(state.get(key, False))
-
-            state = getattr(now, "state", None)
-            if isinstance(state, dict):
-                return bool(state.get(key, False))
-
-            get_fn = getattr(now, "get", None)
-            if callable(get_fn):
-                try:
-                    state = get_fn("state", {})
-                except (AttributeError, TypeError):
-                    return False
-                if isinstance(state, dict):
-                    return bool(state.get(key, False))
-                return False
-
-            return bool(getattr(state, key, False))
-
+        now_playing = self._now_playing
         base_features = (
             MediaPlayerEntityFeature.TURN_OFF
             | MediaPlayerEntityFeature.TURN_ON
@@ -1067,20 +1043,12 @@ class BoseMediaPlayer(BoseBaseEntity, MediaPlayerEntity):
             | MediaPlayerEntityFeature.SELECT_SOURCE
         )
 
-        if not now:
+        if now_playing is None:
             return base_features
 
         return (
             base_features
-            | (MediaPlayerEntityFeature.NEXT_TRACK if _can("canSkipNext") else 0)
-            | (MediaPlayerEntityFeature.PAUSE if _can("canPause") else 0)
-            | (
-                MediaPlayerEntityFeature.PREVIOUS_TRACK
-                if _can("canSkipPrevious")
-                else 0
-            )
-            | (MediaPlayerEntityFeature.SEEK if _can("canSeek") else 0)
-            | (MediaPlayerEntityFeature.STOP if _can("canStop") else 0)
+            | now_playing.features
             | (
                 (
                     MediaPlayerEntityFeature.PLAY_MEDIA
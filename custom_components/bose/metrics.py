@@ -0,0 +1,307 @@
+"""Latency and throughput metrics of a speaker connection.
+
+The coordinator keeps one SpeakerMetrics per speaker. It times every request
+sent through pybose (so every get_* of the coordinator that misses the cache
+and every set_* command), counts pushed messages, cache hits and misses and
+reconnects. Samples are kept for a rolling window and summarized on demand
+for diagnostics and the diagnostic sensors.
+
+Pushed messages are also counted by resource, together with resources no
+entity handles, messages that could not be interpreted and exceptions
+raised by receivers. A receiver that raises is logged and counted instead
+of ending the receive loop of pybose.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+import functools
+import inspect
+import statistics
+import time
+from typing import Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+from .const import _LOGGER
+from .resources import RESOURCES
+
+# Samples older than this are dropped from the histograms
+METRICS_WINDOW = 15 * 60  # seconds
+# Upper bound of samples kept per histogram
+METRICS_MAX_SAMPLES = 500
+# Bucket upper bounds of the histograms in milliseconds, the last is open
+HISTOGRAM_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# Pushed messages are counted per second for this many seconds
+PUSH_RATE_WINDOW = 60  # seconds
+
+
+def receiver_name(receiver: Callable[..., Any]) -> str:
+    """Return the entity and method of a receiver, for logs and reports."""
+    receiver = inspect.unwrap(receiver)
+    owner = getattr(receiver, "__self__", None)
+    name = getattr(receiver, "__qualname__", None) or repr(receiver)
+    if (entity_id := getattr(owner, "entity_id", None)) is not None:
+        return f"{entity_id} {name}"
+    return name
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Return a percentile of sorted samples."""
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+class RollingHistogram:
+    """Durations of the last METRICS_WINDOW seconds."""
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self._samples: deque[tuple[float, float]] = deque(maxlen=METRICS_MAX_SAMPLES)
+        self.total = 0
+
+    def add(self, seconds: float) -> None:
+        """Add a duration."""
+        self._samples.append((time.monotonic(), seconds))
+        self.total += 1
+
+    def values(self) -> list[float]:
+        """Return the durations in the window, in seconds."""
+        cutoff = time.monotonic() - METRICS_WINDOW
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        return [seconds for _, seconds in self._samples]
+
+    def summary(self) -> dict[str, Any]:
+        """Return count, percentiles and bucket counts in milliseconds."""
+        samples = sorted(seconds * 1000 for seconds in self.values())
+        if not samples:
+            return {"count": 0, "total": self.total}
+
+        buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for sample in samples:
+            buckets[bisect_left(HISTOGRAM_BUCKETS_MS, sample)] += 1
+        labels = [f"<={bound}" for bound in HISTOGRAM_BUCKETS_MS]
+        labels.append(f">{HISTOGRAM_BUCKETS_MS[-1]}")
+        return {
+            "count": len(samples),
+            "total": self.total,
+            "mean_ms": round(statistics.fmean(samples), 1),
+            "p50_ms": round(_percentile(samples, 0.5), 1),
+            "p95_ms": round(_percentile(samples, 0.95), 1),
+            "max_ms": round(samples[-1], 1),
+            "buckets_ms": dict(zip(labels, buckets, strict=True)),
+        }
+
+
+class RateCounter:
+    """Events per second over the last PUSH_RATE_WINDOW seconds."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self._buckets: deque[list[int]] = deque(maxlen=PUSH_RATE_WINDOW)
+        self.total = 0
+
+    def add(self) -> None:
+        """Count an event."""
+        second = int(time.monotonic())
+        if self._buckets and self._buckets[-1][0] == second:
+            self._buckets[-1][1] += 1
+        else:
+            self._buckets.append([second, 1])
+        self.total += 1
+
+    def per_minute(self) -> float:
+        """Return the average number of events per minute in the window."""
+        cutoff = int(time.monotonic()) - PUSH_RATE_WINDOW
+        events = sum(count for second, count in self._buckets if second > cutoff)
+        return round(events * 60 / PUSH_RATE_WINDOW, 1)
+
+
+class SpeakerMetrics:
+    """Request, push, cache and connection metrics of one speaker."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.requests: dict[str, RollingHistogram] = {}
+        self.request_errors: Counter[str] = Counter()
+        self.pushes = RateCounter()
+        self.pushes_by_resource: Counter[str] = Counter()
+        self.unknown_resources: Counter[str] = Counter()
+        self.parse_failures: Counter[str] = Counter()
+        self.receiver_errors: Counter[str] = Counter()
+        self.cache_hits: Counter[str] = Counter()
+        self.cache_misses: Counter[str] = Counter()
+        self.reconnects = 0
+        self.reconnect_failures = 0
+        self.reconnect_times = RollingHistogram()
+        self._disconnected_at: float | None = None
+
+    def instrument(self, speaker: BoseSpeaker) -> None:
+        """Time the requests and reconnects and guard the receivers of a speaker."""
+        request = speaker._request  # noqa: SLF001
+        connect = speaker.connect
+
+        async def _timed_request(
+            resource: str, method: str, *args: Any, **kwargs: Any
+        ) -> Any:
+            key = f"{method} {resource}"
+            start = time.perf_counter()
+            try:
+                return await request(resource, method, *args, **kwargs)
+            except Exception:
+                self.request_errors[key] += 1
+                raise
+            finally:
+                self.record_request(key, time.perf_counter() - start)
+
+        # pybose reconnects by itself after the connection was closed
+        speaker._request = _timed_request  # type: ignore[method-assign]  # noqa: SLF001
+        speaker.connect = self._track_reconnect(connect)  # type: ignore[method-assign]
+
+        receivers = speaker._receivers  # noqa: SLF001
+        for receiver_id, receiver in list(receivers.items()):
+            receivers[receiver_id] = self._guard(receiver)
+
+        attach_receiver = speaker.attach_receiver
+
+        def _attach_receiver(callback: Callable[[Any], None]) -> int:
+            return attach_receiver(self._guard(callback))
+
+        speaker.attach_receiver = _attach_receiver  # type: ignore[method-assign]
+
+    def _guard(self, receiver: Callable[[Any], None]) -> Callable[[Any], None]:
+        """Count and log exceptions of a receiver instead of raising them."""
+
+        @functools.wraps(receiver)
+        def _guarded(message: Any) -> None:
+            try:
+                receiver(message)
+            except Exception:
+                name = receiver_name(receiver)
+                first = name not in self.receiver_errors
+                self.receiver_errors[name] += 1
+                # Only the first failure of a receiver is logged with traceback
+                (_LOGGER.exception if first else _LOGGER.debug)(
+                    "Receiver %s failed to handle a message", name
+                )
+
+        return _guarded
+
+    def _track_reconnect(
+        self, connect: Callable[[], Awaitable[None]]
+    ) -> Callable[[], Awaitable[None]]:
+        """Wrap the connect method of an already connected speaker."""
+
+        async def _timed_connect() -> None:
+            self.mark_disconnected()
+            try:
+                await connect()
+            except Exception:
+                self.reconnect_failures += 1
+                raise
+            self.mark_connected()
+
+        return _timed_connect
+
+    def record_request(self, key: str, seconds: float) -> None:
+        """Record the round-trip time of a request."""
+        if (histogram := self.requests.get(key)) is None:
+            histogram = self.requests[key] = RollingHistogram()
+        histogram.add(seconds)
+
+    def record_push(self, resource: str) -> None:
+        """Record a message pushed by the speaker."""
+        self.pushes.add()
+        self.pushes_by_resource[resource] += 1
+        if resource not in RESOURCES:
+            self.unknown_resources[resource] += 1
+
+    def record_parse_failure(self, resource: str | None) -> None:
+        """Record a message that could not be interpreted."""
+        self.parse_failures[resource or "unknown"] += 1
+
+    def record_cache(self, resource: str, hit: bool) -> None:
+        """Record a cache lookup of the coordinator."""
+        if hit:
+            self.cache_hits[resource] += 1
+        else:
+            self.cache_misses[resource] += 1
+
+    def mark_disconnected(self) -> None:
+        """Remember when the connection was found to be lost."""
+        if self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+
+    def mark_connected(self) -> None:
+        """Record a reconnect and the time it took since the connection was lost."""
+        if self._disconnected_at is None:
+            return
+        self.reconnects += 1
+        self.reconnect_times.add(time.monotonic() - self._disconnected_at)
+        self._disconnected_at = None
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of cache lookups that were hits, in percent."""
+        hits = sum(self.cache_hits.values())
+        lookups = hits + sum(self.cache_misses.values())
+        if not lookups:
+            return None
+        return round(hits * 100 / lookups, 1)
+
+    @property
+    def request_p95_ms(self) -> float | None:
+        """Return the 95th percentile round-trip time of all requests."""
+        samples = sorted(
+            seconds
+            for histogram in self.requests.values()
+            for seconds in histogram.values()
+        )
+        if not samples:
+            return None
+        return round(_percentile(samples, 0.95) * 1000, 1)
+
+    def notification_counters(self) -> dict[str, Any]:
+        """Return the counters of pushed messages."""
+        return {
+            "by_resource": dict(self.pushes_by_resource.most_common()),
+            "unknown_resources": dict(self.unknown_resources.most_common()),
+            "parse_failures": dict(self.parse_failures.most_common()),
+            "receiver_errors": dict(self.receiver_errors.most_common()),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics for diagnostics."""
+        return {
+            "window_seconds": METRICS_WINDOW,
+            "requests": {
+                key: {
+                    **histogram.summary(),
+                    "errors": self.request_errors[key],
+                }
+                for key, histogram in sorted(self.requests.items())
+            },
+            "pushes": {
+                "total": self.pushes.total,
+                "per_minute": self.pushes.per_minute(),
+                **self.notification_counters(),
+            },
+            "cache": {
+                "hit_ratio": self.cache_hit_ratio,
+                "by_resource": {
+                    resource: {
+                        "hits": self.cache_hits[resource],
+                        "misses": self.cache_misses[resource],
+                    }
+                    for resource in sorted(self.cache_hits | self.cache_misses)
+                },
+            },
+            "connection": {
+                "reconnects": self.reconnects,
+                "failed_reconnects": self.reconnect_failures,
+                "disconnected": self._disconnected_at is not None,
+                "time_to_reconnect": self.reconnect_times.summary(),
+            },
+        }
@@ -0,0 +1,73 @@
+"""Compact record of the nowPlaying resource.
+
+The body of /content/nowPlaying is deeply nested and read on every state
+write of the media player. It is projected once per message into a slotted
+record with the fields the integration uses, and the playback capabilities
+as media player features.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.media_player import MediaPlayerEntityFeature
+
+# Capability flags of the playback state and the features they enable
+_CAPABILITY_FEATURES = (
+    ("canSkipNext", MediaPlayerEntityFeature.NEXT_TRACK),
+    ("canPause", MediaPlayerEntityFeature.PAUSE),
+    ("canSkipPrevious", MediaPlayerEntityFeature.PREVIOUS_TRACK),
+    ("canSeek", MediaPlayerEntityFeature.SEEK),
+    ("canStop", MediaPlayerEntityFeature.STOP),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class NowPlaying:
+    """What the speaker is playing, projected from a nowPlaying body."""
+
+    status: str | None
+    source_name: str | None
+    source_id: str | None
+    # Source and account of the content item of the container
+    content_source: str | None
+    content_account: str | None
+    track_name: str | None
+    artist: str | None
+    album: str | None
+    duration: int
+    position: int
+    image_url: str | None
+    features: MediaPlayerEntityFeature
+
+    @classmethod
+    def from_body(cls, body: Mapping[str, Any]) -> NowPlaying:
+        """Project a nowPlaying body."""
+        state = body.get("state") or {}
+        source = body.get("source") or {}
+        content_item = (body.get("container") or {}).get("contentItem") or {}
+        metadata = body.get("metadata") or {}
+
+        features = MediaPlayerEntityFeature(0)
+        for key, feature in _CAPABILITY_FEATURES:
+            if state.get(key):
+                features |= feature
+
+        return cls(
+            status=state.get("status"),
+            source_name=source.get("sourceDisplayName"),
+            source_id=source.get("sourceID"),
+            content_source=content_item.get("source"),
+            content_account=content_item.get("sourceAccount"),
+            track_name=metadata.get("trackName"),
+            artist=metadata.get("artist"),
+            album=metadata.get("album"),
+            duration=int(metadata.get("duration", 999)),
+            position=int(state.get("timeIntoTrack", 0)),
+            image_url=((body.get("track") or {}).get("contentItem") or {}).get(
+                "containerArt"
+            ),
+            features=features,
+        )
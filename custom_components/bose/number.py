@@ -19,6 +19,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import _LOGGER, DOMAIN
 from .entity import BoseBaseEntity
+from .resources import RESOURCES
 
 # Define adjustable sound parameters
 ADJUSTABLE_PARAMETERS = [
@@ -91,16 +92,14 @@ async def async_setup_entry(
     """Set up Bose number entities (sliders) for sound settings."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-
-    # Fetch system info
-    system_info = await speaker.get_system_info()
+    system_info = hass.data[DOMAIN][config_entry.entry_id]["system_info"]
 
     entities = [
         BoseAudioSlider(
             speaker, system_info, config_entry, parameter, hass, coordinator
         )
         for parameter in ADJUSTABLE_PARAMETERS
-        if speaker.has_capability(parameter["path"])
+        if RESOURCES[parameter["path"]].supported(speaker)
     ]
 
     async_add_entities(entities)
@@ -124,6 +123,7 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
         self.config_entry = config_entry
         self.coordinator = coordinator
         self._path = parameter.get("path")
+        self._consumed_resources = (self._path,)
         self._option = parameter.get("option")
         self._attr_native_value = None
         self._attr_min_value = parameter.get("min")
@@ -145,9 +145,11 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
 
         self._attr_entity_category = EntityCategory.CONFIG
 
-        self.speaker.attach_receiver(self._parse_message)
-
-        hass.async_create_task(self.async_update())
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the state once the entity is added."""
+        await super().async_added_to_hass()
+        self._attach_receiver(self._parse_message)
+        self.async_schedule_update_ha_state(force_refresh=True)
 
     def _parse_message(self, data):
         """Parse the message from the speaker."""
@@ -161,7 +163,7 @@ class BoseAudioSlider(BoseBaseEntity, NumberEntity):
 
     async def async_update(self) -> None:
         """Fetch the current value of the setting."""
-        audio_dict = await self.coordinator.get_audio_setting(self._option)
+        audio_dict = await self.coordinator.async_get(self._path)
         self._parse_audio(Audio(audio_dict))
         if self.hass:
             self.async_write_ha_state()
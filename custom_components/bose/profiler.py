@@ -0,0 +1,214 @@
+"""On-demand profiling of the integration's hot paths.
+
+The profiler temporarily wraps, for the selected speakers:
+
+* the receivers attached to the speaker (coordinator cache, entity parsers)
+* the ``_parse_*`` methods and state writes of the entities of the entry
+* the public coroutine methods of the speaker (requests and commands)
+
+Receivers, parsers and state writes run in the event loop, so their time is
+time the loop was busy. Speaker methods are awaited, so their time is wall
+time including the round trip to the speaker. Everything is restored when
+the profile ends.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import functools
+import heapq
+import inspect
+import itertools
+import time
+from typing import Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+# Speaker methods kept out of the profile, reconnects are tracked by metrics.py
+SKIPPED_SPEAKER_METHODS = {"connect", "disconnect"}
+
+
+@dataclass(slots=True)
+class CallStats:
+    """Calls and time spent in one function."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+class HotPathProfiler:
+    """Collect call counts and durations while the hot paths are wrapped."""
+
+    def __init__(self, hass: HomeAssistant, slowest: int = 10) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self.stats: dict[tuple[str, str], CallStats] = {}
+        self._slowest_count = slowest
+        self._slowest: dict[str, list[tuple[float, int, str, float]]] = {}
+        self._sequence = itertools.count()
+        self._restore: list[Callable[[], None]] = []
+        self._started: float | None = None
+
+    def _record(self, kind: str, name: str, seconds: float) -> None:
+        """Record one call."""
+        if (stats := self.stats.get((kind, name))) is None:
+            stats = self.stats[(kind, name)] = CallStats()
+        stats.calls += 1
+        stats.total += seconds
+        stats.max = max(stats.max, seconds)
+
+        slowest = self._slowest.setdefault(kind, [])
+        entry = (seconds, next(self._sequence), name, time.time())
+        if len(slowest) < self._slowest_count:
+            heapq.heappush(slowest, entry)
+        elif seconds > slowest[0][0]:
+            heapq.heapreplace(slowest, entry)
+
+    def _wrap(
+        self, kind: str, name: str, func: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Return a timed version of a function or coroutine function."""
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _timed_async(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._record(kind, name, time.perf_counter() - start)
+
+            return _timed_async
+
+        @functools.wraps(func)
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(kind, name, time.perf_counter() - start)
+
+        return _timed
+
+    def _patch(self, obj: Any, attribute: str, kind: str, name: str) -> None:
+        """Replace a method of an instance by a timed version."""
+        had_own = attribute in vars(obj)
+        original = getattr(obj, attribute)
+        setattr(obj, attribute, self._wrap(kind, name, original))
+
+        def _restore() -> None:
+            if had_own:
+                setattr(obj, attribute, original)
+            else:
+                delattr(obj, attribute)
+
+        self._restore.append(_restore)
+
+    def _instrument_receivers(self, speaker: BoseSpeaker, device: str) -> None:
+        """Time every receiver currently attached to a speaker."""
+        receivers = speaker._receivers  # noqa: SLF001
+        for receiver_id, receiver in list(receivers.items()):
+            # Name receivers wrapped by the watchdog after the original
+            original = inspect.unwrap(receiver)
+            owner = getattr(original, "__self__", None)
+            label = getattr(owner, "entity_id", None) or device
+            name = f"{label} {getattr(original, '__qualname__', repr(original))}"
+            wrapped = self._wrap("receiver", name, receiver)
+            receivers[receiver_id] = wrapped
+
+            def _restore(
+                receiver_id: int = receiver_id,
+                receiver: Callable[..., Any] = receiver,
+                wrapped: Callable[..., Any] = wrapped,
+            ) -> None:
+                if receivers.get(receiver_id) is wrapped:
+                    receivers[receiver_id] = receiver
+
+            self._restore.append(_restore)
+
+    def _instrument_entities(self, entry_id: str) -> None:
+        """Time the parsers and state writes of the entities of an entry."""
+        for platform in async_get_platforms(self.hass, DOMAIN):
+            config_entry = platform.config_entry
+            if config_entry is None or config_entry.entry_id != entry_id:
+                continue
+            for entity in platform.entities.values():
+                for attribute in dir(type(entity)):
+                    if attribute.startswith("_parse_") and callable(
+                        getattr(entity, attribute, None)
+                    ):
+                        self._patch(
+                            entity,
+                            attribute,
+                            "parser",
+                            f"{entity.entity_id} {attribute}",
+                        )
+                self._patch(
+                    entity, "async_write_ha_state", "state_write", entity.entity_id
+                )
+
+    def _instrument_speaker(self, speaker: BoseSpeaker, device: str) -> None:
+        """Time the requests and commands of a speaker."""
+        for attribute, member in inspect.getmembers(type(speaker)):
+            if (
+                attribute.startswith("_")
+                or attribute in SKIPPED_SPEAKER_METHODS
+                or not inspect.iscoroutinefunction(member)
+            ):
+                continue
+            self._patch(speaker, attribute, "speaker", f"{device} {attribute}")
+
+    def start(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Wrap the hot paths of the given entries (entry id to entry data)."""
+        self._started = time.monotonic()
+        for entry_id, data in entries.items():
+            speaker: BoseSpeaker = data["speaker"]
+            device = data.get("config", {}).get("name") or entry_id
+            self._instrument_receivers(speaker, device)
+            self._instrument_entities(entry_id)
+            self._instrument_speaker(speaker, device)
+
+    def stop(self) -> None:
+        """Restore everything that was wrapped."""
+        while self._restore:
+            self._restore.pop()()
+
+    def report(self) -> dict[str, Any]:
+        """Return the calls and the slowest calls by kind, most time first."""
+        calls: dict[str, dict[str, dict[str, Any]]] = {}
+        for (kind, name), stats in sorted(
+            self.stats.items(), key=lambda item: item[1].total, reverse=True
+        ):
+            calls.setdefault(kind, {})[name] = {
+                "calls": stats.calls,
+                "total_ms": round(stats.total * 1000, 3),
+                "mean_ms": round(stats.total * 1000 / stats.calls, 3),
+                "max_ms": round(stats.max * 1000, 3),
+            }
+        return {
+            "duration": (
+                round(time.monotonic() - self._started, 1)
+                if self._started is not None
+                else 0
+            ),
+            "calls": calls,
+            "slowest": {
+                kind: [
+                    {
+                        "name": name,
+                        "ms": round(seconds * 1000, 3),
+                        "at": dt_util.utc_from_timestamp(at).isoformat(),
+                    }
+                    for seconds, _, name, at in sorted(slowest, reverse=True)
+                ]
+                for kind, slowest in self._slowest.items()
+            },
+        }
@@ -0,0 +1,124 @@
+"""Registry of the speaker resources the integration reads and handles.
+
+Each resource is described once, with the speaker methods reading and
+writing it, the capability it depends on, whether the speaker notifies its
+changes and how long a cached body stays valid. The coordinator's getters,
+cache and prefetch, the subscription, the metrics and the platform setups
+look resources up here instead of repeating their paths.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+# Time a cached body stays valid, unless the resource sets its own
+DEFAULT_TTL = 60  # seconds
+# Resources that only change by notification or on user request
+SETTINGS_TTL = 300  # seconds
+
+
+@dataclass(frozen=True, slots=True)
+class BoseResource:
+    """Description of one resource of the speaker."""
+
+    path: str
+    # Methods of BoseSpeaker reading and writing the resource, called with args
+    getter: str | None = None
+    setter: str | None = None
+    args: tuple[Any, ...] = ()
+    # Capability the speaker must report, the path if not set
+    capability: str | None = None
+    # Whether the speaker sends notifications of the resource
+    push: bool = True
+    ttl: float = DEFAULT_TTL
+    # Converts the result of the getter to the body of a notification
+    parser: Callable[[Any], dict[str, Any]] | None = None
+
+    def supported(self, speaker: BoseSpeaker) -> bool:
+        """Return True if the speaker reports the capability of the resource."""
+        return bool(speaker.has_capability(self.capability or self.path))
+
+
+def _active_groups_body(result: Any) -> dict[str, Any]:
+    """Wrap the list of active groups like the body of their notification."""
+    return {"activeGroups": [dict(item) for item in result]}
+
+
+def _audio_setting(option: str) -> BoseResource:
+    """Describe an audio setting read through get_audio_setting."""
+    return BoseResource(
+        f"/audio/{option}",
+        getter="get_audio_setting",
+        setter="set_audio_setting",
+        args=(option,),
+        ttl=SETTINGS_TTL,
+    )
+
+
+RESOURCES: dict[str, BoseResource] = {
+    resource.path: resource
+    for resource in (
+        BoseResource("/accessories", getter="get_accessories", ttl=SETTINGS_TTL),
+        _audio_setting("avSync"),
+        _audio_setting("bass"),
+        _audio_setting("center"),
+        BoseResource(
+            "/audio/dualMonoSelect",
+            getter="get_dual_mono_setting",
+            setter="set_dual_mono_setting",
+            ttl=SETTINGS_TTL,
+        ),
+        _audio_setting("height"),
+        BoseResource(
+            "/audio/mode",
+            getter="get_audio_mode",
+            setter="set_audio_mode",
+            ttl=SETTINGS_TTL,
+        ),
+        BoseResource(
+            "/audio/rebroadcastLatency/mode",
+            getter="get_rebroadcast_latency_mode",
+            setter="set_rebroadcast_latency_mode",
+            ttl=SETTINGS_TTL,
+        ),
+        _audio_setting("subwooferGain"),
+        _audio_setting("surround"),
+        _audio_setting("treble"),
+        BoseResource("/audio/volume", getter="get_audio_volume"),
+        BoseResource("/bluetooth/sink/list", getter="get_bluetooth_sink_list"),
+        BoseResource("/bluetooth/sink/status", getter="get_bluetooth_sink_status"),
+        BoseResource(
+            "/bluetooth/source/status", getter="get_bluetooth_source_status"
+        ),
+        BoseResource(
+            "/cec",
+            getter="get_cec_settings",
+            setter="set_cec_settings",
+            ttl=SETTINGS_TTL,
+        ),
+        BoseResource("/content/nowPlaying", getter="get_now_playing"),
+        BoseResource(
+            "/grouping/activeGroups",
+            getter="get_active_groups",
+            parser=_active_groups_body,
+        ),
+        BoseResource("/network/status", getter="get_network_status"),
+        BoseResource("/network/wifi/status", getter="get_wifi_status"),
+        BoseResource("/system/battery", getter="get_battery_status"),
+        BoseResource("/system/power/control", getter="get_power_state"),
+        BoseResource(
+            "/system/power/timeouts", getter="get_system_timeout", ttl=SETTINGS_TTL
+        ),
+        BoseResource(
+            "/system/productSettings",
+            getter="get_product_settings",
+            ttl=SETTINGS_TTL,
+        ),
+        # Read by the media player for its source list, not notified
+        BoseResource("/system/sources", getter="get_sources", push=False),
+    )
+}
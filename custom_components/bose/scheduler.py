@@ -0,0 +1,147 @@
+"""Adaptive refresh schedule of resources that are not kept current by pushes.
+
+Every refreshed resource has its own interval. It is halved when the data
+changed since the last refresh and grows when it did not, within bounds
+that depend on the speaker: a speaker on battery is refreshed more often, a
+speaker in standby less often. All refreshes of a speaker share a request
+budget; resources that are due while it is spent wait for it to refill.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import json
+from typing import Any
+
+MIN_INTERVAL = 15.0  # seconds
+DEFAULT_INTERVAL = 60.0  # seconds
+MAX_INTERVAL = 600.0  # seconds
+# Upper bound of the interval while the speaker runs on battery
+BATTERY_MAX_INTERVAL = 120.0  # seconds
+# Lower bound of the interval while the speaker is in standby
+STANDBY_MIN_INTERVAL = 300.0  # seconds
+# Interval factor after a refresh without change
+BACKOFF_FACTOR = 1.5
+
+# Refresh requests per speaker, refilled evenly over the budget window
+REQUEST_BUDGET = 10
+BUDGET_WINDOW = 60.0  # seconds
+
+
+@dataclass(slots=True)
+class ResourceSchedule:
+    """Refresh state of one resource."""
+
+    interval: float
+    due: float
+    fingerprint: str | None = None
+    refreshes: int = 0
+    changes: int = 0
+
+
+class RefreshScheduler:
+    """Decide which resources to refresh and when."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler with a full budget."""
+        self.schedules: dict[str, ResourceSchedule] = {}
+        self.deferred = 0
+        self._tokens = float(REQUEST_BUDGET)
+        self._refilled: float | None = None
+
+    def _refill(self, now: float) -> None:
+        """Add the budget earned since the last call."""
+        if self._refilled is not None:
+            self._tokens = min(
+                REQUEST_BUDGET,
+                self._tokens + (now - self._refilled) * REQUEST_BUDGET / BUDGET_WINDOW,
+            )
+        self._refilled = now
+
+    def due(self, resources: Iterable[str], now: float) -> list[str]:
+        """Return the resources to refresh now, most overdue first."""
+        resources = set(resources)
+        self._refill(now)
+        for resource in resources:
+            if resource not in self.schedules:
+                self.schedules[resource] = ResourceSchedule(
+                    interval=DEFAULT_INTERVAL, due=now
+                )
+        overdue = sorted(
+            (schedule.due, resource)
+            for resource, schedule in self.schedules.items()
+            if resource in resources and schedule.due <= now
+        )
+        due = [resource for _, resource in overdue[: int(self._tokens)]]
+        self._tokens -= len(due)
+        self.deferred += len(overdue) - len(due)
+        return due
+
+    def record(
+        self,
+        resource: str,
+        body: dict[str, Any] | None,
+        now: float,
+        *,
+        on_battery: bool = False,
+        standby: bool = False,
+    ) -> None:
+        """Adapt the interval of a resource after it was refreshed."""
+        schedule = self.schedules[resource]
+        schedule.refreshes += 1
+        if body is not None:
+            fingerprint = json.dumps(body, sort_keys=True, default=str)
+            previous = schedule.fingerprint
+            if previous is not None and fingerprint != previous:
+                schedule.changes += 1
+                schedule.interval /= 2
+            else:
+                schedule.interval *= BACKOFF_FACTOR
+            schedule.fingerprint = fingerprint
+
+        upper = BATTERY_MAX_INTERVAL if on_battery else MAX_INTERVAL
+        lower = STANDBY_MIN_INTERVAL if standby else MIN_INTERVAL
+        schedule.interval = max(lower, min(upper, schedule.interval))
+        schedule.due = now + schedule.interval
+
+    def next_due(self, resources: Iterable[str], now: float) -> float | None:
+        """Return the seconds until the next refresh, None if nothing is scheduled."""
+        dues = [
+            self.schedules[resource].due
+            for resource in resources
+            if resource in self.schedules
+        ]
+        if not dues:
+            return None
+        delay = max(0.0, min(dues) - now)
+        if self._tokens < 1:
+            # Wait for the budget to refill if it is spent
+            self._refill(now)
+            refill = (1 - self._tokens) * BUDGET_WINDOW / REQUEST_BUDGET
+            delay = max(delay, refill)
+        return delay
+
+    def forget(self, resources: Iterable[str]) -> None:
+        """Drop the schedules of resources that are no longer refreshed."""
+        for resource in resources:
+            self.schedules.pop(resource, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the schedules and the budget for diagnostics."""
+        return {
+            "budget": {
+                "requests": REQUEST_BUDGET,
+                "window": BUDGET_WINDOW,
+                "available": round(self._tokens, 2),
+                "deferred": self.deferred,
+            },
+            "resources": {
+                resource: {
+                    "interval": round(schedule.interval, 1),
+                    "refreshes": schedule.refreshes,
+                    "changes": schedule.changes,
+                }
+                for resource, schedule in sorted(self.schedules.items())
+            },
+        }
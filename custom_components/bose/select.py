@@ -1,5 +1,7 @@
 """Support for Bose source selection."""
 
+from typing import cast
+
 from pybose.BoseResponse import (
     AudioMode,
     CecSettings,
@@ -15,7 +17,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
+from .coordinator import BoseCoordinator
 from .entity import BoseBaseEntity
+from .resources import RESOURCES
 
 HUMINZED_OPTIONS = {
     # Audio Mode
@@ -49,22 +53,18 @@ async def async_setup_entry(
     """Set up Bose select entity."""
     speaker: BoseSpeaker = hass.data[DOMAIN][config_entry.entry_id]["speaker"]
     system_info = hass.data[DOMAIN][config_entry.entry_id]["system_info"]
-
-    entities = []
-
-    if speaker.has_capability("/audio/mode"):
-        entities.append(BoseAudioSelect(speaker, system_info, config_entry, hass))
-
-    if speaker.has_capability("/audio/dualMonoSelect"):
-        entities.append(BoseDualMonoSelect(speaker, system_info, config_entry, hass))
-
-    if speaker.has_capability("/audio/rebroadcastLatency/mode"):
-        entities.append(
-            BoseRebroadcastLatencyModeSelect(speaker, system_info, config_entry, hass)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+    entities = [
+        select_class(speaker, system_info, config_entry, hass, coordinator)
+        for select_class in (
+            BoseAudioSelect,
+            BoseDualMonoSelect,
+            BoseRebroadcastLatencyModeSelect,
+            BoseCecSettingsSelect,
         )
-
-    if speaker.has_capability("/cec"):
-        entities.append(BoseCecSettingsSelect(speaker, system_info, config_entry, hass))
+        if RESOURCES[select_class._resource_path].supported(speaker)
+    ]
 
     async_add_entities(entities, update_before_add=False)
 
@@ -72,8 +72,6 @@ async def async_setup_entry(
 class BoseBaseSelect(BoseBaseEntity, SelectEntity):
     """Base class for Bose device selectors."""
 
-    _set_method: str = ""
-    _get_method: str = ""
     _value_key: str = ""
     _supported_key: str = ""
     _resource_path: str = ""
@@ -88,20 +86,26 @@ class BoseBaseSelect(BoseBaseEntity, SelectEntity):
         name_suffix,
         unique_id_suffix,
         hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the select entity."""
         BoseBaseEntity.__init__(self, speaker)
         self.speaker = speaker
+        self.coordinator = coordinator
         self.speaker_info = speaker_info
         self.config_entry = config_entry
 
         self._attr_translation_key = unique_id_suffix.replace("_select", "")
         self._attr_options = []
+        self._attr_current_option = None
         self._attr_entity_category = EntityCategory.CONFIG
+        self._consumed_resources = (self._resource_path,)
 
-        self.speaker.attach_receiver(self._parse_message)
-
-        hass.async_create_task(self.async_update())
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the state once the entity is added."""
+        await super().async_added_to_hass()
+        self._attach_receiver(self._parse_message)
+        self.async_schedule_update_ha_state(force_refresh=True)
 
     async def async_select_option(self, option: str) -> None:
         """Change the audio mode on the speaker."""
@@ -111,7 +115,8 @@ class BoseBaseSelect(BoseBaseEntity, SelectEntity):
                 option = real_option
                 break
 
-        await getattr(self.speaker, self._set_method)(option)
+        resource = RESOURCES[self._resource_path]
+        await getattr(self.speaker, cast(str, resource.setter))(*resource.args, option)
 
     def _parse_audio_mode(self, data, mode_type):
         selected_audio = data.get(self._value_key)
@@ -136,23 +141,26 @@ class BoseBaseSelect(BoseBaseEntity, SelectEntity):
             self._parse_audio_mode(data.get("body", {}), self._mode_class)
 
     async def async_update(self) -> None:
-        """Fetch the current audio mode."""
-        data = await getattr(self.speaker, self._get_method)()
+        """Fetch the current mode, cached by the coordinator."""
+        data = await self.coordinator.async_get(self._resource_path)
         self._parse_audio_mode(data, self._mode_class)
 
 
 class BoseAudioSelect(BoseBaseSelect):
     """Representation of a Bose device audio selector."""
 
-    _set_method = "set_audio_mode"
-    _get_method = "get_audio_mode"
     _value_key = "value"
     _supported_key = "supportedValues"
     _resource_path = "/audio/mode"
     _mode_class = AudioMode
 
     def __init__(
-        self, speaker, speaker_info, config_entry, hass: HomeAssistant
+        self,
+        speaker,
+        speaker_info,
+        config_entry,
+        hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(
@@ -163,6 +171,7 @@ class BoseAudioSelect(BoseBaseSelect):
             "Audio",
             "audio_select",
             hass,
+            coordinator,
         )
         self._attr_translation_key = "audio_mode"
 
@@ -170,15 +179,18 @@ class BoseAudioSelect(BoseBaseSelect):
 class BoseDualMonoSelect(BoseBaseSelect):
     """Representation of a Bose device dual mono selector."""
 
-    _set_method = "set_dual_mono_setting"
-    _get_method = "get_dual_mono_setting"
     _value_key = "value"
     _supported_key = "supportedValues"
     _resource_path = "/audio/dualMonoSelect"
     _mode_class = DualMonoSettings
 
     def __init__(
-        self, speaker, speaker_info, config_entry, hass: HomeAssistant
+        self,
+        speaker,
+        speaker_info,
+        config_entry,
+        hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(
@@ -189,6 +201,7 @@ class BoseDualMonoSelect(BoseBaseSelect):
             "Dual Mono",
             "dual_mono_select",
             hass,
+            coordinator,
         )
         self._attr_translation_key = "dual_mono"
 
@@ -196,15 +209,18 @@ class BoseDualMonoSelect(BoseBaseSelect):
 class BoseRebroadcastLatencyModeSelect(BoseBaseSelect):
     """Representation of a Bose device rebroadcast latency mode selector."""
 
-    _set_method = "set_rebroadcast_latency_mode"
-    _get_method = "get_rebroadcast_latency_mode"
     _value_key = "mode"
     _supported_key = "supportedModes"
     _resource_path = "/audio/rebroadcastLatency/mode"
     _mode_class = RebroadcastLatencyMode
 
     def __init__(
-        self, speaker, speaker_info, config_entry, hass: HomeAssistant
+        self,
+        speaker,
+        speaker_info,
+        config_entry,
+        hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(
@@ -215,6 +231,7 @@ class BoseRebroadcastLatencyModeSelect(BoseBaseSelect):
             "Rebroadcast Latency Mode",
             "rebroadcast_latency_mode_select",
             hass,
+            coordinator,
         )
         self._attr_translation_key = "rebroadcast_latency"
 
@@ -222,15 +239,18 @@ class BoseRebroadcastLatencyModeSelect(BoseBaseSelect):
 class BoseCecSettingsSelect(BoseBaseSelect):
     """Representation of a Bose device CEC settings selector."""
 
-    _set_method = "set_cec_settings"
-    _get_method = "get_cec_settings"
     _value_key = "mode"
     _supported_key = "supportedModes"
     _resource_path = "/cec"
     _mode_class = CecSettings
 
     def __init__(
-        self, speaker, speaker_info, config_entry, hass: HomeAssistant
+        self,
+        speaker,
+        speaker_info,
+        config_entry,
+        hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(
@@ -241,5 +261,6 @@ class BoseCecSettingsSelect(BoseBaseSelect):
             "CEC",
             "cec_settings_select",
             hass,
+            coordinator,
         )
         self._attr_translation_key = "cec_settings"
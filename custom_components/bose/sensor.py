@@ -1,23 +1,88 @@
-"""Support for Bose battery, WiFi, and network status sensors."""
+"""Support for Bose battery, WiFi, network status and connection metric sensors."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from pybose.BoseResponse import Battery, NetworkStatus, NetworkTypeEnum, WifiStatus
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from pybose import BoseSpeaker
 
-from .bose.battery import BoseBatteryBase
+from .bose.battery import (
+    PREDICTION_MIN_CHANGE,
+    PREDICTION_REL_CHANGE,
+    BoseBatteryBase,
+)
 from .bose.network import BoseNetworkBase
 from .bose.wifi import BoseWifiBase
 from .const import DOMAIN
+from .coordinator import BoseCoordinator
 from .entity import BoseBaseEntity
+from .metrics import SpeakerMetrics
+from .resources import RESOURCES
+
+
+@dataclass(frozen=True, kw_only=True)
+class BoseMetricSensorDescription(SensorEntityDescription):
+    """Describes a connection metric sensor."""
+
+    value_fn: Callable[[SpeakerMetrics], float | int | None]
+    attributes_fn: Callable[[SpeakerMetrics], dict[str, Any]] | None = None
+
+
+# Connection metric sensors, disabled by default
+METRIC_SENSORS: tuple[BoseMetricSensorDescription, ...] = (
+    BoseMetricSensorDescription(
+        key="request_latency",
+        translation_key="request_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.request_p95_ms,
+    ),
+    BoseMetricSensorDescription(
+        key="push_rate",
+        translation_key="push_rate",
+        native_unit_of_measurement="messages/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.pushes.per_minute(),
+    ),
+    BoseMetricSensorDescription(
+        key="cache_hit_ratio",
+        translation_key="cache_hit_ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.cache_hit_ratio,
+    ),
+    BoseMetricSensorDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.reconnects,
+    ),
+    BoseMetricSensorDescription(
+        key="notifications",
+        translation_key="notifications",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.pushes.total,
+        attributes_fn=lambda metrics: metrics.notification_counters(),
+    ),
+)
 
 
 async def async_setup_entry(
@@ -31,7 +96,7 @@ async def async_setup_entry(
 
     entities = []
 
-    if speaker.has_capability("/system/battery"):
+    if RESOURCES["/system/battery"].supported(speaker):
         entities.extend(
             [
                 BoseBatteryLevelSensor(speaker, config_entry, hass, coordinator),
@@ -40,7 +105,7 @@ async def async_setup_entry(
             ]
         )
 
-    if speaker.has_capability("/network/status"):
+    if RESOURCES["/network/status"].supported(speaker):
         entities.extend(
             [
                 BoseNetworkTypeSensor(speaker, config_entry, hass, coordinator),
@@ -49,7 +114,7 @@ async def async_setup_entry(
         )
 
         try:
-            network_data = await coordinator.get_network_status()
+            network_data = await coordinator.async_get("/network/status")
             network_status = NetworkStatus(network_data)
             primary_name = network_status.get("primary")
 
@@ -60,7 +125,10 @@ async def async_setup_entry(
                         is_wireless_primary = True
                     break
 
-            if is_wireless_primary and speaker.has_capability("/network/wifi/status"):
+            if (
+                is_wireless_primary
+                and RESOURCES["/network/wifi/status"].supported(speaker)
+            ):
                 entities.extend(
                     [
                         BoseWifiSignalSensor(speaker, config_entry, hass, coordinator),
@@ -70,8 +138,15 @@ async def async_setup_entry(
         except Exception:  # noqa: BLE001
             pass
 
+    entities.extend(
+        BoseMetricSensor(speaker, coordinator, description)
+        for description in METRIC_SENSORS
+    )
+    entities.append(BoseRoundTripSensor(speaker, coordinator))
+
     if entities:
-        async_add_entities(entities, update_before_add=True)
+        # Entities fetch their state once added, disabled ones never do
+        async_add_entities(entities)
 
 
 class BoseBatteryLevelSensor(BoseBaseEntity, BoseBatteryBase, SensorEntity):
@@ -112,6 +187,8 @@ class BoseBatteryTimeTillFull(BoseBaseEntity, BoseBatteryBase, SensorEntity):
         self._attr_translation_key = "time_till_full"
         self._attr_device_class = SensorDeviceClass.DURATION
         self._attr_native_unit_of_measurement = "min"
+        # The estimate changes between notifications
+        self._also_polled = True
 
     def update_from_battery_status(self, battery_status: Battery):
         """Update sensor state."""
@@ -125,7 +202,7 @@ class BoseBatteryTimeTillFull(BoseBaseEntity, BoseBatteryBase, SensorEntity):
 
 
 class BoseBatteryTimeTillEmpty(BoseBaseEntity, BoseBatteryBase, SensorEntity):
-    """Sensor for time till full charge."""
+    """Sensor for time till empty battery."""
 
     def __init__(
         self,
@@ -140,16 +217,31 @@ class BoseBatteryTimeTillEmpty(BoseBaseEntity, BoseBatteryBase, SensorEntity):
         self._attr_translation_key = "time_till_empty"
         self._attr_device_class = SensorDeviceClass.DURATION
         self._attr_native_unit_of_measurement = "min"
+        # The estimate changes between notifications
+        self._also_polled = True
 
     def update_from_battery_status(self, battery_status: Battery):
-        """Update sensor state."""
-        if battery_status.get("minutesToEmpty") == 65535:
-            if battery_status.get("percent", 0) == 0:
-                self._attr_native_value = 0
-            else:
-                self._attr_native_value = None
+        """Update sensor state with the smoothed prediction."""
+        rate = self._update_drain_rate(battery_status)
+        if rate:
+            prediction: int | None = round(battery_status.get("percent", 0) / rate)
+        elif battery_status.get("minutesToEmpty") == 65535:
+            prediction = 0 if battery_status.get("percent", 0) == 0 else None
         else:
-            self._attr_native_value = battery_status.get("minutesToEmpty")
+            # Until the drain model has a rate, use the speaker's estimate
+            prediction = battery_status.get("minutesToEmpty")
+
+        published = self._attr_native_value
+        if (
+            prediction is None
+            or published is None
+            or abs(prediction - published)
+            >= max(PREDICTION_MIN_CHANGE, PREDICTION_REL_CHANGE * published)
+        ):
+            self._attr_native_value = prediction
+            self._attr_extra_state_attributes = {
+                "discharge_rate": round(rate * 60, 2) if rate else None
+            }
 
 
 class BoseWifiSignalSensor(BoseBaseEntity, BoseWifiBase, SensorEntity):
@@ -170,10 +262,15 @@ class BoseWifiSignalSensor(BoseBaseEntity, BoseWifiBase, SensorEntity):
         self._attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_entity_category = None
+        # The signal changes without notifications
+        self._also_polled = True
 
     def update_from_wifi_status(self, wifi_status: WifiStatus):
-        """Update sensor state."""
-        self._attr_native_value = wifi_status.get("signalDbm")
+        """Update sensor state with the downsampled signal."""
+        if (signal := wifi_status.get("signalDbm")) is None:
+            return
+        if (published := self._record_signal(signal)) is not None:
+            self._attr_native_value, self._attr_extra_state_attributes = published
 
 
 class BoseWifiSsidSensor(BoseBaseEntity, BoseWifiBase, SensorEntity):
@@ -253,3 +350,81 @@ class BoseNetworkIpSensor(BoseBaseEntity, BoseNetworkBase, SensorEntity):
     def update_from_network_status(self, network_status: NetworkStatus):
         """Update sensor state."""
         self._attr_native_value = network_status.get("primaryIpAddress")
+
+
+class BoseMetricSensor(BoseBaseEntity, SensorEntity):
+    """Sensor for a connection metric of the speaker."""
+
+    entity_description: BoseMetricSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # Metrics are in memory, polling them costs no request
+    _attr_should_poll = True
+
+    def __init__(
+        self,
+        speaker: BoseSpeaker,
+        coordinator: BoseCoordinator,
+        description: BoseMetricSensorDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(speaker)
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_translation_key = description.translation_key
+
+    async def async_added_to_hass(self) -> None:
+        """Show the metric right away instead of after the first poll."""
+        await super().async_added_to_hass()
+        self.async_schedule_update_ha_state(force_refresh=True)
+
+    async def async_update(self) -> None:
+        """Read the metric, it is kept in memory by the coordinator."""
+        metrics = self.coordinator.metrics
+        self._attr_native_value = self.entity_description.value_fn(metrics)
+        if self.entity_description.attributes_fn is not None:
+            self._attr_extra_state_attributes = (
+                self.entity_description.attributes_fn(metrics)
+            )
+
+
+class BoseRoundTripSensor(BoseBaseEntity, SensorEntity):
+    """Sensor for the round-trip time of the connection probe."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = False
+    _attr_translation_key = "round_trip_time"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, speaker: BoseSpeaker, coordinator: BoseCoordinator) -> None:
+        """Initialize the round-trip sensor."""
+        super().__init__(speaker)
+        self.coordinator = coordinator
+
+    async def async_added_to_hass(self) -> None:
+        """Update the state after every probe."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.probe.async_add_listener(self._handle_probe)
+        )
+        self._update_from_probe()
+
+    @callback
+    def _handle_probe(self) -> None:
+        self._update_from_probe()
+        self.async_write_ha_state()
+
+    def _update_from_probe(self) -> None:
+        probe = self.coordinator.probe
+        self._attr_native_value = (
+            probe.last_rtt * 1000 if probe.last_rtt is not None else None
+        )
+        self._attr_extra_state_attributes = {
+            "jitter": round(probe.jitter * 1000, 1),
+            "failed_probes": probe.consecutive_failures,
+            "healthy": probe.healthy,
+        }
@@ -0,0 +1,126 @@
+"""Subscription of the speaker to the resources that have consumers.
+
+``speaker.subscribe()`` without arguments subscribes to every resource pybose
+knows, so the speaker pushes notifications nothing listens to. Entities
+declare the resources they consume and register them while they are added
+to Home Assistant; disabled entities are never added. The speaker is not
+subscribed before the platforms are set up, the prefetch and the entities'
+first reads cover that time. Then it is subscribed to the consumed resources
+only, and the subscription follows entities being added and removed.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .const import _LOGGER
+from .resources import RESOURCES
+
+if TYPE_CHECKING:
+    from .coordinator import BoseCoordinator
+
+# Changes within this time are sent to the speaker as one subscription
+SUBSCRIPTION_COOLDOWN = 1  # seconds
+
+
+class SubscriptionManager:
+    """Count the consumers per resource and keep the subscription in sync."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: BoseCoordinator) -> None:
+        """Initialize the subscription manager."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.consumers: Counter[str] = Counter()
+        self.subscribed: list[str] | None = None
+        self.updates = 0
+        self._started = False
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SUBSCRIPTION_COOLDOWN,
+            immediate=False,
+            function=self.async_update_subscription,
+        )
+
+    @property
+    def resources(self) -> list[str]:
+        """Return the notified resources with at least one consumer."""
+        return sorted(
+            resource
+            for resource, count in self.consumers.items()
+            if count and (resource not in RESOURCES or RESOURCES[resource].push)
+        )
+
+    @callback
+    def async_add_consumer(self, resources: Iterable[str]) -> CALLBACK_TYPE:
+        """Register a consumer of resources; returns a callback removing it."""
+        resources = tuple(resources)
+        self.consumers.update(resources)
+        self._async_schedule_update()
+
+        @callback
+        def _remove() -> None:
+            self.consumers.subtract(resources)
+            self._async_schedule_update()
+
+        return _remove
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Update the subscription after the cooldown, once started."""
+        if self._started:
+            self._debouncer.async_schedule_call()
+
+    async def async_start(self) -> None:
+        """Narrow the subscription to the consumed resources."""
+        self._started = True
+        await self.async_update_subscription()
+
+    async def async_update_subscription(self, force: bool = False) -> None:
+        """Subscribe to the consumed resources if they changed (or force)."""
+        resources = self.resources
+        if not force and resources == self.subscribed:
+            return
+        speaker = self.coordinator.speaker
+        try:
+            await speaker.subscribe(resources)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception(
+                "Failed to update the subscription of speaker %s",
+                self.coordinator.device_id,
+            )
+            return
+        self.subscribed = resources
+        self.updates += 1
+        _LOGGER.debug(
+            "Speaker %s subscribed to %d resources: %s",
+            self.coordinator.device_id,
+            len(resources),
+            resources,
+        )
+
+    async def async_resubscribe(self) -> None:
+        """Subscribe a new connection to what the previous one had."""
+        # Before the start, async_start subscribes the new connection
+        if self._started:
+            await self.async_update_subscription(force=True)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a pending subscription update."""
+        self._debouncer.async_shutdown()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the consumers and the subscription for diagnostics."""
+        return {
+            "consumers": {
+                resource: self.consumers[resource] for resource in self.resources
+            },
+            "subscribed": self.subscribed,
+            "updates": self.updates,
+        }
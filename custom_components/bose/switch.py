@@ -12,7 +12,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import _LOGGER, DOMAIN
+from .coordinator import BoseCoordinator
 from .entity import BoseBaseEntity
+from .resources import RESOURCES
 
 
 async def async_setup_entry(
@@ -26,11 +28,14 @@ async def async_setup_entry(
     # Fetch system info
     system_info = hass.data[DOMAIN][config_entry.entry_id]["system_info"]
     accessories = hass.data[DOMAIN][config_entry.entry_id]["accessories"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     entities: list[SwitchEntity] = []
-    if speaker.has_capability("/system/power/timeouts"):
+    if RESOURCES["/system/power/timeouts"].supported(speaker):
         entities.append(
-            BoseStandbySettingSwitch(speaker, system_info, config_entry, hass)
+            BoseStandbySettingSwitch(
+                speaker, system_info, config_entry, hass, coordinator
+            )
         )
     else:
         _LOGGER.debug("Speaker does not support system timeouts")
@@ -38,11 +43,15 @@ async def async_setup_entry(
     if accessories:
         if accessories.get("controllable", {}).get("subs", False):
             entities.append(
-                BoseSubwooferSwitch(speaker, system_info, accessories, config_entry)
+                BoseSubwooferSwitch(
+                    speaker, system_info, accessories, config_entry, coordinator
+                )
             )
         if accessories.get("controllable", {}).get("rears", False):
             entities.append(
-                BoseRearSpeakerSwitch(speaker, system_info, accessories, config_entry)
+                BoseRearSpeakerSwitch(
+                    speaker, system_info, accessories, config_entry, coordinator
+                )
             )
 
     # Add switch entity with device info
@@ -55,18 +64,22 @@ async def async_setup_entry(
 class BoseAccessorySwitch(BoseBaseEntity, SwitchEntity):
     """Generic accessory switch for Bose speakers."""
 
+    _consumed_resources = ("/accessories",)
+
     def __init__(
         self,
         speaker: BoseSpeaker,
         speaker_info: SystemInfo,
         accessories: Accessories,
         config_entry,
+        coordinator: BoseCoordinator,
         name: str,
         attribute: str,
     ) -> None:
         """Initialize the switch."""
         BoseBaseEntity.__init__(self, speaker)
         self.speaker = speaker
+        self.coordinator = coordinator
         self._attribute = attribute
         self._attr_is_on = (
             accessories.get("enabled", {}).get(attribute) if accessories else False
@@ -76,7 +89,10 @@ class BoseAccessorySwitch(BoseBaseEntity, SwitchEntity):
         self._attr_translation_key = attribute
         self.icon = "mdi:speaker"
 
-        self.speaker.attach_receiver(self._parse_message)
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver once the entity is added."""
+        await super().async_added_to_hass()
+        self._attach_receiver(self._parse_message)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the speaker feature."""
@@ -101,7 +117,9 @@ class BoseAccessorySwitch(BoseBaseEntity, SwitchEntity):
 
     async def async_update(self) -> None:
         """Update the switch state."""
-        self._parse_accessories(await self.speaker.get_accessories())
+        self._parse_accessories(
+            Accessories(await self.coordinator.async_get("/accessories"))
+        )
 
 
 class BoseSubwooferSwitch(BoseAccessorySwitch):
@@ -113,10 +131,17 @@ class BoseSubwooferSwitch(BoseAccessorySwitch):
         speaker_info: SystemInfo,
         accessories: Accessories,
         config_entry,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the switch."""
         super().__init__(
-            speaker, speaker_info, accessories, config_entry, "Subwoofers", "subs"
+            speaker,
+            speaker_info,
+            accessories,
+            config_entry,
+            coordinator,
+            "Subwoofers",
+            "subs",
         )
 
 
@@ -129,26 +154,37 @@ class BoseRearSpeakerSwitch(BoseAccessorySwitch):
         speaker_info: SystemInfo,
         accessories: Accessories,
         config_entry,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the switch."""
         super().__init__(
-            speaker, speaker_info, accessories, config_entry, "Rear Speakers", "rears"
+            speaker,
+            speaker_info,
+            accessories,
+            config_entry,
+            coordinator,
+            "Rear Speakers",
+            "rears",
         )
 
 
 class BoseStandbySettingSwitch(BoseBaseEntity, SwitchEntity):
     """Switch to turn on/off standby setting."""
 
+    _consumed_resources = ("/system/power/timeouts",)
+
     def __init__(
         self,
         speaker: BoseSpeaker,
         speaker_info: SystemInfo,
         config_entry,
         hass: HomeAssistant,
+        coordinator: BoseCoordinator,
     ) -> None:
         """Initialize the switch."""
         BoseBaseEntity.__init__(self, speaker)
         self.speaker = speaker
+        self.coordinator = coordinator
         self._attr_is_on = None
         self.speaker_info = speaker_info
         self.config_entry = config_entry
@@ -157,8 +193,11 @@ class BoseStandbySettingSwitch(BoseBaseEntity, SwitchEntity):
 
         self._attr_entity_category = EntityCategory.CONFIG
 
-        self.speaker.attach_receiver(self._parse_message)
-        hass.async_create_task(self.async_update())
+    async def async_added_to_hass(self) -> None:
+        """Attach the receiver and fetch the state once the entity is added."""
+        await super().async_added_to_hass()
+        self._attach_receiver(self._parse_message)
+        self.async_schedule_update_ha_state(force_refresh=True)
 
     def _parse_message(self, data):
         """Parse the message from the speaker."""
@@ -179,7 +218,6 @@ class BoseStandbySettingSwitch(BoseBaseEntity, SwitchEntity):
 
     async def async_update(self) -> None:
         """Update the switch state."""
-        self._attr_is_on = (await self.speaker.get_system_timeout()).get(
-            "noAudio", False
-        )
+        timeouts = await self.coordinator.async_get("/system/power/timeouts")
+        self._attr_is_on = timeouts.get("noAudio", False)
         self.async_write_ha_state()
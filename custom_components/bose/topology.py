@@ -0,0 +1,205 @@
+"""Index of the active groups of all Bose speakers.
+
+Every member of a group is notified of the group's changes, so one change
+arrives once per member. The index is shared by all media players: the
+first notification updates it and tells the media players of the affected
+speakers, identical ones from the other members are dropped. It maps
+groups to their master and members, speakers to their group, and speaker
+GUIDs to media player entity IDs and back, so grouping actions resolve
+speakers without entity registry lookups.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import BoseCoordinator
+
+
+@dataclass(frozen=True, slots=True)
+class ActiveGroup:
+    """An active group of speakers."""
+
+    group_id: str
+    master: str
+    # GUIDs of the members, master first
+    members: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class _Player:
+    """A media player taking part in the index."""
+
+    entity_id: str
+    # The coordinator follows reconnects to the speaker
+    coordinator: BoseCoordinator
+    update_callback: CALLBACK_TYPE
+
+
+@callback
+def async_get_topology(hass: HomeAssistant) -> GroupTopology:
+    """Return the group index shared by all config entries."""
+    topology: GroupTopology | None = hass.data.setdefault(DOMAIN, {}).get("topology")
+    if topology is None:
+        topology = hass.data[DOMAIN]["topology"] = GroupTopology()
+    return topology
+
+
+def _parse_group(active_groups: list[dict[str, Any]]) -> ActiveGroup | None:
+    """Return the first group of an activeGroups body, None if there is none."""
+    if not active_groups:
+        return None
+    group = active_groups[0]
+    # A speaker may be listed more than once
+    guids = list(
+        dict.fromkeys(
+            guid
+            for product in group.get("products") or []
+            if (guid := product.get("productId")) is not None
+        )
+    )
+    if not guids:
+        return None
+    master = group.get("groupMasterId")
+    guids.sort(key=lambda guid: guid == master, reverse=True)
+    return ActiveGroup(
+        group_id=group.get("activeGroupId", ""),
+        master=guids[0],
+        members=tuple(guids),
+    )
+
+
+class GroupTopology:
+    """Active groups and media players of all speakers."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.groups: dict[str, ActiveGroup] = {}
+        # GUID of a speaker to the ID of its group
+        self.group_of: dict[str, str] = {}
+        self._players: dict[str, _Player] = {}
+        self._guids: dict[str, str] = {}
+
+    @callback
+    def async_add_player(
+        self,
+        guid: str,
+        entity_id: str,
+        coordinator: BoseCoordinator,
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Add the media player of a speaker; returns a callback removing it."""
+        player = _Player(entity_id, coordinator, update_callback)
+        self._players[guid] = player
+        self._guids[entity_id] = guid
+        # Members of known groups show the new entity ID
+        self._async_notify(self._affected(guid))
+
+        @callback
+        def _remove() -> None:
+            if self._players.get(guid) is player:
+                del self._players[guid]
+                self._guids.pop(entity_id, None)
+                self._async_notify(self._affected(guid))
+
+        return _remove
+
+    @callback
+    def async_update(self, guid: str, active_groups: list[dict[str, Any]]) -> None:
+        """Update the index with the activeGroups body a speaker reported."""
+        group = _parse_group(active_groups)
+        if group is None:
+            if guid not in self.group_of:
+                return
+            affected = {guid, *self._leave(guid)}
+        else:
+            if self.groups.get(group.group_id) == group:
+                # Another member reported the group already
+                return
+            affected = set(group.members)
+            if (stale := self.groups.get(group.group_id)) is not None:
+                affected.update(stale.members)
+                self._drop_group(stale)
+            for member in group.members:
+                if member in self.group_of:
+                    # The member switched groups
+                    affected.update(self._leave(member))
+            self.groups[group.group_id] = group
+            for member in group.members:
+                self.group_of[member] = group.group_id
+        self._async_notify(affected)
+
+    def _leave(self, guid: str) -> tuple[str, ...]:
+        """Take a speaker out of its group; returns the members it had."""
+        group = self.group(guid)
+        if group is None:
+            return ()
+        if group.master == guid:
+            # The group ends with its master
+            self._drop_group(group)
+        else:
+            del self.group_of[guid]
+            self.groups[group.group_id] = ActiveGroup(
+                group.group_id,
+                group.master,
+                tuple(member for member in group.members if member != guid),
+            )
+        return group.members
+
+    def _drop_group(self, group: ActiveGroup) -> None:
+        """Forget a group and the membership of its members."""
+        self.groups.pop(group.group_id, None)
+        for member in group.members:
+            if self.group_of.get(member) == group.group_id:
+                del self.group_of[member]
+
+    def _affected(self, guid: str) -> Iterable[str]:
+        """Return the speakers whose members change with a speaker's player."""
+        if (group := self.group(guid)) is not None:
+            return group.members
+        return (guid,)
+
+    @callback
+    def _async_notify(self, guids: Iterable[str]) -> None:
+        """Tell the media players of speakers that their group changed."""
+        for guid in guids:
+            if (player := self._players.get(guid)) is not None:
+                player.update_callback()
+
+    def group(self, guid: str) -> ActiveGroup | None:
+        """Return the group of a speaker."""
+        group_id = self.group_of.get(guid)
+        return self.groups.get(group_id) if group_id else None
+
+    def member_entity_ids(self, guid: str) -> list[str]:
+        """Return the media players of a speaker's group, master first."""
+        if (group := self.group(guid)) is None:
+            return []
+        return [
+            player.entity_id
+            for member in group.members
+            if (player := self._players.get(member)) is not None
+        ]
+
+    def guid(self, entity_id: str) -> str | None:
+        """Return the GUID of the speaker of a media player."""
+        return self._guids.get(entity_id)
+
+    def entity_id(self, guid: str) -> str | None:
+        """Return the media player of a speaker."""
+        player = self._players.get(guid)
+        return player.entity_id if player else None
+
+    def speaker(self, guid: str) -> BoseSpeaker | None:
+        """Return the connection of a speaker."""
+        player = self._players.get(guid)
+        return player.coordinator.speaker if player else None
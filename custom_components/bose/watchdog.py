@@ -0,0 +1,119 @@
+"""Watchdog for slow message receivers.
+
+Receivers attached with ``speaker.attach_receiver`` run one after another in
+the receive loop of pybose, inside the event loop. A slow receiver delays
+every other message of the speaker and everything else Home Assistant does
+at that moment. When the watchdog is enabled, every receiver call is timed;
+calls above the threshold are counted per receiver and resource and logged.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+import functools
+import time
+from typing import Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+from .const import _LOGGER
+from .metrics import receiver_name
+
+Receiver = Callable[[dict[str, Any]], None]
+
+
+class ReceiverWatchdog:
+    """Time the receivers of a speaker and report the slow calls."""
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize the watchdog with a threshold in seconds."""
+        self.threshold = threshold
+        self.calls = 0
+        self.slow_calls: Counter[tuple[str, str]] = Counter()
+        self.max_time: dict[tuple[str, str], float] = {}
+        self._speaker: BoseSpeaker | None = None
+        self._originals: dict[int, Receiver] = {}
+        self._attach_receiver: Callable[[Receiver], int] | None = None
+
+    def attach(self, speaker: BoseSpeaker) -> None:
+        """Time the current and all later receivers of a speaker."""
+        self.detach()
+        self._speaker = speaker
+        receivers = speaker._receivers  # noqa: SLF001
+        for receiver_id, receiver in list(receivers.items()):
+            receivers[receiver_id] = self._wrap(receiver_id, receiver)
+
+        # Keep what was there before, the metrics guard receivers the same way
+        attach_receiver = self._attach_receiver = speaker.attach_receiver
+
+        def _attach_receiver(callback: Receiver) -> int:
+            receiver_id = attach_receiver(callback)
+            receivers[receiver_id] = self._wrap(receiver_id, receivers[receiver_id])
+            return receiver_id
+
+        speaker.attach_receiver = _attach_receiver  # type: ignore[method-assign]
+
+    def detach(self) -> None:
+        """Restore the receivers of the speaker."""
+        if (speaker := self._speaker) is None:
+            return
+        receivers = speaker._receivers  # noqa: SLF001
+        for receiver_id, receiver in self._originals.items():
+            if receiver_id in receivers:
+                receivers[receiver_id] = receiver
+        self._originals.clear()
+        speaker.attach_receiver = self._attach_receiver  # type: ignore[method-assign]
+        self._attach_receiver = None
+        self._speaker = None
+
+    def _wrap(self, receiver_id: int, receiver: Receiver) -> Receiver:
+        """Return a timed version of a receiver."""
+        self._originals[receiver_id] = receiver
+
+        @functools.wraps(receiver)
+        def _timed(message: dict[str, Any]) -> None:
+            start = time.perf_counter()
+            try:
+                receiver(message)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.calls += 1
+                if elapsed >= self.threshold:
+                    self._record_slow(receiver, message, elapsed)
+
+        return _timed
+
+    def _record_slow(
+        self, receiver: Receiver, message: dict[str, Any], elapsed: float
+    ) -> None:
+        """Count and log a receiver call above the threshold."""
+        resource = message.get("header", {}).get("resource") or "unknown"
+        key = (receiver_name(receiver), resource)
+        first = key not in self.slow_calls
+        self.slow_calls[key] += 1
+        self.max_time[key] = max(self.max_time.get(key, 0.0), elapsed)
+        # Only the first slow call of a receiver and resource is a warning
+        (_LOGGER.warning if first else _LOGGER.debug)(
+            "Receiver %s took %.1f ms to handle %s (threshold %.1f ms)",
+            key[0],
+            elapsed * 1000,
+            resource,
+            self.threshold * 1000,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the slow calls, most frequent first."""
+        return {
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "calls": self.calls,
+            "slow_calls": [
+                {
+                    "receiver": name,
+                    "resource": resource,
+                    "count": count,
+                    "max_ms": round(self.max_time[(name, resource)] * 1000, 1),
+                }
+                for (name, resource), count in self.slow_calls.most_common()
+            ],
+        }
@@ -0,0 +1,5 @@
+"""Benchmarks for the Bose integration against fake speakers.
+
+They need Home Assistant installed and run headless; see the module of each
+benchmark for its options.
+"""
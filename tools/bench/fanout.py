@@ -0,0 +1,220 @@
+"""Benchmark notification fan-out and state writes of the Bose integration.
+
+Every fake speaker pushes notifications at a fixed rate through the
+receivers of the full entity set (media player, selects, numbers, sensors,
+switches and buttons). The results JSON reports:
+
+* handling time per message, i.e. all receivers of a speaker in a row
+* state writes and actual state changes per message
+* event loop lag while the notifications are handled
+
+Instead of the synthetic storm, a journal recorded by the integration can be
+replayed by every speaker with ``--journal`` (and ``--speed``).
+
+Run from the repository root in an environment with Home Assistant::
+
+    python -m tools.bench.fanout --speakers 5 --rate 50 --duration 30 --output fanout.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import contextlib
+import json
+import logging
+import platform
+import time
+from typing import Any
+
+from homeassistant.const import __version__ as HA_VERSION
+
+from ..bose_fake import JournalEntry, journal_files, read_journal, replay
+from .harness import BoseTestBed, LoopLagMonitor, describe
+
+# Resources the entities listen to; cycled in this order during the storm
+DEFAULT_RESOURCES = [
+    "/audio/volume",
+    "/content/nowPlaying",
+    "/audio/bass",
+    "/audio/treble",
+    "/audio/center",
+    "/audio/mode",
+    "/system/power/control",
+    "/network/wifi/status",
+    "/accessories",
+    "/cec",
+    "/grouping/activeGroups",
+]
+
+
+class _TimedReceivers(dict[int, Callable[[Any], None]]):
+    """Receiver registry of a speaker that times each fan-out.
+
+    pybose calls every value of its receiver dict for each message; this
+    dict hands out a single callable that calls the real receivers in order.
+    """
+
+    def __init__(
+        self, receivers: dict[int, Callable[[Any], None]], samples: list[float]
+    ) -> None:
+        super().__init__(receivers)
+        self._samples = samples
+
+    def values(self) -> list[Callable[[Any], None]]:  # type: ignore[override]
+        return [self._dispatch]
+
+    def _dispatch(self, message: Any) -> None:
+        start = time.perf_counter()
+        try:
+            for receiver in dict.values(self):
+                receiver(message)
+        finally:
+            self._samples.append(time.perf_counter() - start)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speakers", type=int, default=5, help="number of speakers")
+    parser.add_argument(
+        "--rate", type=float, default=50, help="notifications per second per speaker"
+    )
+    parser.add_argument("--duration", type=float, default=30, help="seconds to push")
+    parser.add_argument(
+        "--resource",
+        action="append",
+        help="resource to notify (repeatable, default: all entity resources)",
+    )
+    parser.add_argument(
+        "--journal", help="replay this journal instead of the synthetic storm"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="replay speed factor for --journal"
+    )
+    parser.add_argument(
+        "--settle", type=float, default=1.0, help="seconds to wait after the storm"
+    )
+    parser.add_argument("--output", help="write the results JSON to this file")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+async def _measure(
+    bed: BoseTestBed,
+    rate: float,
+    duration: float,
+    resources: list[str],
+    settle: float,
+    journal: list[JournalEntry] | None,
+    speed: float,
+) -> dict[str, Any]:
+    """Set up all entries of a started test bed and push the notifications."""
+    await bed.async_add_entries()
+    await bed.async_wait_available()
+
+    samples: list[float] = []
+    for speaker in bed.speakers:
+        speaker._receivers = _TimedReceivers(speaker._receivers, samples)  # noqa: SLF001
+    entities = len(bed.entity_ids())
+
+    # Let setup tasks finish before counting
+    await asyncio.sleep(settle)
+    bed.state_writes.clear()
+    bed.state_changes = 0
+    lag = LoopLagMonitor()
+    lag.start()
+
+    if journal is not None:
+        sent = await asyncio.gather(
+            *(replay(fake, journal, speed) for fake in bed.fakes)
+        )
+    else:
+        sent = await asyncio.gather(
+            *(fake.storm(rate, duration, resources) for fake in bed.fakes)
+        )
+    await asyncio.sleep(settle)
+    lag_samples = await lag.stop()
+
+    handled = len(samples)
+    writes = sum(bed.state_writes.values())
+    return {
+        "benchmark": "fanout",
+        "home_assistant": HA_VERSION,
+        "python": platform.python_version(),
+        "speakers": len(bed.fakes),
+        "entities": entities,
+        "rate": rate,
+        "duration": duration,
+        "resources": resources,
+        "journal": {"messages": len(journal), "speed": speed} if journal else None,
+        "messages": {"sent": sum(sent), "handled": handled},
+        "handling_ms": describe(samples),
+        "state_writes": {
+            "total": writes,
+            "per_message": round(writes / handled, 3) if handled else None,
+            "by_domain": dict(sorted(bed.state_writes.items())),
+        },
+        "state_changes": {
+            "total": bed.state_changes,
+            "per_message": (
+                round(bed.state_changes / handled, 3) if handled else None
+            ),
+        },
+        "loop_lag_ms": describe(lag_samples),
+    }
+
+
+async def run(
+    speakers: int,
+    rate: float,
+    duration: float,
+    resources: list[str] | None = None,
+    settle: float = 1.0,
+    journal: str | None = None,
+    speed: float = 1.0,
+) -> dict[str, Any]:
+    """Run the fan-out benchmark and return its results."""
+    entries = read_journal(journal_files(journal)) if journal else None
+    bed = BoseTestBed(speakers)
+    try:
+        async with bed:
+            return await _measure(
+                bed,
+                rate,
+                duration,
+                resources or DEFAULT_RESOURCES,
+                settle,
+                entries,
+                speed,
+            )
+    finally:
+        bed.cleanup()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = _parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    results = asyncio.run(
+        run(
+            args.speakers,
+            args.rate,
+            args.duration,
+            args.resource,
+            args.settle,
+            args.journal,
+            args.speed,
+        )
+    )
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)  # noqa: T201
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
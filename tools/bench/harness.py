@@ -0,0 +1,340 @@
+"""Headless Home Assistant test bed for benchmarking the Bose integration.
+
+Fake speakers are served on ``127.0.0.x:8082``, the address pybose dials,
+with a self-signed certificate. A minimal Home Assistant (core integrations
+only) loads the integration from this repository and gets one config entry
+per fake speaker. Tokens are pre-seeded in the token store, so no Bose
+account or network access is needed. Extra loopback addresses are used for
+the speakers, which works out of the box on Linux.
+
+The config directory lives as long as the test bed, so Home Assistant can
+be restarted on it. A stopped Home Assistant cannot be started again in the
+same event loop; enter the test bed once per ``asyncio.run`` to restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+import datetime as dt
+import json
+import logging
+from pathlib import Path
+import ssl
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+import jwt
+
+from homeassistant import bootstrap, loader
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntries, ConfigEntryState
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant, StateMachine, callback
+from homeassistant.core_config import async_process_ha_core_config
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from ..bose_fake import FakeBoseSpeaker, close_speaker
+
+DOMAIN = "bose"
+# pybose always connects to this port
+SPEAKER_PORT = 8082
+BENCH_PERSON_ID = "bench-person"
+BENCH_MAIL = "bench@example.com"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def describe(values: Iterable[float]) -> dict[str, float | int]:
+    """Summarize samples (in seconds) as milliseconds."""
+    samples = sorted(value * 1000 for value in values)
+    if not samples:
+        return {"count": 0}
+
+    def percentile(fraction: float) -> float:
+        return round(samples[min(int(len(samples) * fraction), len(samples) - 1)], 4)
+
+    return {
+        "count": len(samples),
+        "mean": round(statistics.fmean(samples), 4),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": round(samples[-1], 4),
+    }
+
+
+def _server_ssl_context(directory: Path) -> ssl.SSLContext:
+    """Create a TLS server context with a fresh self-signed certificate."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "bose-fake")])
+    now = dt.datetime.now(dt.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - dt.timedelta(days=1))
+        .not_valid_after(now + dt.timedelta(days=30))
+        .sign(key, hashes.SHA256())
+    )
+    certfile = directory / "fake.crt"
+    keyfile = directory / "fake.key"
+    certfile.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    keyfile.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+def _bench_tokens() -> dict[str, str]:
+    """Return account tokens that stay valid for the whole benchmark."""
+    # pybose only decodes the expiry, the signature is never checked
+    access_token = jwt.encode(
+        {"sub": BENCH_PERSON_ID, "exp": int(time.time()) + 365 * 24 * 3600},
+        "bench",
+        algorithm="HS256",
+    )
+    return {
+        "access_token": access_token,
+        "refresh_token": "bench-refresh-token",
+        "azure_refresh_token": "bench-azure-refresh-token",
+    }
+
+
+class _CountingStateMachine(StateMachine):
+    """State machine that counts state writes per entity domain."""
+
+    __slots__ = ("writes",)
+
+    def __init__(self, *args: Any) -> None:
+        """Initialize the state machine."""
+        super().__init__(*args)
+        self.writes: Counter[str] = Counter()
+
+    @callback
+    def async_set_internal(self, entity_id: str, *args: Any, **kwargs: Any) -> None:
+        """Count the write and store the state."""
+        self.writes[entity_id.partition(".")[0]] += 1
+        super().async_set_internal(entity_id, *args, **kwargs)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a periodic sleeper."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self.samples.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> list[float]:
+        """Stop sampling and return the lag samples in seconds."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        return self.samples
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - due, 0))
+
+
+class BoseTestBed:
+    """A headless Home Assistant with the Bose integration and fake speakers."""
+
+    def __init__(self, speakers: int, latency: float = 0.0) -> None:
+        """Initialize the test bed for the given number of speakers."""
+        if not 1 <= speakers <= 250:
+            raise ValueError("Between 1 and 250 speakers are supported")
+        self.latency = latency
+        self._tempdir = tempfile.TemporaryDirectory(prefix="bose-bench-")
+        self.path = Path(self._tempdir.name)
+        self.config_dir = self.path / "config"
+        self._ssl_context = _server_ssl_context(self.path)
+        self.fakes = [
+            FakeBoseSpeaker(
+                guid=f"bench-{index:04d}-0000-0000-0000-000000000000",
+                name=f"Bench Speaker {index + 1}",
+                host=f"127.0.0.{index + 2}",
+                port=SPEAKER_PORT,
+                latency=latency,
+                ssl_context=self._ssl_context,
+            )
+            for index in range(speakers)
+        ]
+        self.hass: HomeAssistant | None = None
+        self.state_changes = 0
+        self._prepare_config_dir()
+
+    async def __aenter__(self) -> BoseTestBed:
+        """Start the fake speakers and Home Assistant."""
+        for fake in self.fakes:
+            await fake.start()
+        await self.async_start_hass()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop Home Assistant and the fake speakers."""
+        await self.async_stop_hass()
+        for fake in self.fakes:
+            await fake.stop()
+
+    def cleanup(self) -> None:
+        """Remove the config directory."""
+        self._tempdir.cleanup()
+
+    def _prepare_config_dir(self) -> None:
+        """Link the integration and seed the account tokens."""
+        custom_components = self.config_dir / "custom_components"
+        custom_components.mkdir(parents=True)
+        (custom_components / DOMAIN).symlink_to(
+            REPO_ROOT / "custom_components" / DOMAIN, target_is_directory=True
+        )
+        storage = self.config_dir / ".storage"
+        storage.mkdir()
+        key = f"{DOMAIN}.tokens.{BENCH_PERSON_ID}"
+        (storage / key).write_text(
+            json.dumps(
+                {"version": 1, "minor_version": 1, "key": key, "data": _bench_tokens()}
+            )
+        )
+
+    async def async_start_hass(self) -> HomeAssistant:
+        """Start a minimal Home Assistant on the test bed's config directory."""
+        hass = HomeAssistant(str(self.config_dir))
+        hass.states = _CountingStateMachine(hass.bus, hass.loop)
+        loader.async_setup(hass)
+        hass.config.skip_pip = True
+        hass.config_entries = ConfigEntries(hass, {})
+        await loader.async_get_custom_components(hass)
+        await bootstrap.async_load_base_functionality(hass)
+        for domain in bootstrap.CORE_INTEGRATIONS:
+            await async_setup_component(hass, domain, {})
+        await async_process_ha_core_config(hass, {})
+        await hass.async_start()
+
+        @callback
+        def _count_change(_event: Event) -> None:
+            self.state_changes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count_change)
+        self.hass = hass
+        return hass
+
+    async def async_stop_hass(self) -> None:
+        """Stop Home Assistant, keeping the config directory for a restart."""
+        if self.hass is not None:
+            # Stopping does not unload the entries; keep pybose from reconnecting
+            for speaker in self.speakers:
+                await close_speaker(speaker)
+            await self.hass.async_stop(force=True)
+            self.hass = None
+
+    async def async_add_entries(self) -> None:
+        """Create a config entry for every fake speaker through the import step."""
+        assert self.hass is not None
+        hass = self.hass
+        await asyncio.gather(
+            *(
+                hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_IMPORT},
+                    data={
+                        "mail": BENCH_MAIL,
+                        "bose_person_id": BENCH_PERSON_ID,
+                        "ip": fake.host,
+                        "guid": fake.guid,
+                        "serial": fake.state["/system/info"]["serialNumber"],
+                        "name": fake.state["/system/info"]["name"],
+                    },
+                )
+                for fake in self.fakes
+            )
+        )
+
+    async def async_setup_integration(self) -> None:
+        """Set up the integration with all stored entries, as on a restart."""
+        assert self.hass is not None
+        await async_setup_component(self.hass, DOMAIN, {})
+
+    @property
+    def speakers(self) -> list[Any]:
+        """Return the pybose speakers of all loaded entries."""
+        assert self.hass is not None
+        return [
+            data["speaker"]
+            for data in self.hass.data.get(DOMAIN, {}).values()
+            if isinstance(data, dict) and "speaker" in data
+        ]
+
+    @property
+    def state_writes(self) -> Counter[str]:
+        """Return the number of state writes per entity domain."""
+        assert self.hass is not None
+        assert isinstance(self.hass.states, _CountingStateMachine)
+        return self.hass.states.writes
+
+    def entity_ids(self) -> list[str]:
+        """Return the enabled entities of the integration."""
+        assert self.hass is not None
+        registry = er.async_get(self.hass)
+        return [
+            entry.entity_id
+            for entry in registry.entities.values()
+            if entry.platform == DOMAIN and entry.disabled_by is None
+        ]
+
+    def all_available(self) -> bool:
+        """Return True once every entry is loaded and all entities are available."""
+        assert self.hass is not None
+        entries = self.hass.config_entries.async_entries(DOMAIN)
+        if len(entries) < len(self.fakes):
+            return False
+        for entry in entries:
+            if entry.state in (
+                ConfigEntryState.SETUP_ERROR,
+                ConfigEntryState.SETUP_RETRY,
+                ConfigEntryState.MIGRATION_ERROR,
+            ):
+                raise RuntimeError(f"Setup of {entry.title} failed: {entry.state}")
+            if entry.state is not ConfigEntryState.LOADED:
+                return False
+        for entity_id in self.entity_ids():
+            state = self.hass.states.get(entity_id)
+            if state is None or state.state == STATE_UNAVAILABLE:
+                return False
+        return True
+
+    async def async_wait_available(self, timeout: float = 120) -> None:
+        """Wait until every entity of every entry is available."""
+        async with asyncio.timeout(timeout):
+            while not self.all_available():
+                await asyncio.sleep(0.01)
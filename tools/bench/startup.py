@@ -0,0 +1,233 @@
+"""Benchmark the start of Home Assistant with many Bose config entries.
+
+For every entry count, the entries are created once and Home Assistant is
+restarted on the same config directory. The restart is measured the way it
+happens in production: the integration sets up all stored entries at once
+against fake speakers that answer every request after ``--latency``
+seconds. The results JSON reports per entry count:
+
+* wall time until setup returned and until all entities are available
+* requests sent to each speaker, also by resource
+* executor jobs submitted (Zeroconf discovery, Chromecast, login/token
+  refresh, Home Assistant itself and others) together with the time they
+  spent in the executor
+
+Python modules are already imported when the restart is measured, so import
+time is not part of the numbers. Run from the repository root in an
+environment with Home Assistant::
+
+    python -m tools.bench.startup --entries 1 --entries 10 --entries 50 --latency 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+import contextlib
+import functools
+import json
+import logging
+import platform
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core import HomeAssistant
+
+from .harness import BoseTestBed
+
+DEFAULT_ENTRIES = [1, 10, 50]
+
+
+def _job_name(target: Callable[..., Any]) -> tuple[str, str]:
+    """Return the module and qualified name of an executor job target."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    module = getattr(target, "__module__", None) or ""
+    name = getattr(target, "__qualname__", None) or type(target).__qualname__
+    return module, name
+
+
+def _job_category(module: str, name: str) -> str:
+    """Group an executor job by what it is used for."""
+    if module.startswith(("pychromecast", "zeroconf")):
+        return "chromecast"
+    if module.startswith("pybose.BoseDiscovery") or "discover" in name.lower():
+        return "discovery"
+    if module.startswith(("pybose.BoseAuth", "requests")):
+        return "login"
+    if module.startswith("homeassistant"):
+        return "home_assistant"
+    return "other"
+
+
+class ExecutorJobCounter:
+    """Count the executor jobs of a Home Assistant instance and their run time."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Wrap the executor job helper of the instance."""
+        self.jobs: Counter[str] = Counter()
+        self.seconds: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._add_executor_job = hass.async_add_executor_job
+        hass.async_add_executor_job = self._async_add_executor_job  # type: ignore[method-assign]
+
+    def _async_add_executor_job(
+        self, target: Callable[..., Any], *args: Any
+    ) -> asyncio.Future[Any]:
+        module, name = _job_name(target)
+        key = f"{module}.{name}" if module else name
+        self.jobs[key] += 1
+
+        def _timed_target() -> Any:
+            start = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                with self._lock:
+                    self.seconds[key] += time.perf_counter() - start
+
+        return self._add_executor_job(_timed_target)
+
+    def summary(self) -> dict[str, Any]:
+        """Return the jobs by category and by target."""
+        categories: dict[str, dict[str, float]] = {}
+        for key, count in self.jobs.items():
+            module, _, name = key.rpartition(".")
+            category = categories.setdefault(
+                _job_category(module, name), {"jobs": 0, "seconds": 0.0}
+            )
+            category["jobs"] += count
+            category["seconds"] += self.seconds[key]
+        for category in categories.values():
+            category["seconds"] = round(category["seconds"], 4)
+        return {
+            "total": sum(self.jobs.values()),
+            "by_category": dict(sorted(categories.items())),
+            "by_target": dict(self.jobs.most_common()),
+        }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries",
+        type=int,
+        action="append",
+        help="number of config entries (repeatable, default: 1, 10 and 50)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="seconds added to each response"
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=5.0,
+        help="seconds to keep counting executor jobs after all entities are available",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=600, help="seconds to wait for the entities"
+    )
+    parser.add_argument("--output", help="write the results JSON to this file")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+async def _async_prepare(bed: BoseTestBed, timeout: float) -> None:
+    """Create the config entries and wait until they are set up once."""
+    async with bed:
+        await bed.async_add_entries()
+        await bed.async_wait_available(timeout)
+
+
+async def _async_measure_restart(
+    bed: BoseTestBed, settle: float, timeout: float
+) -> dict[str, Any]:
+    """Restart Home Assistant on the prepared config and measure the setup."""
+    for fake in bed.fakes:
+        fake.requests.clear()
+
+    async with bed:
+        assert bed.hass is not None
+        executor = ExecutorJobCounter(bed.hass)
+
+        start = time.perf_counter()
+        await bed.async_setup_integration()
+        setup_done = time.perf_counter() - start
+        await bed.async_wait_available(timeout)
+        available = time.perf_counter() - start
+        await asyncio.sleep(settle)
+
+        entries = len(bed.fakes)
+        per_speaker = [sum(fake.requests.values()) for fake in bed.fakes]
+        by_resource: Counter[str] = Counter()
+        for fake in bed.fakes:
+            for (method, resource), count in fake.requests.items():
+                by_resource[f"{method} {resource}"] += count
+        return {
+            "entries": entries,
+            "entities": len(bed.entity_ids()),
+            "setup_s": round(setup_done, 4),
+            "available_s": round(available, 4),
+            "requests_per_speaker": {
+                "mean": round(sum(per_speaker) / entries, 2),
+                "min": min(per_speaker),
+                "max": max(per_speaker),
+                "by_resource": {
+                    key: round(count / entries, 2)
+                    for key, count in by_resource.most_common()
+                },
+            },
+            "executor_jobs": executor.summary(),
+        }
+
+
+def run_once(
+    entries: int, latency: float, settle: float = 5.0, timeout: float = 600
+) -> dict[str, Any]:
+    """Measure one restart with the given number of config entries."""
+    bed = BoseTestBed(entries, latency=latency)
+    try:
+        # A stopped Home Assistant leaves its event loop unusable
+        asyncio.run(_async_prepare(bed, timeout))
+        return asyncio.run(_async_measure_restart(bed, settle, timeout))
+    finally:
+        bed.cleanup()
+
+
+def run(
+    entry_counts: list[int], latency: float, settle: float = 5.0, timeout: float = 600
+) -> dict[str, Any]:
+    """Run the startup benchmark for every entry count."""
+    return {
+        "benchmark": "startup",
+        "home_assistant": HA_VERSION,
+        "python": platform.python_version(),
+        "latency": latency,
+        "runs": [
+            run_once(entries, latency, settle, timeout) for entries in entry_counts
+        ],
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = _parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    results = run(
+        args.entries or DEFAULT_ENTRIES, args.latency, args.settle, args.timeout
+    )
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)  # noqa: T201
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
@@ -0,0 +1,29 @@
+"""Local fake Bose speakers for load and latency testing.
+
+Start a :class:`FakeBoseSpeaker`, then point a ``pybose`` ``BoseSpeaker`` at
+it with :func:`create_speaker`::
+
+    async with FakeBoseSpeaker(latency=0.02) as fake:
+        speaker = create_speaker(fake)
+        await speaker.connect()
+        await fake.storm(rate=200, duration=5)
+        await close_speaker(speaker)
+
+Journals recorded by the integration can be pushed from a fake speaker with
+:func:`replay`.
+"""
+
+from .client import FakeBoseAuth, close_speaker, create_speaker
+from .replay import JournalEntry, journal_files, read_journal, replay
+from .server import FakeBoseSpeaker
+
+__all__ = [
+    "FakeBoseAuth",
+    "FakeBoseSpeaker",
+    "JournalEntry",
+    "close_speaker",
+    "create_speaker",
+    "journal_files",
+    "read_journal",
+    "replay",
+]
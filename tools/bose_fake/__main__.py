@@ -0,0 +1,81 @@
+"""Run fake Bose speakers from the command line.
+
+Example: serve two speakers with 20 ms latency and push 100 notifications
+per second to each of them for a minute::
+
+    python -m tools.bose_fake --count 2 --latency 0.02 --storm-rate 100 --storm-duration 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import ssl
+
+from .server import FakeBoseSpeaker
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve fake Bose speakers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port", type=int, default=0, help="port of the first speaker (0 = random)"
+    )
+    parser.add_argument("--count", type=int, default=1, help="number of speakers")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to each response"
+    )
+    parser.add_argument("--certfile", help="serve TLS with this certificate")
+    parser.add_argument("--keyfile", help="private key for --certfile")
+    parser.add_argument(
+        "--storm-rate", type=float, default=0.0, help="notifications per second"
+    )
+    parser.add_argument("--storm-duration", type=float, default=10.0)
+    parser.add_argument(
+        "--storm-resource",
+        action="append",
+        help="resource to notify during the storm (repeatable)",
+    )
+    return parser.parse_args()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    ssl_context = None
+    if args.certfile:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+
+    speakers = [
+        FakeBoseSpeaker(
+            name=f"Fake Speaker {index + 1}",
+            host=args.host,
+            port=args.port + index if args.port else 0,
+            latency=args.latency,
+            ssl_context=ssl_context,
+        )
+        for index in range(args.count)
+    ]
+    async with contextlib.AsyncExitStack() as stack:
+        for speaker in speakers:
+            await stack.enter_async_context(speaker)
+            print(f"{speaker.guid} {speaker.url}")  # noqa: T201
+
+        if args.storm_rate:
+            resources = args.storm_resource or ["/audio/volume", "/content/nowPlaying"]
+            sent = await asyncio.gather(
+                *(
+                    speaker.storm(args.storm_rate, args.storm_duration, resources)
+                    for speaker in speakers
+                )
+            )
+            print(f"sent {sum(sent)} notifications")  # noqa: T201
+        else:
+            await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_main(_parse_args()))
@@ -0,0 +1,66 @@
+"""Client-side helpers to connect pybose to a fake speaker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pybose.BoseSpeaker import BoseSpeaker
+
+from .server import FakeBoseSpeaker
+
+
+class FakeBoseAuth:
+    """Stand-in for BoseAuth that hands out a static, never expiring token."""
+
+    def __init__(self, bose_person_id: str = "fake-person") -> None:
+        """Initialize the fake auth."""
+        self._token: dict[str, Any] = {
+            "access_token": "fake-access-token",
+            "refresh_token": "fake-refresh-token",
+            "bosePersonID": bose_person_id,
+        }
+
+    def getCachedToken(self) -> dict[str, Any]:  # noqa: N802
+        """Return the static token."""
+        return self._token
+
+    def getControlToken(self, *args: Any, **kwargs: Any) -> dict[str, Any]:  # noqa: N802
+        """Return the static token."""
+        return self._token
+
+    def get_token_validity_time(self, token: str | None = None) -> int:
+        """Return a validity far in the future."""
+        return 10**9
+
+    def get_azure_refresh_token(self) -> str:
+        """Return a static Azure refresh token."""
+        return "fake-azure-refresh-token"
+
+    def do_token_refresh(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Pretend to refresh the token."""
+        return self._token
+
+
+def create_speaker(fake: FakeBoseSpeaker, auth: Any = None) -> BoseSpeaker:
+    """Return a pybose BoseSpeaker that talks to the given fake speaker.
+
+    pybose always dials ``wss://<host>:8082`` with TLS, so the URL and TLS
+    context are pointed at the fake server instead.
+    """
+    speaker = BoseSpeaker(host=fake.host, bose_auth=auth or FakeBoseAuth())
+    speaker._url = fake.url  # noqa: SLF001
+    if fake.ssl_context is None:
+        speaker._ssl_context = None  # type: ignore[assignment]  # noqa: SLF001
+    return speaker
+
+
+async def close_speaker(speaker: BoseSpeaker) -> None:
+    """Disconnect a pybose BoseSpeaker without waiting for another message.
+
+    ``BoseSpeaker.disconnect`` waits for its receiver loop, which only wakes up
+    on the next incoming message; an idle fake speaker never sends one.
+    """
+    speaker._auto_reconnect = False  # noqa: SLF001
+    if speaker._websocket is not None:  # noqa: SLF001
+        await speaker._websocket.close()  # noqa: SLF001
+    await speaker.disconnect()
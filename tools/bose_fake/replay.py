@@ -0,0 +1,150 @@
+"""Replay a message journal recorded by the integration.
+
+With "Record all messages from the speaker" enabled in the debug settings,
+the integration writes ``<config>/bose_journal/<guid>.ndjson.gz`` (rotated
+files get ``.1``, ``.2``, ... before ``.ndjson.gz``). Each line is
+``{"t": <seconds since the epoch>, "message": {...}}``.
+
+The replay pushes the recorded notifications from a fake speaker at the
+original pace or faster. Pauses longer than ``--max-gap`` seconds, e.g.
+between two recordings, are shortened to it. Example: serve one fake
+speaker and replay a journal ten times as fast once a client connected::
+
+    python -m tools.bose_fake.replay bose_journal/<guid>.ndjson.gz --speed 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterable
+import contextlib
+from dataclasses import dataclass
+import glob
+import gzip
+import json
+import logging
+from pathlib import Path
+import re
+import ssl
+from typing import Any
+
+from .server import FakeBoseSpeaker
+
+# Longest pause between two replayed messages, before the speed factor
+MAX_GAP = 60.0  # seconds
+
+_ROTATED = re.compile(r"^(?P<guid>.+?)(?:\.(?P<index>\d+))?\.ndjson\.gz$")
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """One recorded message."""
+
+    t: float
+    resource: str
+    body: Any
+
+
+def journal_files(path: str | Path) -> list[Path]:
+    """Return a journal and its rotated files, oldest first."""
+    path = Path(path)
+    match = _ROTATED.match(path.name)
+    if match is None:
+        return [path]
+    guid = match.group("guid")
+    files: list[tuple[int, Path]] = []
+    for candidate in path.parent.glob(f"{glob.escape(guid)}*.ndjson.gz"):
+        if (other := _ROTATED.match(candidate.name)) and other.group("guid") == guid:
+            files.append((int(other.group("index") or 0), candidate))
+    return [file for _, file in sorted(files, reverse=True)]
+
+
+def read_journal(paths: Iterable[str | Path]) -> list[JournalEntry]:
+    """Read the notifications from journal files, in file order."""
+    entries: list[JournalEntry] = []
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                message = record.get("message") or {}
+                header = message.get("header", {})
+                # Older journals also hold the results of the getters
+                if header.get("msgtype") != "NOTIFY":
+                    continue
+                if resource := header.get("resource"):
+                    entries.append(
+                        JournalEntry(record["t"], resource, message.get("body", {}))
+                    )
+    return entries
+
+
+async def replay(
+    fake: FakeBoseSpeaker,
+    entries: list[JournalEntry],
+    speed: float = 1.0,
+    max_gap: float = MAX_GAP,
+) -> int:
+    """Push recorded messages from a fake speaker, ``speed`` times as fast.
+
+    The recorded bodies also become the state of the fake speaker, so reads
+    after a replayed notification see the same data. Pauses are cut to
+    max_gap; time going backwards, as in older journals or after the clock
+    was set back between two recordings, counts as no pause. Returns the number of messages pushed.
+    """
+    if not entries:
+        return 0
+    loop = asyncio.get_running_loop()
+    due = loop.time()
+    previous = entries[0].t
+    for entry in entries:
+        due += min(max(0.0, entry.t - previous), max_gap) / speed
+        previous = entry.t
+        if (delay := due - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        if isinstance(entry.body, dict):
+            fake.state[entry.resource] = entry.body
+        fake.notify(entry.resource, entry.body)
+    return len(entries)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay a Bose message journal")
+    parser.add_argument("journal", help="journal file; rotated files are included")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor")
+    parser.add_argument(
+        "--max-gap", type=float, default=MAX_GAP, help="longest pause in seconds"
+    )
+    parser.add_argument("--loop", action="store_true", help="replay endlessly")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 = random")
+    parser.add_argument("--certfile", help="serve TLS with this certificate")
+    parser.add_argument("--keyfile", help="private key for --certfile")
+    return parser.parse_args()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    entries = read_journal(journal_files(args.journal))
+    print(f"{len(entries)} messages in journal")  # noqa: T201
+    ssl_context = None
+    if args.certfile:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+    async with FakeBoseSpeaker(
+        host=args.host, port=args.port, ssl_context=ssl_context
+    ) as fake:
+        print(f"{fake.guid} {fake.url}")  # noqa: T201
+        while True:
+            await fake.wait_for_client()
+            sent = await replay(fake, entries, args.speed, args.max_gap)
+            print(f"replayed {sent} messages")  # noqa: T201
+            if not args.loop:
+                break
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_main(_parse_args()))
@@ -0,0 +1,391 @@
+"""Scriptable WebSocket stand-in for a Bose speaker.
+
+The server speaks the same JSON protocol as a real speaker: requests carry a
+``reqID`` and get a ``RESPONSE`` with the same ID, state changes are pushed
+as ``NOTIFY`` messages. Latency, errors and notification storms can be
+injected to measure the integration without hardware.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Iterable
+import copy
+import hashlib
+import itertools
+import json
+import logging
+import ssl
+from typing import Any
+import uuid
+
+import websockets
+
+from .state import capabilities_for, default_state
+
+_LOGGER = logging.getLogger(__name__)
+
+SUBPROTOCOL = "eco2"
+
+Handler = Callable[["FakeBoseSpeaker", str, dict[str, Any]], Any]
+
+
+class FakeBoseSpeaker:
+    """A local fake Bose speaker serving one WebSocket endpoint."""
+
+    def __init__(
+        self,
+        guid: str | None = None,
+        name: str = "Fake Soundbar",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        ssl_context: ssl.SSLContext | None = None,
+        resources: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize the fake speaker.
+
+        ``latency`` is added before every response. ``resources`` limits the
+        advertised capabilities; by default every known resource is offered.
+        """
+        self.guid = guid or str(uuid.uuid4())
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.ssl_context = ssl_context
+        self.state = default_state()
+        self.state["/system/info"]["name"] = name
+        self.state["/system/info"]["serialNumber"] = self.guid.replace("-", "")[:17]
+        # Unique MAC and accessory serial, or the device registry merges speakers
+        digest = hashlib.sha1(self.guid.encode()).digest()
+        network = self.state["/network/status"]
+        network["primaryIpAddress"] = host
+        network["interfaces"][0]["ipInfo"]["ipAddress"] = host
+        network["interfaces"][0]["macAddress"] = ":".join(
+            f"{byte:02x}" for byte in (0x02, *digest[:5])
+        )
+        self.state["/accessories"]["subs"][0]["serialnum"] = digest.hex()[:13].upper()
+        if resources is not None:
+            self.state = {k: v for k, v in self.state.items() if k in set(resources)}
+        self.state["/system/capabilities"] = capabilities_for(list(self.state))
+        self.subscribed: list[str] = []
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.notifications_sent = 0
+        self.errors: dict[tuple[str, str], int] = {}
+        self.handlers: dict[tuple[str, str], Handler] = dict(_DEFAULT_HANDLERS)
+        self._connections: set[Any] = set()
+        self._connected = asyncio.Event()
+        self._server: Any = None
+
+    @property
+    def url(self) -> str:
+        """Return the WebSocket URL of the fake speaker."""
+        scheme = "wss" if self.ssl_context else "ws"
+        return f"{scheme}://{self.host}:{self.port}/"
+
+    async def start(self) -> None:
+        """Start serving."""
+        self._server = await websockets.serve(
+            self._handle_connection,
+            self.host,
+            self.port,
+            subprotocols=[SUBPROTOCOL],  # type: ignore[list-item]
+            ssl=self.ssl_context,
+        )
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+        _LOGGER.info("Fake speaker %s listening on %s", self.guid, self.url)
+
+    async def stop(self) -> None:
+        """Close all connections and stop serving."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> FakeBoseSpeaker:
+        """Start the server when used as context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server when leaving the context."""
+        await self.stop()
+
+    async def wait_for_client(self) -> None:
+        """Wait until a client is connected."""
+        await self._connected.wait()
+
+    async def drop_connections(self) -> None:
+        """Close every client connection, e.g. to exercise reconnects."""
+        for connection in list(self._connections):
+            await connection.close()
+
+    def freeze(self) -> None:
+        """Stop reading from every client, like a speaker gone without a close.
+
+        The sockets stay open, so clients only notice when a request, or a
+        WebSocket ping, is not answered.
+        """
+        for connection in self._connections:
+            connection.transport.pause_reading()
+
+    def fail(self, method: str, resource: str, status: int = 500) -> None:
+        """Answer requests for a resource with an error status."""
+        self.errors[(method, resource)] = status
+
+    def set_state(self, resource: str, body: dict[str, Any], notify: bool = True) -> None:
+        """Replace the state of a resource and optionally notify clients."""
+        self.state[resource] = body
+        if notify:
+            self.notify(resource)
+
+    def notify(self, resource: str, body: dict[str, Any] | None = None) -> None:
+        """Push a notification for a resource to every client.
+
+        Like the speaker, only subscribed resources are pushed once a client
+        sent a subscription.
+        """
+        if self.subscribed and resource not in self.subscribed:
+            return
+        if body is None:
+            body = self.state.get(resource, {})
+        message = json.dumps(
+            {
+                "header": {
+                    "device": self.guid,
+                    "resource": resource,
+                    "method": "NOTIFY",
+                    "msgtype": "NOTIFY",
+                    "reqID": 0,
+                    "status": 200,
+                    "version": 1,
+                },
+                "body": body,
+            }
+        )
+        for connection in list(self._connections):
+            websockets.broadcast([connection], message)
+        self.notifications_sent += 1
+
+    async def storm(
+        self,
+        rate: float,
+        duration: float,
+        resources: Iterable[str] = ("/audio/volume", "/content/nowPlaying"),
+    ) -> int:
+        """Push notifications at ``rate`` per second for ``duration`` seconds.
+
+        Resources are cycled in order and their state is changed slightly
+        before every push so consumers see real updates. Returns the number
+        of notifications sent.
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1 / rate
+        start = loop.time()
+        sent = 0
+        for resource in itertools.cycle(list(resources)):
+            due = start + sent * interval
+            if due - start >= duration:
+                break
+            if (delay := due - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            _mutate(self.state, resource, sent)
+            self.notify(resource)
+            sent += 1
+        return sent
+
+    async def _handle_connection(self, connection: Any) -> None:
+        """Serve one client connection."""
+        self._connections.add(connection)
+        self._connected.set()
+        try:
+            # Real speakers greet first; pybose learns the device ID from it
+            self.notify("/system/power/control")
+            async for raw in connection:
+                message = json.loads(raw)
+                asyncio.create_task(self._handle_request(connection, message))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._connections.discard(connection)
+            if not self._connections:
+                self._connected.clear()
+
+    async def _handle_request(self, connection: Any, message: dict[str, Any]) -> None:
+        """Answer one request."""
+        header = message.get("header", {})
+        method = header.get("method", "GET")
+        resource = header.get("resource", "")
+        body = message.get("body") or {}
+        self.requests[(method, resource)] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        status = self.errors.get((method, resource), 200)
+        response_body: Any = {}
+        if status == 200:
+            handler = self.handlers.get((method, resource))
+            if handler is not None:
+                response_body = handler(self, resource, body)
+            elif method == "GET" and resource in self.state:
+                response_body = copy.deepcopy(self.state[resource])
+            elif method in ("PUT", "POST") and resource in self.state:
+                self.state[resource].update(body)
+                response_body = copy.deepcopy(self.state[resource])
+                self.notify(resource)
+            else:
+                status = 404
+
+        reply: dict[str, Any] = {
+            "header": {
+                **header,
+                "device": self.guid,
+                "msgtype": "RESPONSE",
+                "status": status,
+            },
+            "body": response_body if status == 200 else {},
+        }
+        if status != 200:
+            reply["error"] = {"code": status, "message": f"{method} {resource}"}
+        try:
+            await connection.send(json.dumps(reply))
+        except websockets.ConnectionClosed:
+            pass
+
+
+def _mutate(state: dict[str, Any], resource: str, step: int) -> None:
+    """Change a resource slightly so that a notification carries news."""
+    body = state.setdefault(resource, {})
+    if resource == "/content/nowPlaying":
+        body.setdefault("state", {})["timeIntoTrack"] = step
+    elif resource == "/network/wifi/status":
+        body["signalDbm"] = -50 - step % 20
+    elif resource == "/system/battery":
+        body["percent"] = 100 - step % 100
+    elif "value" in body and isinstance(body["value"], int):
+        body["value"] = step % 100
+
+
+def _set_volume(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    volume = speaker.state[resource]
+    volume.update({k: v for k, v in body.items() if k in ("value", "muted")})
+    speaker.notify(resource)
+    return copy.deepcopy(volume)
+
+
+def _set_power(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    speaker.state[resource]["power"] = body.get("power", "ON")
+    speaker.notify(resource)
+    return {}
+
+
+def _transport(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    now_playing = speaker.state["/content/nowPlaying"]
+    state = now_playing.setdefault("state", {})
+    match body.get("state"):
+        case "PLAY":
+            state["status"] = "PLAY"
+        case "PAUSE":
+            state["status"] = "PAUSED"
+        case "SEEK":
+            state["timeIntoTrack"] = body.get("position", 0)
+        case "SKIPNEXT" | "SKIPPREVIOUS":
+            state["timeIntoTrack"] = 0
+    speaker.notify("/content/nowPlaying")
+    return copy.deepcopy(now_playing)
+
+
+def _playback_request(
+    speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]
+) -> Any:
+    now_playing = speaker.state["/content/nowPlaying"]
+    content_item = now_playing.setdefault("container", {}).setdefault("contentItem", {})
+    content_item["source"] = body.get("source", content_item.get("source"))
+    content_item["sourceAccount"] = body.get(
+        "sourceAccount", content_item.get("sourceAccount")
+    )
+    speaker.notify("/content/nowPlaying")
+    return copy.deepcopy(now_playing)
+
+
+def _subscribe(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    speaker.subscribed = [
+        notification["resource"] for notification in body.get("notifications", [])
+    ]
+    return {}
+
+
+def _set_group(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    products = body.get("products", [])
+    speaker.state[resource] = {
+        "activeGroups": [
+            {
+                "activeGroupId": str(uuid.uuid4()),
+                "groupMasterId": speaker.guid,
+                "name": "",
+                "productStates": [],
+                "products": products,
+            }
+        ]
+    }
+    speaker.notify(resource)
+    return True
+
+
+def _update_group(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    groups = speaker.state[resource]["activeGroups"]
+    if not groups:
+        return False
+    products = groups[0]["products"]
+    products.extend(body.get("addProducts", []))
+    removed = {product["productId"] for product in body.get("removeProducts", [])}
+    groups[0]["products"] = [p for p in products if p["productId"] not in removed]
+    speaker.notify(resource)
+    return True
+
+
+def _stop_group(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    speaker.state[resource] = {"activeGroups": []}
+    speaker.notify(resource)
+    return True
+
+
+def _bluetooth_action(
+    speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]
+) -> Any:
+    status = speaker.state["/bluetooth/sink/status"]
+    mac = body.get("mac", "")
+    if resource.endswith("/connect"):
+        status["activeDevice"] = mac
+    elif resource.endswith("/disconnect"):
+        status["activeDevice"] = ""
+    elif resource.endswith("/remove"):
+        sink_list = speaker.state["/bluetooth/sink/list"]
+        sink_list["devices"] = [d for d in sink_list["devices"] if d["mac"] != mac]
+        speaker.notify("/bluetooth/sink/list")
+    speaker.notify("/bluetooth/sink/status")
+    return {}
+
+
+def _ok(speaker: FakeBoseSpeaker, resource: str, body: dict[str, Any]) -> Any:
+    return {}
+
+
+_DEFAULT_HANDLERS: dict[tuple[str, str], Handler] = {
+    ("PUT", "/audio/volume"): _set_volume,
+    ("POST", "/system/power/control"): _set_power,
+    ("PUT", "/content/transportControl"): _transport,
+    ("POST", "/content/playbackRequest"): _playback_request,
+    ("PUT", "/subscription"): _subscribe,
+    ("POST", "/grouping/activeGroups"): _set_group,
+    ("PUT", "/grouping/activeGroups"): _update_group,
+    ("DELETE", "/grouping/activeGroups"): _stop_group,
+    ("POST", "/bluetooth/sink/connect"): _bluetooth_action,
+    ("POST", "/bluetooth/sink/disconnect"): _bluetooth_action,
+    ("POST", "/bluetooth/sink/remove"): _bluetooth_action,
+    ("POST", "/bluetooth/sink/pairable"): _ok,
+    ("PUT", "/cast/setup"): _ok,
+    ("PUT", "/cast/teardown"): _ok,
+}
@@ -0,0 +1,241 @@
+"""Default resource state of a fake Bose speaker.
+
+The bodies mirror what a Smart Soundbar returns for the resources the
+integration uses. Every fake speaker gets its own deep copy.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+# Endpoints only used as actions (no state of their own)
+ACTION_ENDPOINTS = [
+    "/bluetooth/sink/connect",
+    "/bluetooth/sink/disconnect",
+    "/bluetooth/sink/pairable",
+    "/bluetooth/sink/remove",
+    "/cast/setup",
+    "/cast/teardown",
+    "/content/playbackRequest",
+    "/content/transportControl",
+    "/subscription",
+]
+
+_DEFAULT_STATE: dict[str, Any] = {
+    "/system/info": {
+        "countryCode": "DE",
+        "defaultName": "Bose Smart Soundbar",
+        "limitedFeatures": False,
+        "name": "Fake Soundbar",
+        "productColor": 1,
+        "productId": 16489,
+        "productName": "Bose Smart Soundbar",
+        "productType": "stetson",
+        "regionCode": "GB",
+        "serialNumber": "FAKE0000000000000",
+        "softwareVersion": "1.0.0-fake",
+        "variantId": 1,
+    },
+    "/system/power/control": {"power": "ON"},
+    "/system/power/timeouts": {"noAudio": True, "noVideo": False},
+    "/system/productSettings": {
+        "language": "en",
+        "ntpSyncDone": True,
+        "presets": {
+            "presets": {
+                "1": {
+                    "actions": [
+                        {
+                            "actionType": "playbackRequest",
+                            "metadata": {
+                                "accountID": "fake",
+                                "image": "",
+                                "name": "Fake Radio",
+                                "subType": "",
+                            },
+                            "payload": {
+                                "contentItem": {
+                                    "containerArt": "",
+                                    "location": "/playback/station/fake",
+                                    "name": "Fake Radio",
+                                    "presetable": True,
+                                    "source": "TUNEIN",
+                                    "sourceAccount": "",
+                                    "type": "stationurl",
+                                }
+                            },
+                        }
+                    ]
+                }
+            }
+        },
+        "productName": "Fake Soundbar",
+        "properties": {"supportedLanguages": ["en"]},
+        "timeformat": "24",
+        "timezone": "Europe/Berlin",
+    },
+    "/system/sources": {
+        "properties": {},
+        "sources": [
+            {
+                "accountId": "",
+                "displayName": "TV",
+                "local": True,
+                "multiroom": True,
+                "sourceAccountName": "TV",
+                "sourceName": "PRODUCT",
+                "status": "AVAILABLE",
+                "visible": True,
+            },
+            {
+                "accountId": "",
+                "displayName": "Optical",
+                "local": True,
+                "multiroom": True,
+                "sourceAccountName": "AUX_DIGITAL",
+                "sourceName": "PRODUCT",
+                "status": "AVAILABLE",
+                "visible": True,
+            },
+        ],
+    },
+    "/system/battery": {
+        "chargeStatus": "DISCHARGING",
+        "chargerConnected": "DISCONNECTED",
+        "minutesToEmpty": 433,
+        "minutesToFull": 65535,
+        "percent": 80,
+        "sufficientChargerConnected": False,
+        "temperatureState": "NORMAL",
+    },
+    "/audio/volume": {
+        "defaultOn": 30,
+        "max": 100,
+        "min": 10,
+        "muted": False,
+        "properties": {
+            "maxLimit": 100,
+            "maxLimitOverride": False,
+            "minLimit": 0,
+            "startupVolume": 30,
+            "startupVolumeOverride": False,
+        },
+        "value": 30,
+    },
+    "/audio/bass": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/treble": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/center": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/subwooferGain": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/surround": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/height": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/avSync": {"persistence": True, "properties": {}, "value": 0},
+    "/audio/mode": {
+        "persistence": "SESSION",
+        "properties": {
+            "supportedPersistence": ["SESSION"],
+            "supportedValues": ["NORMAL", "DIALOG"],
+        },
+        "value": "NORMAL",
+    },
+    "/audio/dualMonoSelect": {
+        "value": "BOTH",
+        "properties": {"supportedValues": ["LEFT", "RIGHT", "BOTH"]},
+    },
+    "/audio/rebroadcastLatency/mode": {
+        "mode": "SYNC_TO_ROOM",
+        "properties": {"supportedModes": ["SYNC_TO_ROOM", "SYNC_TO_ZONE"]},
+    },
+    "/cec": {"mode": "ON", "properties": {"supportedModes": ["ON", "OFF"]}},
+    "/accessories": {
+        "controllable": {"rears": True, "subs": True},
+        "enabled": {"rears": True, "subs": True},
+        "pairing": False,
+        "rears": [],
+        "subs": [
+            {
+                "available": True,
+                "configurationStatus": "VALID",
+                "serialnum": "FAKESUB000000",
+                "type": "BASS_MODULE_700",
+                "version": "1.0.0",
+                "wireless": True,
+            }
+        ],
+    },
+    "/content/nowPlaying": {
+        "collectData": True,
+        "container": {
+            "contentItem": {
+                "isLocal": False,
+                "presetable": True,
+                "source": "SPOTIFY",
+                "sourceAccount": "fake",
+                "containerArt": "",
+            }
+        },
+        "source": {"sourceDisplayName": "Spotify", "sourceID": "SPOTIFY"},
+        "metadata": {
+            "album": "Fake Album",
+            "artist": "Fake Artist",
+            "duration": 240,
+            "trackName": "Fake Track",
+        },
+        "state": {
+            "canPause": True,
+            "canSeek": True,
+            "canSkipNext": True,
+            "canSkipPrevious": True,
+            "canStop": True,
+            "status": "PLAY",
+            "timeIntoTrack": 0,
+        },
+        "track": {"contentItem": {"containerArt": ""}},
+    },
+    "/grouping/activeGroups": {"activeGroups": []},
+    "/bluetooth/sink/list": {"devices": []},
+    "/bluetooth/sink/status": {"activeDevice": "", "devices": [], "status": ""},
+    "/bluetooth/source/status": {"devices": []},
+    "/network/status": {
+        "interfaces": [
+            {
+                "ipInfo": {"ipAddress": "127.0.0.1", "subnetMask": "255.0.0.0"},
+                "macAddress": "00:00:00:00:00:00",
+                "name": "wlan0",
+                "state": "UP",
+                "type": "WIRELESS",
+            }
+        ],
+        "isPrimaryUp": True,
+        "primary": "WIRELESS",
+        "primaryIpAddress": "127.0.0.1",
+    },
+    "/network/wifi/status": {
+        "frequencyKhz": 5180000,
+        "signalDbm": -55,
+        "signalDbmLevel": "GOOD",
+        "ssid": "FakeWifi",
+        "state": "WIFI_STATION_CONNECTED",
+    },
+}
+
+
+def default_state() -> dict[str, Any]:
+    """Return a fresh copy of the default resource state."""
+    return copy.deepcopy(_DEFAULT_STATE)
+
+
+def capabilities_for(resources: list[str]) -> dict[str, Any]:
+    """Return a /system/capabilities body listing the given endpoints."""
+    return {
+        "group": [
+            {
+                "apiGroup": "fake",
+                "endpoints": [
+                    {"endpoint": endpoint}
+                    for endpoint in sorted({*resources, *ACTION_ENDPOINTS})
+                ],
+                "version": 1,
+            }
+        ]
+    }